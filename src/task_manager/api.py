@@ -9,10 +9,14 @@ for persistent storage and atomic locking operations.
 import asyncio
 import json
 import logging
+import string
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Set
+from typing import Callable, Dict, List, Any, Optional, Set, Union
 from contextlib import asynccontextmanager
 
+import orjson
+
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -45,6 +49,38 @@ DB_PATH = os.getenv("DATABASE_PATH", "project_manager.db")
 # Alternative: connection pool if high concurrency needed
 db_instance: Optional[TaskDatabase] = None
 
+# Broadcasts to more clients than this are sent in slices of this size, yielding
+# to the event loop between slices so other requests are served mid-fanout
+BROADCAST_BATCH_SIZE = 50
+
+# Outbound messages buffered per client; once a slow client is this far behind,
+# its oldest pending message is dropped rather than stalling other broadcasts
+SEND_QUEUE_SIZE = 64
+
+# Log entries appended to a task within this window go out as one event
+LOG_COALESCE_SECONDS = 0.05
+
+# How long close() waits for clients to take pending messages
+SHUTDOWN_FLUSH_SECONDS = 1.0
+
+# [epoch second, formatted timestamp] for the most recent enriched event
+_TS_CACHE = [0, ""]
+
+
+def _iso_now() -> str:
+    """UTC timestamp at second resolution, reformatted only when the second changes."""
+    now = int(time.time())
+    cache = _TS_CACHE
+    if cache[0] != now:
+        cache[0] = now
+        cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    return cache[1]
+
+
+def _payload_bytes(payload: Dict[str, Any]) -> bytes:
+    """Serialize a WebSocket payload to the UTF-8 bytes that go on the wire."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
 
 class ConnectionManager:
     """
@@ -59,13 +95,40 @@ class ConnectionManager:
         # Active WebSocket connections registry
         self.active_connections: Set[WebSocket] = set()
         self.planning_connections: Set[WebSocket] = set()
+        # Optional features each client asked for at handshake (e.g. "auto_switch")
+        self.connection_capabilities: Dict[WebSocket, Set[str]] = {}
+        # Bounded outbound queue and writer task per connect()ed client
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self.events_dropped = 0
+        # task_id -> log entries (and latest initiator) awaiting the next log flush
+        self._log_coalesce: Dict[int, List[Dict[str, Any]]] = {}
+        self._log_sessions: Dict[int, str] = {}
+        self._log_flush_task: Optional[asyncio.Task] = None
         self._connection_lock = asyncio.Lock()
+        # Set whenever a broadcast() call finishes, i.e. once its message is queued
+        # for every client (or sent, for clients without a queue); callers clear it
+        # before the action they want to wait on instead of sleeping, then await
+        # flush() if they need queued messages delivered
+        self.broadcast_done = asyncio.Event()
     
-    async def connect(self, websocket: WebSocket):
-        """Accept new WebSocket connection and add to active connections."""
+    async def connect(self, websocket: WebSocket, capabilities: Optional[Set[str]] = None):
+        """
+        Accept new WebSocket connection and add to active connections.
+        
+        Args:
+            websocket: Connection to register
+            capabilities: Optional event features the client handles, as parsed by
+                parse_capabilities() from the handshake query string
+        """
         await websocket.accept()
         async with self._connection_lock:
             self.active_connections.add(websocket)
+            if capabilities:
+                self.connection_capabilities[websocket] = set(capabilities)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+            self._queues[websocket] = queue
+            self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
     
     async def disconnect(self, websocket: WebSocket):
@@ -73,6 +136,16 @@ class ConnectionManager:
         async with self._connection_lock:
             self.active_connections.discard(websocket)
             self.planning_connections.discard(websocket)
+            self.connection_capabilities.pop(websocket, None)
+            queue = self._queues.pop(websocket, None)
+            writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        if queue is not None:
+            # Release anything still pending so flush() never waits on a closed client
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
     async def connect_planning(self, websocket: WebSocket):
@@ -88,7 +161,7 @@ class ConnectionManager:
             self.planning_connections.discard(websocket)
         logger.info(f"Planning WebSocket disconnected. Total planning connections: {len(self.planning_connections)}")
     
-    async def broadcast(self, event_data: Dict[str, Any]):
+    async def broadcast(self, event_data: Union[Dict[str, Any], bytes]):
         """
         Broadcast event to all connected WebSocket clients in parallel.
         
@@ -96,33 +169,117 @@ class ConnectionManager:
         Automatically handles disconnected clients and removes them from registry.
         
         Args:
-            event_data: Event data to broadcast (will be JSON serialized)
+            event_data: Event data to broadcast (will be JSON serialized), or a
+                payload already serialized by _payload_bytes()
         """
         if not self.active_connections:
             logger.debug("No active connections for broadcast")
+            self.broadcast_done.set()
             return
         
         # #COMPLETION_DRIVE_IMPL: Using JSON serialization for standardized event format
         # WebSocket clients expect JSON format for event parsing
-        message = json.dumps(event_data)
-        
-        # Create coroutines for parallel broadcasting
-        send_tasks = []
+        if isinstance(event_data, bytes):
+            message = event_data.decode()
+        else:
+            message = orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS).decode()
         
         # #SUGGEST_ERROR_HANDLING: Consider adding per-connection error handling
         # Individual connection failures shouldn't stop broadcasting to other clients
         async with self._connection_lock:
-            for websocket in self.active_connections.copy():
-                send_tasks.append(self._send_safe(websocket, message))
+            connections = list(self.active_connections)
         
-        if send_tasks:
-            # Parallel broadcast using asyncio.gather for performance
-            # #COMPLETION_DRIVE_IMPL: Parallel broadcasting assumed more efficient than sequential
-            results = await asyncio.gather(*send_tasks, return_exceptions=True)
-            
-            # Count successful broadcasts for monitoring
-            successful_broadcasts = sum(1 for result in results if result is True)
-            logger.info(f"Broadcast completed: {successful_broadcasts}/{len(send_tasks)} successful")
+        await self._fan_out(connections, message)
+        self.broadcast_done.set()
+    
+    async def _fan_out(self, connections: List[WebSocket], message: str) -> None:
+        """
+        Deliver one serialized message to the given connections in batches.
+        
+        Clients registered through connect() get the message on their send queue;
+        any others are sent to directly.
+        """
+        if not connections:
+            return
+        
+        # Parallel broadcast using asyncio.gather for performance
+        # #COMPLETION_DRIVE_IMPL: Parallel broadcasting assumed more efficient than sequential
+        queued = 0
+        results = []
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            direct = []
+            for websocket in connections[start:start + BROADCAST_BATCH_SIZE]:
+                if self._enqueue(websocket, message):
+                    queued += 1
+                else:
+                    direct.append(websocket)
+            if direct:
+                results.extend(await asyncio.gather(
+                    *(self._send_safe(websocket, message) for websocket in direct),
+                    return_exceptions=True
+                ))
+        
+        # Count successful broadcasts for monitoring
+        successful_broadcasts = queued + sum(1 for result in results if result is True)
+        logger.info(f"Broadcast completed: {successful_broadcasts}/{len(connections)} successful")
+    
+    def _enqueue(self, websocket: WebSocket, message: str) -> bool:
+        """
+        Queue a message for a client's writer task, dropping its oldest pending
+        message if the queue is full.
+        
+        Returns:
+            False if the client has no send queue
+        """
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return False
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            self.events_dropped += 1
+        queue.put_nowait(message)
+        return True
+    
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Send a client's queued messages in order until the connection fails."""
+        while True:
+            message = await queue.get()
+            try:
+                sent = await self._send_safe(websocket, message)
+            finally:
+                queue.task_done()
+            if not sent:
+                return
+    
+    async def flush(self) -> None:
+        """Wait until every message queued so far has been handed to its client."""
+        await asyncio.gather(*(queue.join() for queue in list(self._queues.values())))
+    
+    async def close(self) -> None:
+        """
+        Send any coalesced log entries, then stop every client writer task.
+        
+        Messages a client has not taken within SHUTDOWN_FLUSH_SECONDS are discarded.
+        """
+        if self._log_flush_task is not None:
+            self._log_flush_task.cancel()
+            self._log_flush_task = None
+            try:
+                await self._broadcast_pending_logs()
+                await asyncio.wait_for(self.flush(), SHUTDOWN_FLUSH_SECONDS)
+            except Exception as e:
+                logger.warning(f"Failed to send pending log entries on shutdown: {e}")
+        
+        async with self._connection_lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+            self._queues.clear()
+        for writer in writers:
+            writer.cancel()
+        await asyncio.gather(*writers, return_exceptions=True)
     
     async def _send_safe(self, websocket: WebSocket, message: str) -> bool:
         """
@@ -158,7 +315,7 @@ class ConnectionManager:
             logger.debug("No active planning connections for broadcast")
             return
 
-        message = json.dumps(event_data)
+        message = orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS).decode()
 
         # Create coroutines for parallel broadcasting
         send_tasks = []
@@ -184,24 +341,129 @@ class ConnectionManager:
             event_type: Type of event (task.created, task.updated, task.logs.appended)
             event_data: Event-specific payload data
         """
+        if not self.active_connections:
+            logger.debug("No active connections for enriched broadcast")
+            self.broadcast_done.set()
+            return
+
         # #COMPLETION_DRIVE_IMPL: Enriched payload structure follows task specification exactly
         enriched_payload = {
             "type": event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat() + 'Z',
+            "timestamp": _iso_now(),
             "data": event_data
         }
 
         # #SUGGEST_PERFORMANCE: Consider adding event size validation to prevent oversized payloads
-        await self.broadcast(enriched_payload)
+        message = _payload_bytes(enriched_payload)
+
+        if "auto_switch_recommended" not in event_data:
+            await self.broadcast(message)
+            return
+
+        # Only clients that negotiated auto_switch receive the recommendation; each
+        # variant is serialized once and shared by every client it goes to
+        async with self._connection_lock:
+            subscribed, others = [], []
+            for websocket in self.active_connections:
+                caps = self.connection_capabilities.get(websocket, ())
+                (subscribed if "auto_switch" in caps else others).append(websocket)
+
+        if subscribed:
+            await self._fan_out(subscribed, message.decode())
+        if others:
+            slim_data = {key: value for key, value in event_data.items() if key != "auto_switch_recommended"}
+            slim_payload = dict(enriched_payload, data=slim_data)
+            await self._fan_out(others, _payload_bytes(slim_payload).decode())
+        self.broadcast_done.set()
+    
+    async def maybe_broadcast_enriched(self, event_type: str,
+                                       build_payload: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Broadcast an enriched event whose payload is only built if someone is listening.
+        
+        Args:
+            event_type: Type of event (task.created, task.updated, task.logs.appended)
+            build_payload: Zero-argument callable returning the event-specific payload
+        """
+        if not self.active_connections:
+            self.broadcast_done.set()
+            return
+        await self.broadcast_enriched_event(event_type, build_payload())
+    
+    def enqueue_logs(self, task_id: int, log_entries: List[Dict[str, Any]],
+                     session_id: Optional[str] = None) -> None:
+        """
+        Queue log entries for a coalesced task.logs.appended broadcast.
+        
+        Entries appended to the same task within LOG_COALESCE_SECONDS are merged
+        into a single event, so chatty tasks cost one broadcast per window.
+        
+        Args:
+            task_id: ID of task receiving new log entries
+            log_entries: New log entry dictionaries
+            session_id: Optional session ID; the latest one given for a task wins
+        """
+        if not self.active_connections:
+            return
+        self._log_coalesce.setdefault(task_id, []).extend(log_entries)
+        if session_id:
+            self._log_sessions[task_id] = session_id
+        if self._log_flush_task is None:
+            self._log_flush_task = asyncio.create_task(self._flush_logs())
+            self._log_flush_task.add_done_callback(self._log_flush_done)
+    
+    async def _flush_logs(self) -> None:
+        """Broadcast the pending log entries once the coalescing window ends."""
+        await asyncio.sleep(LOG_COALESCE_SECONDS)
+        self._log_flush_task = None
+        await self._broadcast_pending_logs()
+    
+    @staticmethod
+    def _log_flush_done(task: asyncio.Task) -> None:
+        """Log a failed log flush, which nothing else awaits."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to broadcast coalesced log entries: {task.exception()}")
+    
+    async def _broadcast_pending_logs(self) -> None:
+        """Broadcast one merged task.logs.appended event per task with pending entries."""
+        pending, sessions = self._log_coalesce, self._log_sessions
+        self._log_coalesce, self._log_sessions = {}, {}
+        for task_id, log_entries in pending.items():
+            payload = generate_logs_appended_payload(task_id, log_entries, sessions.get(task_id))
+            await self.broadcast_enriched_event("task.logs.appended", payload)
     
     def get_connection_count(self) -> int:
         """Get current number of active WebSocket connections."""
         return len(self.active_connections)
 
 
+def parse_capabilities(query_value: Optional[str]) -> Set[str]:
+    """
+    Parse the comma-separated ``caps`` WebSocket handshake query parameter.
+    
+    Args:
+        query_value: Raw parameter value, e.g. "auto_switch"
+        
+    Returns:
+        Set of capability names (empty when the parameter is absent)
+    """
+    if not query_value:
+        return set()
+    return {cap.strip() for cap in query_value.split(",") if cap.strip()}
+
+
 # #COMPLETION_DRIVE_IMPL: Session tracking utilities for client_session_id extraction
 # MCP tools can include client_session_id parameter for dashboard auto-switch functionality
-def extract_session_id(mcp_args: Dict[str, Any]) -> Optional[str]:
+# Characters allowed in a client session ID
+_VALID_SID = frozenset(string.ascii_letters + string.digits + "-_")
+
+
+def _is_valid_sid(session_id: Any) -> bool:
+    """Check a session ID is a non-empty string of letters, digits, '-' and '_'."""
+    return isinstance(session_id, str) and bool(session_id) and _VALID_SID.issuperset(session_id)
+
+
+def extract_session_id(mcp_args: Dict[str, Any], validate: bool = False) -> Optional[str]:
     """
     Extract client session ID from MCP tool arguments.
     
@@ -211,17 +473,42 @@ def extract_session_id(mcp_args: Dict[str, Any]) -> Optional[str]:
     
     Args:
         mcp_args: Dictionary of MCP tool arguments
+        validate: Return None for session IDs with characters outside
+            letters, digits, '-' and '_'
         
     Returns:
         Client session ID if present, None otherwise
     """
-    return mcp_args.get('client_session_id')
+    session_id = mcp_args.get('client_session_id')
+    if validate and not _is_valid_sid(session_id):
+        return None
+    return session_id
+
+
+# Placeholder context for uniform_shape payloads; null ids never match a real row
+_EMPTY_PROJECT = {"id": None, "name": ""}
+_EMPTY_EPIC = {"id": None, "name": "", "project_id": None}
+
+# Bit assigned to each auto-switch flag in a packed "flags_mask"
+_FLAG_BITS = {"project_created": 1, "epic_created": 2, "task_moved": 4, "session_changed": 8}
+
+
+def pack_flags(auto_flags: Dict[str, bool]) -> int:
+    """Pack set auto-switch flags into an int using _FLAG_BITS (unknown flags are ignored)."""
+    mask = 0
+    for name, value in auto_flags.items():
+        if value:
+            mask |= _FLAG_BITS.get(name, 0)
+    return mask
 
 
 def generate_enriched_task_payload(task_data: Dict[str, Any], project_data: Optional[Dict[str, Any]] = None,
                                  epic_data: Optional[Dict[str, Any]] = None, 
                                  auto_flags: Optional[Dict[str, bool]] = None,
-                                 session_id: Optional[str] = None) -> Dict[str, Any]:
+                                 session_id: Optional[str] = None,
+                                 auto_switch: bool = False,
+                                 compact_flags: bool = False,
+                                 uniform_shape: bool = False) -> Dict[str, Any]:
     """
     Generate enriched task event payload with project/epic context and auto-switch flags.
     
@@ -235,51 +522,93 @@ def generate_enriched_task_payload(task_data: Dict[str, Any], project_data: Opti
         epic_data: Epic context (id, name, project_id)
         auto_flags: Auto-switch flags (project_created, epic_created)
         session_id: Client session ID for event targeting
+        auto_switch: Recommend that the initiating dashboard switch to this task
+            (only applied when session_id is given)
+        compact_flags: Send auto_flags as an integer "flags_mask" (see
+            _FLAG_BITS) instead of the "flags" dictionary
+        uniform_shape: Always include "project" and "epic", using placeholders
+            with null ids when the context is missing
         
     Returns:
         Enriched payload dictionary ready for WebSocket broadcasting
     """
-    # #COMPLETION_DRIVE_IMPL: Task payload structure matches specification exactly
-    payload = {
-        "task": {
-            "id": task_data.get("id"),
-            "name": task_data.get("name"),
-            "status": task_data.get("status"),
-            "epic_id": task_data.get("epic_id"),
-            "ra_score": task_data.get("ra_score"),
-            "ra_mode": task_data.get("ra_mode"),
-            "description": task_data.get("description", "")
-        }
-    }
-    
-    # Add project context if available
-    if project_data:
-        payload["project"] = {
-            "id": project_data.get("id"),
-            "name": project_data.get("name")
-        }
-    
-    # Add epic context if available 
-    if epic_data:
-        payload["epic"] = {
-            "id": epic_data.get("id"),
-            "name": epic_data.get("name"),
-            "project_id": epic_data.get("project_id")
-        }
-    
-    # Add auto-switch flags if provided
-    if auto_flags:
-        payload["flags"] = auto_flags
-    
-    # Add session context for dashboard targeting
-    if session_id:
-        payload["initiator"] = session_id
+    if uniform_shape:
+        project_data = project_data or _EMPTY_PROJECT
+        epic_data = epic_data or _EMPTY_EPIC
+    mask = ((1 if project_data else 0) | (2 if epic_data else 0)
+            | (4 if auto_flags and not compact_flags else 0) | (8 if session_id else 0))
+    payload = _VARIANTS[mask](task_data, project_data, epic_data, auto_flags, session_id)
+    if compact_flags and auto_flags:
+        payload["flags_mask"] = pack_flags(auto_flags)
+    if auto_switch and session_id:
         # #COMPLETION_DRIVE_INTEGRATION: Auto-switch recommendation based on session presence
         payload["auto_switch_recommended"] = True
-    
     return payload
 
 
+# #COMPLETION_DRIVE_IMPL: Task payload structure matches specification exactly
+_TASK_KEYS = ("id", "name", "status", "epic_id", "ra_score", "ra_mode", "description")
+_TASK_DEFAULTS = {"description": ""}
+
+# Unrolled into the builders as one literal; a comprehension over _TASK_KEYS
+# measured roughly twice as slow
+_TASK_FIELDS = '"task": {%s},' % ", ".join(
+    "%r: t.get(%r, %r)" % (key, key, _TASK_DEFAULTS[key]) if key in _TASK_DEFAULTS
+    else "%r: t.get(%r)" % (key, key)
+    for key in _TASK_KEYS
+)
+
+# Optional payload sections, in mask-bit order (project, epic, flags, session)
+_OPTIONAL_FIELDS = (
+    '"project": {"id": p.get("id"), "name": p.get("name")},',
+    '"epic": {"id": e.get("id"), "name": e.get("name"), "project_id": e.get("project_id")},',
+    '"flags": f,',
+    '"initiator": s,',
+)
+
+
+def _build_payload_variant(mask: int):
+    """Compile a payload builder for one combination of present optional sections."""
+    fields = [_TASK_FIELDS]
+    fields.extend(f for bit, f in enumerate(_OPTIONAL_FIELDS) if mask & (1 << bit))
+    source = "def _variant(t, p, e, f, s):\n    return {%s}\n" % "\n        ".join(fields)
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["_variant"]
+
+
+# One straight-line builder per optional-section combination, indexed by the
+# mask computed in generate_enriched_task_payload
+_VARIANTS = tuple(_build_payload_variant(mask) for mask in range(1 << len(_OPTIONAL_FIELDS)))
+
+
+def generate_enriched_task_payloads_batch(tasks: List[Dict[str, Any]],
+                                         project_data: Optional[Dict[str, Any]] = None,
+                                         epic_data: Optional[Dict[str, Any]] = None,
+                                         auto_flags: Optional[Dict[str, bool]] = None,
+                                         session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Generate enriched payloads for a burst of tasks sharing the same context.
+    
+    The project, epic, flags and initiator sections are built once and the same
+    objects are shared by every payload, so treat them as read-only.
+    
+    Args:
+        tasks: Core task information for each task
+        project_data: Project context (id, name) common to all tasks
+        epic_data: Epic context (id, name, project_id) common to all tasks
+        auto_flags: Auto-switch flags (project_created, epic_created)
+        session_id: Client session ID for event targeting
+        
+    Returns:
+        One enriched payload per task, in input order
+    """
+    shared = generate_enriched_task_payload({}, project_data, epic_data, auto_flags, session_id)
+    del shared["task"]
+    build_task = _VARIANTS[0]
+    return [dict(build_task(task, None, None, None, None), **shared) for task in tasks]
+
+
 def generate_logs_appended_payload(task_id: int, log_entries: List[Dict[str, Any]], 
                                  session_id: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -305,10 +634,8 @@ def generate_logs_appended_payload(task_id: int, log_entries: List[Dict[str, Any
     
     # Add sequence numbers for client synchronization
     if log_entries:
-        payload["sequence_range"] = {
-            "start": min(entry.get("seq", 0) for entry in log_entries),
-            "end": max(entry.get("seq", 0) for entry in log_entries)
-        }
+        seqs = [entry.get("seq", 0) for entry in log_entries]
+        payload["sequence_range"] = {"start": min(seqs), "end": max(seqs)}
     
     # Add session context if provided
     if session_id:
@@ -456,6 +783,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping file watcher: {e}")
 
+    # Stop per-client WebSocket writer tasks before the loop shuts down
+    if hasattr(connection_manager, "close"):
+        try:
+            await connection_manager.close()
+        except Exception as e:
+            logger.error(f"Error closing WebSocket connections: {e}")
+
     if db_instance:
         db_instance.close()
         logger.info("Database connection closed")
@@ -10,17 +10,20 @@ Features performance optimization with caching, indexed database queries,
 and integration with RA tag normalization utilities.
 """
 
-import json
+import hashlib
+import sys
 import time
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Header, Query
+from fastapi.responses import JSONResponse, Response
 
 from .database import TaskDatabase
-from .ra_tag_utils import normalize_ra_tag, parse_ra_tag_list, get_category_stats
+from .ra_tag_utils import get_normalized_type, parse_ra_tag_list, get_category_stats
 from .models import (
     InsightsSummary,
     RecentValidationsResponse,
@@ -36,6 +39,7 @@ router = APIRouter(prefix="/api/assumptions", tags=["assumptions"])
 
 # Simple in-memory cache with 5-minute TTL as specified in requirements
 # #COMPLETION_DRIVE_IMPL: Using simple dict-based cache for MVP, Redis alternative available if scaling needed
+# Entries are invalidated as soon as the database reports a write (see _get_data_version)
 _cache: Dict[str, Dict[str, Any]] = {}
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
@@ -53,29 +57,61 @@ def _get_cache_key(endpoint: str, **params) -> str:
     return f"{endpoint}?{param_str}" if param_str else endpoint
 
 
-def _get_cached_response(cache_key: str) -> Optional[Dict[str, Any]]:
-    """Get cached response if still valid."""
+def _get_data_version(db: TaskDatabase) -> Tuple[int, int]:
+    """
+    Get a cheap database version for invalidating cached responses on writes.
+
+    PRAGMA data_version changes when another connection (e.g. an MCP server in
+    a separate process) commits, and total_changes covers writes made through
+    this connection.
+    """
+    with db._connection_lock:
+        data_version = db._connection.execute("PRAGMA data_version").fetchone()[0]
+        return data_version, db._connection.total_changes
+
+
+def _get_cached_response(cache_key: str, data_version: Tuple[int, int]) -> Optional[Any]:
+    """Get cached response model if still valid for the current data version."""
     if cache_key in _cache:
         cached = _cache[cache_key]
-        if time.time() - cached["timestamp"] < CACHE_TTL_SECONDS:
+        if (
+            cached["version"] == data_version
+            and time.time() - cached["timestamp"] < CACHE_TTL_SECONDS
+        ):
             return cached["data"]
         else:
-            # Remove expired cache entry
+            # Remove expired or outdated cache entry
             del _cache[cache_key]
     return None
 
 
-def _cache_response(cache_key: str, data: Dict[str, Any]) -> None:
-    """Cache response data with timestamp."""
-    _cache[cache_key] = {"data": data, "timestamp": time.time()}
+def _cache_response(cache_key: str, data: Any, data_version: Tuple[int, int]) -> None:
+    """
+    Cache a response model with timestamp and the data version it was built from.
+
+    Models are stored as built so cache hits return them directly instead of
+    re-validating a dumped dict on every request.
+    """
+    _cache[cache_key] = {"data": data, "timestamp": time.time(), "version": data_version}
 
 
 def _calculate_success_rate(outcome_counts: Dict[str, int]) -> float:
     """Calculate success rate with partial validations weighted at 0.5."""
-    validated = outcome_counts.get("validated", 0)
-    rejected = outcome_counts.get("rejected", 0)
-    partial = outcome_counts.get("partial", 0)
+    return _success_rate_for_counts(
+        outcome_counts.get("validated", 0),
+        outcome_counts.get("rejected", 0),
+        outcome_counts.get("partial", 0),
+    )
+
+
+@lru_cache(maxsize=2048)
+def _success_rate_for_counts(validated: int, rejected: int, partial: int) -> float:
+    """
+    Score an outcome-count triple; memoized because the result depends only on the counts.
 
+    Unlike the response cache, entries never go stale on database writes: new
+    validations produce a different triple rather than a different answer.
+    """
     total = validated + rejected + partial
     if total == 0:
         return 0.0
@@ -86,6 +122,51 @@ def _calculate_success_rate(outcome_counts: Dict[str, int]) -> float:
     return round(success_score / total, 3)
 
 
+def _index_ra_tags(ra_tags_json: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Parse a task's ra_tags JSON blob into a {tag_id: tag} lookup."""
+    index: Dict[str, Dict[str, Any]] = {}
+    if not ra_tags_json:
+        return index
+    try:
+        ra_tags = orjson.loads(ra_tags_json)
+    except orjson.JSONDecodeError:
+        return index
+    if not isinstance(ra_tags, list):
+        return index
+    for tag in ra_tags:
+        # Legacy tasks may still store plain tag strings without IDs
+        if isinstance(tag, dict):
+            # Tag types come from a small vocabulary repeated across every task
+            # blob and end up as breakdown keys; intern them so each type is
+            # one shared string rather than a fresh copy per parsed blob
+            tag_type = tag.get("type")
+            if isinstance(tag_type, str):
+                tag["type"] = sys.intern(tag_type)
+            index.setdefault(tag.get("id"), tag)
+    return index
+
+
+def _lookup_ra_tag(
+    tag_indexes: Dict[str, Dict[str, Dict[str, Any]]],
+    ra_tags_json: Optional[str],
+    ra_tag_id: str,
+) -> Tuple[str, str]:
+    """
+    Resolve the (type, text) of an RA tag from its task's ra_tags JSON.
+
+    Validation rows for the same task share one ra_tags blob, so each distinct
+    blob is parsed once per request and reused via ``tag_indexes`` instead of
+    re-parsing and scanning the JSON for every row.
+    """
+    index = tag_indexes.get(ra_tags_json)
+    if index is None:
+        index = tag_indexes[ra_tags_json] = _index_ra_tags(ra_tags_json)
+    tag = index.get(ra_tag_id)
+    if tag is None:
+        return "UNKNOWN", "Unknown tag"
+    return tag.get("type", "UNKNOWN"), tag.get("text", "Unknown tag")
+
+
 @router.get("/insights", response_model=InsightsSummary)
 async def get_assumption_insights(
     db: TaskDatabase = Depends(get_database),
@@ -117,9 +198,10 @@ async def get_assumption_insights(
             since=since,
             limit=limit,
         )
-        cached_response = _get_cached_response(cache_key)
-        if cached_response:
-            return InsightsSummary(**cached_response)
+        data_version = _get_data_version(db)
+        cached_response = _get_cached_response(cache_key, data_version)
+        if cached_response is not None:
+            return cached_response
 
         # Build query with performance-optimized indexes
         base_query = """
@@ -168,32 +250,19 @@ async def get_assumption_insights(
                 recent_examples=[],
                 cache_timestamp=datetime.now(timezone.utc).isoformat(),
             )
-            _cache_response(cache_key, empty_insights.model_dump())
+            _cache_response(cache_key, empty_insights, data_version)
             return empty_insights
 
         # Process results with RA tag normalization
-        outcome_counts = defaultdict(int)
-        tag_type_counts = defaultdict(int)
         all_validations = []
 
+        tag_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
         for row in rows:
-            # Extract RA tag details from task's ra_tags JSON
+            # Extract RA tag details from task's ra_tags JSON (row[11] = t.ra_tags)
             ra_tag_id = row[2]
-            ra_tags_json = row[11]  # t.ra_tags
-            extracted_ra_tag_type = "UNKNOWN"
-            ra_tag_text = "Unknown tag"
-            
-            if ra_tags_json:
-                try:
-                    ra_tags = json.loads(ra_tags_json)
-                    for tag in ra_tags:
-                        if tag.get('id') == ra_tag_id:
-                            extracted_ra_tag_type = tag.get('type', 'UNKNOWN')
-                            ra_tag_text = tag.get('text', 'Unknown tag')
-                            break
-                except (json.JSONDecodeError, TypeError):
-                    pass
-            
+            extracted_ra_tag_type, ra_tag_text = _lookup_ra_tag(tag_indexes, row[11], ra_tag_id)
+
             validation_data = {
                 "id": row[0],
                 "task_id": row[1],
@@ -209,29 +278,19 @@ async def get_assumption_insights(
             }
             all_validations.append(validation_data)
 
-            # Count outcomes
-            outcome_counts[row[3]] += 1
-
-            # Use the actual RA tag type instead of normalized for better display
-            tag_type_counts[extracted_ra_tag_type] += 1
+        # Use the actual RA tag type instead of normalized for better display
+        tag_type_counts = Counter(v["ra_tag"] for v in all_validations)
 
         # Filter by normalized tag type if specified
         if ra_tag_type:
-            filtered_validations = []
-            for validation in all_validations:
-                normalized_type, _ = normalize_ra_tag(validation["ra_tag"])
-                if normalized_type == ra_tag_type:
-                    filtered_validations.append(validation)
-
-            # Recalculate counts for filtered results
-            if filtered_validations:
-                outcome_counts = defaultdict(int)
-                for validation in filtered_validations:
-                    outcome_counts[validation["outcome"]] += 1
-                all_validations = filtered_validations
-            else:
-                all_validations = []
-                outcome_counts = defaultdict(int)
+            all_validations = [
+                validation
+                for validation in all_validations
+                if get_normalized_type(validation["ra_tag"]) == ra_tag_type
+            ]
+
+        # Count outcomes in a single pass over the (possibly filtered) results
+        outcome_counts = Counter(v["outcome"] for v in all_validations)
 
         # Calculate success rate with partial weighting
         success_rate = _calculate_success_rate(dict(outcome_counts))
@@ -264,7 +323,7 @@ async def get_assumption_insights(
         )
 
         # Cache the response for 5 minutes
-        _cache_response(cache_key, insights.model_dump())
+        _cache_response(cache_key, insights, data_version)
 
         return insights
 
@@ -321,6 +380,10 @@ async def get_recent_validations(
             conditions.append("av.epic_id = ?")
             params.append(epic_id)
 
+        # The total count ignores the pagination cursor
+        count_where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        count_params = list(params)
+
         if before_id is not None:
             conditions.append("av.id < ?")
             params.append(before_id)
@@ -346,26 +409,14 @@ async def get_recent_validations(
 
         # Process results with RA tag normalization
         validations = []
+        tag_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
         for row in rows:
-            # Extract RA tag details from task's ra_tags JSON
+            # Extract RA tag details from task's ra_tags JSON (row[10] = t.ra_tags)
             ra_tag_id = row[2]
-            ra_tags_json = row[10]  # t.ra_tags
-            extracted_ra_tag_type = "UNKNOWN"
-            ra_tag_text = "Unknown tag"
-            
-            if ra_tags_json:
-                try:
-                    ra_tags = json.loads(ra_tags_json)
-                    for tag in ra_tags:
-                        if tag.get('id') == ra_tag_id:
-                            extracted_ra_tag_type = tag.get('type', 'UNKNOWN')
-                            ra_tag_text = tag.get('text', 'Unknown tag')
-                            break
-                except (json.JSONDecodeError, TypeError):
-                    pass
+            extracted_ra_tag_type, _ = _lookup_ra_tag(tag_indexes, row[10], ra_tag_id)
 
             # Normalize RA tag using utilities from Task 14
-            normalized_type, _ = normalize_ra_tag(extracted_ra_tag_type)
+            normalized_type = get_normalized_type(extracted_ra_tag_type)
 
             validation = RecentValidation(
                 id=row[0],
@@ -385,20 +436,20 @@ async def get_recent_validations(
             )
             validations.append(validation)
 
-        # Calculate total count (approximate for pagination)
-        # #COMPLETION_DRIVE_IMPL: Using simple count for MVP, full count queries available if needed
-        total_query = """
-            SELECT COUNT(*) FROM assumption_validations av
-        """ + (
-            where_clause.replace("av.id < ?", "") if before_id else where_clause
-        )
-
-        count_params = [p for p in params if p != before_id] if before_id else params
+        if before_id is None and not has_more:
+            # A first page within the limit already holds every matching validation
+            total_count = len(validations)
+        else:
+            # Calculate total count (approximate for pagination)
+            # #COMPLETION_DRIVE_IMPL: Using simple count for MVP, full count queries available if needed
+            total_query = """
+                SELECT COUNT(*) FROM assumption_validations av
+            """ + count_where_clause
 
-        with db._connection_lock:
-            cursor = db._connection.cursor()
-            cursor.execute(total_query, count_params)
-            total_count = cursor.fetchone()[0]
+            with db._connection_lock:
+                cursor = db._connection.cursor()
+                cursor.execute(total_query, count_params)
+                total_count = cursor.fetchone()[0]
 
         # Determine next cursor
         next_cursor = validations[-1].id if validations and has_more else None
@@ -434,9 +485,10 @@ async def get_tag_types(
     try:
         # Check cache first
         cache_key = _get_cache_key("tag-types", project_id=project_id, epic_id=epic_id)
-        cached_response = _get_cached_response(cache_key)
-        if cached_response:
-            return TagTypesResponse(**cached_response)
+        data_version = _get_data_version(db)
+        cached_response = _get_cached_response(cache_key, data_version)
+        if cached_response is not None:
+            return cached_response
 
         # Query for distinct RA tags with counts
         query = """
@@ -473,24 +525,15 @@ async def get_tag_types(
             lambda: {"count": 0, "examples": [], "category": "", "subcategory": ""}
         )
 
+        tag_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
         for ra_tag_id, ra_tags_json, count in rows:
             # Extract RA tag details from task's ra_tags JSON
-            extracted_ra_tag_type = "UNKNOWN"
-            ra_tag_text = "Unknown tag"
-            
-            if ra_tags_json:
-                try:
-                    ra_tags = json.loads(ra_tags_json)
-                    for tag in ra_tags:
-                        if tag.get('id') == ra_tag_id:
-                            extracted_ra_tag_type = tag.get('type', 'UNKNOWN')
-                            ra_tag_text = tag.get('text', 'Unknown tag')
-                            break
-                except (json.JSONDecodeError, TypeError):
-                    pass
-            
+            extracted_ra_tag_type, ra_tag_text = _lookup_ra_tag(
+                tag_indexes, ra_tags_json, ra_tag_id
+            )
+
             # Normalize using RA utilities from Task 14
-            normalized_type, original_text = normalize_ra_tag(extracted_ra_tag_type)
+            normalized_type = get_normalized_type(extracted_ra_tag_type)
 
             # Accumulate data for this normalized type
             type_info = tag_type_data[normalized_type]
@@ -528,7 +571,7 @@ async def get_tag_types(
         )
 
         # Cache the response
-        _cache_response(cache_key, response.model_dump())
+        _cache_response(cache_key, response, data_version)
 
         return response
 
@@ -536,6 +579,117 @@ async def get_tag_types(
         raise HTTPException(status_code=500, detail=f"Failed to retrieve tag types: {str(e)}")
 
 
+def _make_etag(body: bytes) -> str:
+    """Build a strong ETag from an encoded response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if "*" in tags:
+        return True
+    return etag in {tag[2:] if tag.startswith("W/") else tag for tag in tags}
+
+
+def _build_tag_details_payload(
+    db: TaskDatabase,
+    tag_type: str,
+    project_id: Optional[int],
+    epic_id: Optional[int],
+    limit: int,
+) -> Dict[str, Any]:
+    """Query validations and assemble the tag-details payload for one RA tag type."""
+    # Build query to get all validations for this tag type
+    query = """
+        SELECT av.id, av.task_id, av.ra_tag_id, av.outcome, av.confidence,
+               av.validator_id, av.validated_at, av.notes, av.context_snapshot,
+               t.name as task_name, t.ra_tags,
+               p.name as project_name,
+               e.name as epic_name
+        FROM assumption_validations av
+        JOIN tasks t ON av.task_id = t.id
+        LEFT JOIN projects p ON av.project_id = p.id
+        LEFT JOIN epics e ON av.epic_id = e.id
+    """
+
+    conditions = []
+    params = []
+
+    # Filter by project_id if specified
+    if project_id is not None and project_id > 0:
+        conditions.append("av.project_id = ?")
+        params.append(project_id)
+
+    # Filter by epic_id if specified
+    if epic_id is not None and epic_id > 0:
+        conditions.append("av.epic_id = ?")
+        params.append(epic_id)
+
+    where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+    order_clause = " ORDER BY av.validated_at DESC"
+    limit_clause = f" LIMIT {limit}"
+
+    full_query = query + where_clause + order_clause + limit_clause
+
+    with db._connection_lock:
+        cursor = db._connection.cursor()
+        cursor.execute(full_query, params)
+        rows = cursor.fetchall()
+
+    # Filter and process results for the specific tag type
+    matching_validations = []
+    outcome_counts = Counter({"validated": 0, "rejected": 0, "partial": 0})
+
+    tag_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    for row in rows:
+        # Extract RA tag details from task's ra_tags JSON (row[10] = t.ra_tags)
+        ra_tag_id = row[2]
+        extracted_ra_tag_type, _ = _lookup_ra_tag(tag_indexes, row[10], ra_tag_id)
+
+        # Only include validations that match the requested tag type
+        if extracted_ra_tag_type == tag_type:
+            validation = {
+                "id": row[0],
+                "task_id": row[1],
+                "ra_tag_id": ra_tag_id,
+                "task_name": row[9],
+                "project_name": row[11],
+                "epic_name": row[12],
+                "ra_tag": extracted_ra_tag_type,
+                "outcome": row[3],
+                "confidence": row[4],
+                "validator_id": row[5],
+                "validated_at": row[6],
+                "notes": row[7],
+                "context_snapshot": row[8],
+            }
+            matching_validations.append(validation)
+
+    outcome_counts.update(v["outcome"] for v in matching_validations)
+
+    # Calculate success rate
+    total_validations = len(matching_validations)
+    success_rate = _calculate_success_rate(outcome_counts) if total_validations > 0 else 0.0
+
+    return {
+        "success": True,
+        "tag_type": tag_type,
+        "total_validations": total_validations,
+        "success_rate": success_rate,
+        "outcome_breakdown": dict(outcome_counts),
+        "validations": matching_validations,
+        # Add frontend-expected fields
+        "successful_count": outcome_counts.get("validated", 0),
+        "partial_count": outcome_counts.get("partial", 0), 
+        "rejected_count": outcome_counts.get("rejected", 0),
+        "recent_validations": matching_validations,
+    }
+
+
 @router.get("/tag-details")
 async def get_tag_details(
     tag_type: str = Query(..., description="The RA tag type to get details for"),
@@ -543,7 +697,8 @@ async def get_tag_details(
     project_id: Optional[int] = Query(None, description="Filter by project ID"),
     epic_id: Optional[int] = Query(None, description="Filter by epic ID"),
     limit: int = Query(20, ge=1, le=100, description="Number of validations to return"),
-) -> Dict[str, Any]:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """
     Get detailed validation information for a specific RA tag type.
     
@@ -551,102 +706,29 @@ async def get_tag_details(
     - All validations for the specified tag type
     - Success rate breakdown
     - Recent validation examples with full context
+
+    The payload is built from plain database values, so it is serialized
+    directly with orjson instead of going through FastAPI's response encoding.
+    Encoded bodies are cached alongside an ETag until the database changes;
+    a matching If-None-Match gets an empty 304 response.
     """
     try:
-        # Build query to get all validations for this tag type
-        query = """
-            SELECT av.id, av.task_id, av.ra_tag_id, av.outcome, av.confidence,
-                   av.validator_id, av.validated_at, av.notes, av.context_snapshot,
-                   t.name as task_name, t.ra_tags,
-                   p.name as project_name,
-                   e.name as epic_name
-            FROM assumption_validations av
-            JOIN tasks t ON av.task_id = t.id
-            LEFT JOIN projects p ON av.project_id = p.id
-            LEFT JOIN epics e ON av.epic_id = e.id
-        """
-
-        conditions = []
-        params = []
-
-        # Filter by project_id if specified
-        if project_id is not None and project_id > 0:
-            conditions.append("av.project_id = ?")
-            params.append(project_id)
-
-        # Filter by epic_id if specified
-        if epic_id is not None and epic_id > 0:
-            conditions.append("av.epic_id = ?")
-            params.append(epic_id)
-
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
-        order_clause = " ORDER BY av.validated_at DESC"
-        limit_clause = f" LIMIT {limit}"
-
-        full_query = query + where_clause + order_clause + limit_clause
-
-        with db._connection_lock:
-            cursor = db._connection.cursor()
-            cursor.execute(full_query, params)
-            rows = cursor.fetchall()
-
-        # Filter and process results for the specific tag type
-        matching_validations = []
-        outcome_counts = {"validated": 0, "rejected": 0, "partial": 0}
+        cache_key = _get_cache_key(
+            "tag-details", tag_type=tag_type, project_id=project_id, epic_id=epic_id, limit=limit
+        )
+        data_version = _get_data_version(db)
+        cached = _get_cached_response(cache_key, data_version)
+        if cached is None:
+            body = orjson.dumps(
+                _build_tag_details_payload(db, tag_type, project_id, epic_id, limit)
+            )
+            cached = (body, _make_etag(body))
+            _cache_response(cache_key, cached, data_version)
 
-        for row in rows:
-            # Extract RA tag details from task's ra_tags JSON
-            ra_tag_id = row[2]
-            ra_tags_json = row[10]  # t.ra_tags
-            extracted_ra_tag_type = "UNKNOWN"
-            
-            if ra_tags_json:
-                try:
-                    ra_tags = json.loads(ra_tags_json)
-                    for tag in ra_tags:
-                        if tag.get('id') == ra_tag_id:
-                            extracted_ra_tag_type = tag.get('type', 'UNKNOWN')
-                            break
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-            # Only include validations that match the requested tag type
-            if extracted_ra_tag_type == tag_type:
-                validation = {
-                    "id": row[0],
-                    "task_id": row[1],
-                    "ra_tag_id": ra_tag_id,
-                    "task_name": row[9],
-                    "project_name": row[11],
-                    "epic_name": row[12],
-                    "ra_tag": extracted_ra_tag_type,
-                    "outcome": row[3],
-                    "confidence": row[4],
-                    "validator_id": row[5],
-                    "validated_at": row[6],
-                    "notes": row[7],
-                    "context_snapshot": row[8],
-                }
-                matching_validations.append(validation)
-                outcome_counts[row[3]] = outcome_counts.get(row[3], 0) + 1
-
-        # Calculate success rate
-        total_validations = len(matching_validations)
-        success_rate = _calculate_success_rate(outcome_counts) if total_validations > 0 else 0.0
-
-        return {
-            "success": True,
-            "tag_type": tag_type,
-            "total_validations": total_validations,
-            "success_rate": success_rate,
-            "outcome_breakdown": outcome_counts,
-            "validations": matching_validations,
-            # Add frontend-expected fields
-            "successful_count": outcome_counts.get("validated", 0),
-            "partial_count": outcome_counts.get("partial", 0), 
-            "rejected_count": outcome_counts.get("rejected", 0),
-            "recent_validations": matching_validations,
-        }
+        body, etag = cached
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve tag details: {str(e)}")
@@ -15,7 +15,8 @@ Key Features:
 import os
 import re
 import logging
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -56,13 +57,16 @@ LANGUAGE_EXTENSIONS = {
     '.dockerfile': 'dockerfile'
 }
 
+# Python symbol patterns keyed by the leading keyword each one is anchored to
+_PYTHON_KEYWORD_PATTERNS = {
+    'def': r'^\s*def\s+(\w+)\s*\(',  # functions
+    'class': r'^\s*class\s+(\w+)\s*[\(:]',  # classes
+    'async': r'^\s*async\s+def\s+(\w+)\s*\(',  # async functions
+}
+
 # Symbol extraction patterns for common languages
 SYMBOL_PATTERNS = {
-    'python': [
-        r'^\s*def\s+(\w+)\s*\(',  # functions
-        r'^\s*class\s+(\w+)\s*[\(:]',  # classes
-        r'^\s*async\s+def\s+(\w+)\s*\('  # async functions
-    ],
+    'python': list(_PYTHON_KEYWORD_PATTERNS.values()),
     'javascript': [
         r'function\s+(\w+)\s*\(',  # function declarations
         r'const\s+(\w+)\s*=\s*\(',  # const functions
@@ -93,6 +97,57 @@ SYMBOL_PATTERNS = {
     ]
 }
 
+# Compiled once at import so symbol extraction never recompiles per line or call
+_COMPILED_SYMBOL_PATTERNS = {
+    language: tuple(re.compile(pattern) for pattern in patterns)
+    for language, patterns in SYMBOL_PATTERNS.items()
+}
+
+# Languages whose patterns are all anchored to a leading keyword: the first
+# token of a line selects the single pattern worth running, and lines starting
+# with anything else are skipped without touching the regex engine
+_LEADING_KEYWORD_PATTERNS = {
+    'python': {keyword: re.compile(pattern) for keyword, pattern in _PYTHON_KEYWORD_PATTERNS.items()},
+}
+
+
+def _make_symbol_matcher(language: str) -> Callable[[str], Optional[str]]:
+    """
+    Build a line matcher specialized for one language.
+
+    The pattern lookups are resolved here, once, so the per-line loop in
+    extract_symbol_context calls a closure over locals instead of branching
+    on the language's dispatch strategy for every line.
+    """
+    keyword_patterns = _LEADING_KEYWORD_PATTERNS.get(language)
+    if keyword_patterns is not None:
+        get_pattern = keyword_patterns.get
+
+        def match_keyword_line(line: str) -> Optional[str]:
+            tokens = line.split(None, 1)
+            pattern = get_pattern(tokens[0]) if tokens else None
+            match = pattern.search(line) if pattern else None
+            return match.group(1) if match else None
+
+        return match_keyword_line
+
+    # One regex pass instead of N searches: each alternative is a lazy ".*?"
+    # prefix plus one pattern, so alternatives are still tried in list order
+    # and the first pattern matching anywhere in the line wins, as before.
+    # Every pattern has exactly one group, so lastindex names the one that hit
+    match_union = re.compile('|'.join(
+        f'(?:.*?{pattern.pattern})' for pattern in _COMPILED_SYMBOL_PATTERNS[language]
+    )).match
+
+    def match_any_line(line: str) -> Optional[str]:
+        match = match_union(line)
+        return match.group(match.lastindex) if match else None
+
+    return match_any_line
+
+
+_SYMBOL_MATCHERS = {language: _make_symbol_matcher(language) for language in SYMBOL_PATTERNS}
+
 
 def detect_file_context(file_path: Optional[str] = None, line_number: Optional[int] = None) -> Dict[str, Any]:
     """
@@ -154,21 +209,35 @@ def detect_language(file_path: str) -> Optional[str]:
         return None
     
     try:
-        # Get file extension
-        path = Path(file_path)
-        extension = path.suffix.lower()
-        
-        # Check for special cases
-        if path.name.lower() == 'dockerfile':
-            return 'dockerfile'
-        
-        return LANGUAGE_EXTENSIONS.get(extension)
+        return _detect_language_cached(file_path)
     
     except Exception as e:
         logger.debug(f"Language detection failed for {file_path}: {e}")
         return None
 
 
+@lru_cache(maxsize=4096)
+def _detect_language_cached(file_path: str) -> Optional[str]:
+    """
+    Resolve the language for a file path.
+
+    Memoized because RA tags for one task usually point at the same few files,
+    and detect_file_context resolves the language twice per call.
+    """
+    # Plain string slicing instead of building a Path; the suffix follows
+    # Path.suffix rules (no leading-dot names, no trailing dot). The name is
+    # lowercased once and the extension sliced from it
+    name = os.path.basename(file_path.rstrip('/\\')).lower()
+    dot = name.rfind('.')
+    extension = name[dot:] if 0 < dot < len(name) - 1 else ''
+    
+    # Check for special cases
+    if name == 'dockerfile':
+        return 'dockerfile'
+    
+    return LANGUAGE_EXTENSIONS.get(extension)
+
+
 def extract_symbol_context(file_path: str, line_number: int) -> Optional[str]:
     """
     Extract function/method name from file at specific line using regex patterns.
@@ -185,11 +254,10 @@ def extract_symbol_context(file_path: str, line_number: int) -> Optional[str]:
     
     try:
         language = detect_language(file_path)
-        if not language or language not in SYMBOL_PATTERNS:
+        match_line = _SYMBOL_MATCHERS.get(language)
+        if match_line is None:
             return None
         
-        patterns = SYMBOL_PATTERNS[language]
-        
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             lines = f.readlines()
         
@@ -202,12 +270,9 @@ def extract_symbol_context(file_path: str, line_number: int) -> Optional[str]:
         
         # Reverse search to find the most recent symbol definition
         for i in range(len(search_lines) - 1, -1, -1):
-            line = search_lines[i]
-            
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    return match.group(1)
+            symbol = match_line(search_lines[i])
+            if symbol:
+                return symbol
     
     except Exception as e:
         logger.debug(f"Symbol extraction failed for {file_path}:{line_number}: {e}")
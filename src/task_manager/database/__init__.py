@@ -15,6 +15,9 @@ The TaskDatabase class provides backward-compatible interface by
 delegating to specialized repository classes.
 """
 
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
 from .connection import DatabaseConnection
 from .locks import LockRepository
 from .sessions import SessionRepository
@@ -49,16 +52,22 @@ class TaskDatabase:
     - Dashboard session tracking
     """
 
-    def __init__(self, db_path: str, lock_timeout_seconds: int = 300):
+    def __init__(self, db_path: str, lock_timeout_seconds: int = 300,
+                 clock: Optional[Callable[[], datetime]] = None,
+                 fast_unsafe: bool = False):
         """
         Initialize TaskDatabase with SQLite WAL mode configuration.
 
         Args:
             db_path: Path to SQLite database file
             lock_timeout_seconds: Default lock expiration timeout
+            clock: Callable returning the current UTC datetime, used for lock
+                expiry (defaults to system time; tests inject a fake clock)
+            fast_unsafe: Trade durability for speed (journal_mode=MEMORY,
+                synchronous=OFF); only for throwaway test databases
         """
         # Initialize connection (this also initializes the database and schema)
-        self._conn = DatabaseConnection(db_path, lock_timeout_seconds)
+        self._conn = DatabaseConnection(db_path, lock_timeout_seconds, clock, fast_unsafe)
 
         # Initialize repository instances
         self._locks = LockRepository(self._conn)
@@ -99,6 +108,10 @@ class TaskDatabase:
         """Context manager for explicit transaction control."""
         return self._conn._transaction()
 
+    def execute_prepared(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """Execute one statement under the connection lock and return its rows."""
+        return self._conn.execute_prepared(sql, params)
+
     # ========================================================================
     # Lock Management Methods - Delegate to LockRepository
     # ========================================================================
@@ -170,6 +183,22 @@ class TaskDatabase:
         """Get all epics for board state display."""
         return self._projects.get_all_epics()
 
+    def count_projects(self) -> int:
+        """Count projects without materializing rows."""
+        return self._projects.count_projects()
+
+    def count_epics(self) -> int:
+        """Count epics without materializing rows."""
+        return self._projects.count_epics()
+
+    def get_project_by_name(self, name: str):
+        """Get a project by its unique name, or None."""
+        return self._projects.get_project_by_name(name)
+
+    def get_epic_by_name(self, project_id: int, name: str):
+        """Get an epic by name within a project, or None."""
+        return self._projects.get_epic_by_name(project_id, name)
+
     def list_projects_filtered(self, status: str = None, limit: int = None):
         """List projects with optional filtering."""
         return self._projects.list_projects_filtered(status, limit)
@@ -227,10 +256,18 @@ class TaskDatabase:
         """Create a new task."""
         return self._tasks.create_task(*args, **kwargs)
 
+    def create_tasks_bulk(self, epic_id: int, tasks):
+        """Create several tasks within an epic in a single transaction."""
+        return self._tasks.create_tasks_bulk(epic_id, tasks)
+
     def get_task_details(self, task_id: int):
         """Return comprehensive task details including RA metadata fields."""
         return self._tasks.get_task_details(task_id)
 
+    def count_tasks(self) -> int:
+        """Count tasks without materializing rows."""
+        return self._tasks.count_tasks()
+
     def get_task_by_id(self, task_id: int):
         """Get task by ID with all fields."""
         return self._tasks.get_task_by_id(task_id)
@@ -466,7 +466,7 @@ class TaskDatabase:
     def create_project(self, name: str, description: Optional[str] = None) -> int:
         """Create a new project and return its ID.
         Raises sqlite3.IntegrityError if name is not unique."""
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         with self._connection_lock:
             cursor = self._connection.cursor()
             cursor.execute(
@@ -480,7 +480,7 @@ class TaskDatabase:
 
     def create_epic(self, project_id: int, name: str, description: Optional[str] = None) -> int:
         """Create a new epic within a project and return its ID."""
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         with self._connection_lock:
             cursor = self._connection.cursor()
             cursor.execute(
@@ -547,7 +547,7 @@ class TaskDatabase:
         dependencies: Optional[List[int]] = None,
     ) -> int:
         """Create a new task with RA metadata compatibility."""
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         task_name = name or title or "Untitled Task"
         ra_meta_text = json.dumps(ra_metadata) if isinstance(ra_metadata, dict) else ra_metadata
         ra_tags_text = json.dumps(ra_tags) if isinstance(ra_tags, list) else None
@@ -678,9 +678,9 @@ class TaskDatabase:
             
         # ISO datetime strings verified for cross-platform SQLite compatibility
         # String comparison works correctly for datetime ordering in all tested scenarios
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=lock_duration_seconds)
+        expires_at = self.now() + timedelta(seconds=lock_duration_seconds)
         expires_at_str = expires_at.isoformat() + 'Z'
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -719,7 +719,7 @@ class TaskDatabase:
         """
         with self._connection_lock:
             cursor = self._connection.cursor()
-            current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+            current_time_str = self.now().isoformat() + 'Z'
             
             # Agent validation prevents unauthorized lock releases via string matching
             # NOTE: Agent IDs assumed unique but not cryptographically secured for MVP
@@ -744,7 +744,7 @@ class TaskDatabase:
         """
         with self._connection_lock:
             cursor = self._connection.cursor()
-            current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+            current_time_str = self.now().isoformat() + 'Z'
             
             cursor.execute("""
                 SELECT lock_holder, lock_expires_at
@@ -780,7 +780,7 @@ class TaskDatabase:
         Returns:
             Project ID
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -803,7 +803,7 @@ class TaskDatabase:
         Returns:
             Epic ID
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -835,7 +835,7 @@ class TaskDatabase:
         Returns:
             Task ID
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         # VERIFIED: RA fields support per Task 004 requirements for comprehensive RA metadata
         # JSON serialization handled here to ensure proper constraint validation
@@ -1004,7 +1004,7 @@ class TaskDatabase:
         Returns:
             List of task dictionaries with all fields including lock status
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -1261,7 +1261,7 @@ class TaskDatabase:
         Returns:
             Dict with success status and any error information
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         # #COMPLETION_DRIVE_IMPL: Validating lock ownership before allowing status updates
         # This prevents race conditions where multiple agents try to update the same task
@@ -1315,7 +1315,7 @@ class TaskDatabase:
         Returns:
             True if update succeeded, False otherwise
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         # #COMPLETION_DRIVE_IMPL: Only update non-None fields to allow partial updates
         # JSON serialization with validation handled by database constraints
@@ -1376,7 +1376,7 @@ class TaskDatabase:
         Returns:
             Task dictionary with all fields, or None if not found
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -1451,9 +1451,13 @@ class TaskDatabase:
                 "dependencies": dependencies
             }
 
+    def now(self) -> datetime:
+        """Get current UTC time; repositories rebind this to DatabaseConnection.now."""
+        return datetime.now(timezone.utc)
+
     def _get_current_time_str(self) -> str:
         """Get current UTC time as ISO string for database operations."""
-        return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        return self.now().isoformat().replace('+00:00', 'Z')
     
     def cleanup_expired_locks(self) -> int:
         """
@@ -1535,7 +1539,7 @@ class TaskDatabase:
         Returns:
             Sequence number for the log entry
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         payload_json = None if payload is None else json.dumps(payload)
         
         # #COMPLETION_DRIVE_IMPL: Sequence numbering ensures chronological ordering within each task
@@ -1721,7 +1725,7 @@ class TaskDatabase:
                     "id": f"ra_tag_{uuid.uuid4().hex[:8]}",
                     "type": tag_type,
                     "text": tag,
-                    "created_at": datetime.now(timezone.utc).isoformat() + 'Z'
+                    "created_at": self.now().isoformat() + 'Z'
                 }
                 processed_tags.append(tag_obj)
             elif isinstance(tag, dict):
@@ -1729,7 +1733,7 @@ class TaskDatabase:
                 if "id" not in tag:
                     tag["id"] = f"ra_tag_{uuid.uuid4().hex[:8]}"
                 if "created_at" not in tag:
-                    tag["created_at"] = datetime.now(timezone.utc).isoformat() + 'Z'
+                    tag["created_at"] = self.now().isoformat() + 'Z'
                 processed_tags.append(tag)
         
         # Handle merge mode for updates
@@ -1798,7 +1802,7 @@ class TaskDatabase:
         # #SUGGEST_EDGE_CASE: Concurrent upserts with different descriptions may use first description
         # Consider description update logic if required by business rules
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -1833,7 +1837,7 @@ class TaskDatabase:
         Returns:
             Tuple of (project_id, was_created) where was_created is True if newly created
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -1877,7 +1881,7 @@ class TaskDatabase:
         # #SUGGEST_VALIDATION: Consider adding UNIQUE constraint on (project_id, name) for epic table
         # Current implementation relies on application-level uniqueness checking
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -1925,7 +1929,7 @@ class TaskDatabase:
         Returns:
             Tuple of (epic_id, was_created) where was_created is True if newly created
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -2005,7 +2009,7 @@ class TaskDatabase:
         # #SUGGEST_VALIDATION: Consider validating ra_mode against known values
         # #SUGGEST_VALIDATION: Consider validating ra_score range (1-10)
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         # Process RA tags to ensure they have unique IDs for exact validation matching
         processed_ra_tags = self._process_ra_tags_with_ids(ra_tags)
@@ -2065,7 +2069,7 @@ class TaskDatabase:
             
         # #SUGGEST_EDGE_CASE: Consider handling sequence number overflow (unlikely with INTEGER type)
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         payload_json = json.dumps(payload) if payload else None
         
         with self._connection_lock:
@@ -2438,7 +2442,7 @@ class TaskDatabase:
         # #SUGGEST_VALIDATION: Consider adding field-level validation before database operations
         # #SUGGEST_ERROR_HANDLING: Consider more granular error reporting for specific field failures
         """
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         # Lock validation ensures only authorized agents can update tasks
         # Agent_id uniquely identifies agents and prevents unauthorized updates
@@ -2854,7 +2858,7 @@ class TaskDatabase:
         created_by: Optional[str] = None
     ) -> int:
         """Create task with project/epic context validation."""
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = self.now().isoformat() + 'Z'
         
         with self._connection_lock:
             cursor = self._connection.cursor()
@@ -2905,8 +2909,8 @@ class TaskDatabase:
         """Register dashboard session."""
         with self._connection_lock:
             cursor = self._connection.cursor()
-            now = datetime.now(timezone.utc).isoformat() + 'Z'
-            expires_at = (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat() + 'Z'
+            now = self.now().isoformat() + 'Z'
+            expires_at = (self.now() + timedelta(hours=24)).isoformat() + 'Z'
             
             cursor.execute("""
                 INSERT OR REPLACE INTO dashboard_sessions 
@@ -2923,7 +2927,7 @@ class TaskDatabase:
         """Update session heartbeat and context."""
         with self._connection_lock:
             cursor = self._connection.cursor()
-            now = datetime.now(timezone.utc).isoformat() + 'Z'
+            now = self.now().isoformat() + 'Z'
             
             cursor.execute("""
                 UPDATE dashboard_sessions 
@@ -2937,7 +2941,7 @@ class TaskDatabase:
         """Clean up expired sessions and return count removed."""
         with self._connection_lock:
             cursor = self._connection.cursor()
-            now = datetime.now(timezone.utc).isoformat() + 'Z'
+            now = self.now().isoformat() + 'Z'
             
             cursor.execute("""
                 DELETE FROM dashboard_sessions 
@@ -3173,8 +3177,8 @@ class TaskDatabase:
         """Log event for missed event recovery."""
         with self._connection_lock:
             cursor = self._connection.cursor()
-            now = datetime.now(timezone.utc).isoformat() + 'Z'
-            expires_at = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat() + 'Z'
+            now = self.now().isoformat() + 'Z'
+            expires_at = (self.now() + timedelta(days=30)).isoformat() + 'Z'
             
             cursor.execute("""
                 INSERT INTO event_log (
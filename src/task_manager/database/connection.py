@@ -9,7 +9,7 @@ import sqlite3
 import threading
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -28,16 +28,23 @@ class DatabaseConnection:
     - Transaction context manager
     """
 
-    def __init__(self, db_path: str, lock_timeout_seconds: int = 300):
+    def __init__(self, db_path: str, lock_timeout_seconds: int = 300,
+                 clock: Optional[Callable[[], datetime]] = None,
+                 fast_unsafe: bool = False):
         """
         Initialize DatabaseConnection with SQLite WAL mode configuration.
 
         Args:
             db_path: Path to SQLite database file
             lock_timeout_seconds: Default lock expiration timeout
+            clock: Callable returning the current UTC datetime (defaults to system time)
+            fast_unsafe: Use an in-memory rollback journal with synchronous=OFF
+                instead of WAL. Not crash-safe; intended for throwaway test databases.
         """
         self.db_path = Path(db_path)
         self.lock_timeout_seconds = lock_timeout_seconds
+        self.fast_unsafe = fast_unsafe
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
         self._connection_lock = threading.RLock()
 
         # Single connection with cross-thread access enabled for WAL mode
@@ -63,7 +70,8 @@ class DatabaseConnection:
             self._connection = sqlite3.connect(
                 str(self.db_path),
                 isolation_level=None,  # Autocommit mode
-                check_same_thread=False  # Allow cross-thread access
+                check_same_thread=False,  # Allow cross-thread access
+                cached_statements=256  # Repository queries are fixed strings; keep them all compiled
             )
 
             # Configure SQLite for concurrent access
@@ -71,8 +79,14 @@ class DatabaseConnection:
 
             # WAL mode configuration verified compatible with local and temp filesystems
             # Provides concurrent access as required by MVP specification
-            cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.execute("PRAGMA synchronous=NORMAL")
+            if self.fast_unsafe:
+                # Ephemeral databases skip the -wal/-shm files and every fsync
+                cursor.execute("PRAGMA journal_mode=MEMORY")
+                cursor.execute("PRAGMA synchronous=OFF")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+            else:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
             cursor.execute("PRAGMA busy_timeout=5000")  # 5 second timeout for lock contention
             cursor.execute("PRAGMA foreign_keys=ON")  # Enable foreign key constraints for CASCADE DELETE
 
@@ -504,19 +518,42 @@ class DatabaseConnection:
 
     @contextmanager
     def _transaction(self):
-        """Context manager for explicit transaction control."""
+        """Context manager for explicit transaction control.
+
+        Nests as a savepoint when the caller already holds a transaction.
+        """
         cursor = self._connection.cursor()
+        nested = self._connection.in_transaction
         try:
-            cursor.execute("BEGIN")
+            cursor.execute("SAVEPOINT repository_tx" if nested else "BEGIN")
             yield cursor
-            cursor.execute("COMMIT")
+            cursor.execute("RELEASE repository_tx" if nested else "COMMIT")
         except Exception:
-            cursor.execute("ROLLBACK")
+            if nested:
+                cursor.execute("ROLLBACK TO repository_tx")
+                cursor.execute("RELEASE repository_tx")
+            else:
+                cursor.execute("ROLLBACK")
             raise
 
+    def execute_prepared(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """
+        Execute a single statement under the connection lock and return its rows.
+
+        The connection keeps compiled statements in sqlite3's statement cache
+        keyed by SQL text, so callers reusing the same string skip re-parsing.
+        Rows are fetched before the lock is released; writes return an empty list.
+        """
+        with self._connection_lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def now(self) -> datetime:
+        """Get current UTC time from the configured clock."""
+        return self._clock()
+
     def _get_current_time_str(self) -> str:
         """Get current UTC time as ISO string for database operations."""
-        return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        return self.now().isoformat().replace('+00:00', 'Z')
 
     def initialize_fresh(self) -> None:
         """
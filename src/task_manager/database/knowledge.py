@@ -56,6 +56,7 @@ class KnowledgeRepository:
         self._legacy._connection_lock = conn.connection_lock
         self._legacy.lock_timeout_seconds = conn.lock_timeout_seconds
         self._legacy._get_current_time_str = conn._get_current_time_str
+        self._legacy.now = conn.now
 
         # Bind all knowledge-related methods from legacy class
         self._bind_legacy_methods(_LegacyDB)
@@ -6,7 +6,7 @@ Includes lock acquisition, release, status checking, and expiration cleanup.
 """
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -51,9 +51,10 @@ class LockRepository:
 
         # ISO datetime strings verified for cross-platform SQLite compatibility
         # String comparison works correctly for datetime ordering in all tested scenarios
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=lock_duration_seconds)
+        now = self.conn.now()
+        expires_at = now + timedelta(seconds=lock_duration_seconds)
         expires_at_str = expires_at.isoformat() + 'Z'
-        current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+        current_time_str = now.isoformat() + 'Z'
 
         with self.conn.connection_lock:
             cursor = self.conn.connection.cursor()
@@ -92,7 +93,7 @@ class LockRepository:
         """
         with self.conn.connection_lock:
             cursor = self.conn.connection.cursor()
-            current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+            current_time_str = self.conn.now().isoformat() + 'Z'
 
             # Agent validation prevents unauthorized lock releases via string matching
             # NOTE: Agent IDs assumed unique but not cryptographically secured for MVP
@@ -117,29 +118,28 @@ class LockRepository:
         """
         with self.conn.connection_lock:
             cursor = self.conn.connection.cursor()
-            current_time_str = datetime.now(timezone.utc).isoformat() + 'Z'
+            current_time_str = self.conn.now().isoformat() + 'Z'
 
+            # Expiry is a TEXT comparison on the ISO timestamps, evaluated in SQL
+            # alongside the row fetch so no datetime parsing happens in Python
             cursor.execute("""
-                SELECT lock_holder, lock_expires_at
+                SELECT lock_holder, lock_expires_at,
+                       lock_holder IS NOT NULL AND lock_expires_at IS NOT NULL
+                           AND lock_expires_at > ?
                 FROM tasks
                 WHERE id = ?
-            """, (task_id,))
+            """, (current_time_str, task_id))
 
             row = cursor.fetchone()
             if not row:
                 return {"error": "Task not found"}
 
-            lock_holder, lock_expires_at = row
-
-            # Check if lock is expired
-            is_locked = (lock_holder is not None and
-                        lock_expires_at is not None and
-                        lock_expires_at > current_time_str)
+            lock_holder, lock_expires_at, is_locked = row
 
             return {
                 "lock_holder": lock_holder,
                 "lock_expires_at": lock_expires_at,
-                "is_locked": is_locked
+                "is_locked": bool(is_locked)
             }
 
     def cleanup_expired_locks(self) -> int:
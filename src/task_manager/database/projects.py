@@ -132,6 +132,92 @@ class ProjectRepository:
                 "updated_at": row[6]
             } for row in rows]
 
+    def count_projects(self) -> int:
+        """
+        Count all projects with a single aggregate query.
+
+        Returns:
+            Number of rows in the projects table
+        """
+        with self.conn.connection_lock:
+            cursor = self.conn.connection.cursor()
+            cursor.execute("SELECT COUNT(*) FROM projects")
+            return cursor.fetchone()[0]
+
+    def count_epics(self) -> int:
+        """
+        Count all epics with a single aggregate query.
+
+        Returns:
+            Number of rows in the epics table
+        """
+        with self.conn.connection_lock:
+            cursor = self.conn.connection.cursor()
+            cursor.execute("SELECT COUNT(*) FROM epics")
+            return cursor.fetchone()[0]
+
+    def get_project_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single project by its unique name.
+
+        Args:
+            name: Project name
+
+        Returns:
+            Project dictionary with the get_all_projects fields, or None if not found
+        """
+        with self.conn.connection_lock:
+            cursor = self.conn.connection.cursor()
+            # Served by the UNIQUE index on projects.name
+            cursor.execute("""
+                SELECT id, name, description, created_at, updated_at
+                FROM projects
+                WHERE name = ?
+            """, (name,))
+
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {
+                "id": row[0],
+                "name": row[1],
+                "description": row[2],
+                "created_at": row[3],
+                "updated_at": row[4]
+            }
+
+    def get_epic_by_name(self, project_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single epic by name within a project.
+
+        Args:
+            project_id: Project containing the epic
+            name: Epic name (unique within its project)
+
+        Returns:
+            Epic dictionary with the get_all_epics fields, or None if not found
+        """
+        with self.conn.connection_lock:
+            cursor = self.conn.connection.cursor()
+            cursor.execute("""
+                SELECT id, project_id, name, description, status, created_at, updated_at
+                FROM epics
+                WHERE project_id = ? AND name = ?
+            """, (project_id, name))
+
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {
+                "id": row[0],
+                "project_id": row[1],
+                "name": row[2],
+                "description": row[3],
+                "status": row[4],
+                "created_at": row[5],
+                "updated_at": row[6]
+            }
+
     def list_projects_filtered(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         List projects with optional status filtering and result limiting.
@@ -12,7 +12,7 @@ import json
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .connection import DatabaseConnection
@@ -57,6 +57,7 @@ class TaskRepository:
         self._legacy._connection_lock = conn.connection_lock
         self._legacy.lock_timeout_seconds = conn.lock_timeout_seconds
         self._legacy._get_current_time_str = conn._get_current_time_str
+        self._legacy.now = conn.now
 
         # Bind all task-related methods from legacy class
         self._bind_legacy_methods(_LegacyDB)
@@ -115,3 +116,56 @@ class TaskRepository:
     # - delete_task
     # - cleanup_orphaned_tasks
     # - create_large_dataset_for_performance_testing
+
+    def count_tasks(self) -> int:
+        """
+        Count all tasks with a single aggregate query.
+
+        Returns:
+            Number of rows in the tasks table
+        """
+        with self.conn.connection_lock:
+            cursor = self.conn.connection.cursor()
+            cursor.execute("SELECT COUNT(*) FROM tasks")
+            return cursor.fetchone()[0]
+
+    def create_tasks_bulk(self, epic_id: int,
+                          tasks: Sequence[Tuple[str, Optional[str]]]) -> List[int]:
+        """
+        Create several tasks within an epic in a single transaction.
+
+        Uses executemany inside one BEGIN/COMMIT instead of one autocommit
+        write per task, so seeding many tasks costs a single commit.
+
+        Args:
+            epic_id: Parent epic ID
+            tasks: Sequence of (name, description) pairs
+
+        Returns:
+            Task IDs in the same order as the input
+        """
+        if not tasks:
+            return []
+
+        current_time_str = self.conn.now().isoformat() + 'Z'
+        rows = [
+            (epic_id, name, description, current_time_str, current_time_str)
+            for name, description in tasks
+        ]
+
+        with self.conn.connection_lock:
+            with self.conn._transaction() as cursor:
+                cursor.executemany("""
+                    INSERT INTO tasks (epic_id, name, description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+
+                # The write transaction holds the database lock, so the newest
+                # rows for this epic are exactly the ones just inserted
+                cursor.execute("""
+                    SELECT id FROM tasks WHERE epic_id = ? ORDER BY id DESC LIMIT ?
+                """, (epic_id, len(rows)))
+                task_ids = [row[0] for row in cursor.fetchall()]
+
+        task_ids.reverse()
+        return task_ids
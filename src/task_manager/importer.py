@@ -7,10 +7,56 @@ with preservation of runtime fields (locks, assignments) during updates.
 
 import yaml
 import sqlite3
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, TextIO, Tuple
 from datetime import datetime, timezone
 from .database import TaskDatabase
 
+# libyaml-backed loader/dumper handle large project files ~10x faster; PyYAML builds
+# without libyaml fall back to the pure-Python safe loader and dumper
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader, CSafeDumper as _YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader, SafeDumper as _YamlSafeDumper
+
+
+# Map UI vocabulary to database vocabulary
+_STATUS_MAPPING = {
+    'TODO': 'pending',
+    'IN_PROGRESS': 'in_progress',
+    'DONE': 'completed',
+    'COMPLETED': 'completed',  # Alternative form of DONE
+    'REVIEW': 'review',
+    'BLOCKED': 'blocked'
+}
+
+# New tasks are inserted with multi-row VALUES lists; keep each statement under
+# SQLite's historic 999 bound-parameter default (6 parameters per task row)
+_TASK_INSERT_ROW_SQL = "(?, ?, ?, COALESCE(?, 'pending'), ?, ?)"
+_TASK_INSERT_BATCH_ROWS = 999 // 6
+
+# Imports above this many tasks drop the tasks indexes they only write to and
+# rebuild them before committing. idx_tasks_epic_id stays: the import reads it.
+_BULK_IMPORT_TASK_THRESHOLD = 500
+_BULK_IMPORT_DEFERRED_INDEXES = (
+    "idx_tasks_status_created",
+    "idx_tasks_available",
+    "idx_tasks_lock_holder",
+    "idx_tasks_context_created",
+)
+
+_INSERT_TASKS_SQL_PREFIX = "INSERT INTO tasks (epic_id, name, description, status, created_at, updated_at) VALUES "
+_INSERT_TASK_SQL = _INSERT_TASKS_SQL_PREFIX + _TASK_INSERT_ROW_SQL
+
+# Fields omitted from the YAML (NULL parameters) keep their stored values; runtime
+# fields (lock_holder, lock_expires_at) are never touched by imports
+_UPDATE_TASK_SQL = """
+    UPDATE tasks
+    SET updated_at = ?,
+        description = COALESCE(?, description),
+        status = COALESCE(?, status)
+    WHERE epic_id = ? AND name = ?
+"""
+
 
 def import_project(db: TaskDatabase, yaml_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -45,9 +91,19 @@ def import_project(db: TaskDatabase, yaml_data: Dict[str, Any]) -> Dict[str, Any
     # VERIFIED: Connection locking provides thread safety for concurrent imports
     # Direct cursor operations with explicit transactions avoid WAL mode conflicts
     with db._connection_lock:
+        cursor = db._connection.cursor()
+        # One write transaction for the whole hierarchy so every row shares a single
+        # commit; nest as a savepoint when the caller already holds a transaction
+        nested = db._connection.in_transaction
+        # Opened before the try so a failed BEGIN surfaces as-is rather than
+        # being masked by a ROLLBACK with no transaction to roll back
+        cursor.execute("SAVEPOINT import_project" if nested else "BEGIN IMMEDIATE")
         try:
-            cursor = db._connection.cursor()
-            cursor.execute("BEGIN")
+            # Large imports skip secondary index maintenance per row and rebuild
+            # those indexes once, still inside this transaction
+            deferred_indexes = []
+            if _count_yaml_tasks(yaml_data) > _BULK_IMPORT_TASK_THRESHOLD:
+                deferred_indexes = _drop_deferred_indexes(cursor)
             
             # Process projects first - establish top-level hierarchy
             projects = yaml_data.get("projects", [])
@@ -74,21 +130,11 @@ def import_project(db: TaskDatabase, yaml_data: Dict[str, Any]) -> Dict[str, Any
                                 stats["epics_updated"] += 1
                                 
                             # Process tasks within this epic
-                            tasks = epic_data.get("tasks", [])
-                            for task_data in tasks:
-                                try:
-                                    # VERIFIED: Tasks linked to epic_id only in new schema
-                                    task_result = _import_task(cursor, task_data, epic_result["epic_id"], current_time_str)
-                                    if task_result["created"]:
-                                        stats["tasks_created"] += 1
-                                    else:
-                                        stats["tasks_updated"] += 1
-                                        
-                                except Exception as e:
-                                    # #SUGGEST_ERROR_HANDLING: Individual task failures don't stop entire import
-                                    task_name = task_data.get('name', 'unnamed') if isinstance(task_data, dict) else 'invalid'
-                                    error_msg = f"Failed to import task '{task_name}': {str(e)}"
-                                    stats["errors"].append(error_msg)
+                            # VERIFIED: Tasks linked to epic_id only in new schema
+                            task_stats = _import_epic_tasks(cursor, epic_data.get("tasks", []), epic_result["epic_id"], current_time_str)
+                            stats["tasks_created"] += task_stats["created"]
+                            stats["tasks_updated"] += task_stats["updated"]
+                            stats["errors"].extend(task_stats["errors"])
                                     
                         except Exception as e:
                             # #SUGGEST_ERROR_HANDLING: Individual epic failures don't stop entire import  
@@ -121,10 +167,17 @@ def import_project(db: TaskDatabase, yaml_data: Dict[str, Any]) -> Dict[str, Any
                     error_msg = f"Failed to import standalone task '{task_name}': {str(e)}"
                     stats["errors"].append(error_msg)
             
-            cursor.execute("COMMIT")
+            for index_sql in deferred_indexes:
+                cursor.execute(index_sql)
+            
+            cursor.execute("RELEASE import_project" if nested else "COMMIT")
     
         except Exception as e:
-            cursor.execute("ROLLBACK") 
+            if nested:
+                cursor.execute("ROLLBACK TO import_project")
+                cursor.execute("RELEASE import_project")
+            else:
+                cursor.execute("ROLLBACK")
             # #SUGGEST_ERROR_HANDLING: For critical structural errors, still raise exception
             if "must be a list" in str(e):
                 raise ValueError(str(e))
@@ -133,6 +186,36 @@ def import_project(db: TaskDatabase, yaml_data: Dict[str, Any]) -> Dict[str, Any
     return stats
 
 
+def _count_yaml_tasks(yaml_data: Dict[str, Any]) -> int:
+    """Count the epic tasks in an import payload, ignoring malformed entries."""
+    projects = yaml_data.get("projects")
+    if not isinstance(projects, list):
+        return 0
+    count = 0
+    for project_data in projects:
+        epics = project_data.get("epics") if isinstance(project_data, dict) else None
+        if not isinstance(epics, list):
+            continue
+        for epic_data in epics:
+            tasks = epic_data.get("tasks") if isinstance(epic_data, dict) else None
+            if isinstance(tasks, list):
+                count += len(tasks)
+    return count
+
+
+def _drop_deferred_indexes(cursor: sqlite3.Cursor) -> List[str]:
+    """Drop the bulk-import deferred indexes and return the SQL that recreates them."""
+    placeholders = ','.join('?' * len(_BULK_IMPORT_DEFERRED_INDEXES))
+    cursor.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND name IN ({placeholders})",
+        _BULK_IMPORT_DEFERRED_INDEXES,
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f"DROP INDEX {name}")
+    return [index_sql for _, index_sql in indexes]
+
+
 def _import_project(cursor: sqlite3.Cursor, project_data: Dict[str, Any], current_time_str: str) -> Dict[str, Any]:
     """Import single project with UPSERT logic."""
     if not isinstance(project_data, dict):
@@ -242,8 +325,8 @@ def _import_epic(cursor: sqlite3.Cursor, epic_data: Dict[str, Any], project_id:
 
 
 
-def _import_task(cursor: sqlite3.Cursor, task_data: Dict[str, Any], epic_id: int, current_time_str: str) -> Dict[str, Any]:
-    """Import single task with UPSERT logic and runtime field preservation."""
+def _parse_task_fields(task_data: Dict[str, Any]) -> Tuple[str, Optional[str], Optional[str]]:
+    """Validate task YAML and return (name, description, database status)."""
     if not isinstance(task_data, dict):
         raise ValueError("Task data must be a dictionary")
     
@@ -251,20 +334,93 @@ def _import_task(cursor: sqlite3.Cursor, task_data: Dict[str, Any], epic_id: int
     if not name:
         raise ValueError("Task must have 'name' field")
     
-    description = task_data.get("description")
     status = task_data.get("status")
-    
-    # Map UI vocabulary to database vocabulary
-    status_mapping = {
-        'TODO': 'pending',
-        'IN_PROGRESS': 'in_progress',
-        'DONE': 'completed',
-        'COMPLETED': 'completed',  # Alternative form of DONE
-        'REVIEW': 'review',
-        'BLOCKED': 'blocked'
-    }
     if status is not None:
-        status = status_mapping.get(status, status)
+        status = _STATUS_MAPPING.get(status, status)
+    
+    return name, task_data.get("description"), status
+
+
+def _task_error(task_data: Any, error: Exception) -> str:
+    """Format the per-task import error recorded in the import statistics."""
+    task_name = task_data.get('name', 'unnamed') if isinstance(task_data, dict) else 'invalid'
+    return f"Failed to import task '{task_name}': {str(error)}"
+
+
+def _import_epic_tasks(cursor: sqlite3.Cursor, tasks_data: List[Any], epic_id: int, current_time_str: str) -> Dict[str, Any]:
+    """
+    Import an epic's tasks with UPSERT logic, inserting new tasks in batches.
+    
+    Tasks not yet in the epic are written with multi-row INSERT statements and
+    existing tasks (or repeated names within the YAML) with one executemany
+    UPDATE. Neither touches runtime fields, matching _import_task, which handles
+    any rows a batch statement rejected so errors stay per task.
+    """
+    result = {"created": 0, "updated": 0, "errors": []}
+    
+    cursor.execute("SELECT name FROM tasks WHERE epic_id = ?", (epic_id,))
+    known_names = {row[0] for row in cursor.fetchall()}
+    
+    new_rows = []
+    new_task_data = []
+    updates = []
+    for task_data in tasks_data:
+        try:
+            name, description, status = _parse_task_fields(task_data)
+        except Exception as e:
+            # #SUGGEST_ERROR_HANDLING: Individual task failures don't stop entire import
+            result["errors"].append(_task_error(task_data, e))
+            continue
+        
+        if name in known_names:
+            updates.append(task_data)
+        else:
+            known_names.add(name)
+            new_rows.append((epic_id, name, description, status, current_time_str, current_time_str))
+            new_task_data.append(task_data)
+    
+    retries = []
+    for start in range(0, len(new_rows), _TASK_INSERT_BATCH_ROWS):
+        batch = new_rows[start:start + _TASK_INSERT_BATCH_ROWS]
+        try:
+            cursor.execute(
+                _INSERT_TASKS_SQL_PREFIX + ", ".join([_TASK_INSERT_ROW_SQL] * len(batch)),
+                [value for row in batch for value in row],
+            )
+            result["created"] += len(batch)
+        except sqlite3.Error:
+            # A failed statement inserts nothing; retry row by row to report the offending tasks
+            retries.extend(new_task_data[start:start + _TASK_INSERT_BATCH_ROWS])
+    
+    # Tasks known to exist share one prepared UPDATE via executemany. Rows that
+    # failed to insert, and updates that may target them or hit a constraint,
+    # fall back to per-task handling: failed inserts first, then the updates, so
+    # a repeated name is still created before it is updated
+    if updates and not retries:
+        try:
+            cursor.executemany(_UPDATE_TASK_SQL, [
+                (current_time_str, description, status, epic_id, name)
+                for name, description, status in map(_parse_task_fields, updates)
+            ])
+            result["updated"] += len(updates)
+        except sqlite3.Error:
+            retries.extend(updates)
+    else:
+        retries.extend(updates)
+    
+    for task_data in retries:
+        try:
+            task_result = _import_task(cursor, task_data, epic_id, current_time_str)
+            result["created" if task_result["created"] else "updated"] += 1
+        except Exception as e:
+            result["errors"].append(_task_error(task_data, e))
+    
+    return result
+
+
+def _import_task(cursor: sqlite3.Cursor, task_data: Dict[str, Any], epic_id: int, current_time_str: str) -> Dict[str, Any]:
+    """Import single task with UPSERT logic and runtime field preservation."""
+    name, description, status = _parse_task_fields(task_data)
     
     # VERIFIED: Tasks identified by (epic_id, name) compound key with runtime field preservation
     # Runtime fields (lock_holder, lock_expires_at) preserved during import to maintain agent coordination
@@ -278,10 +434,7 @@ def _import_task(cursor: sqlite3.Cursor, task_data: Dict[str, Any], epic_id: int
     
     if not existing:
         # Create new task - no runtime fields to preserve
-        cursor.execute("""
-            INSERT INTO tasks (epic_id, name, description, status, created_at, updated_at)
-            VALUES (?, ?, ?, COALESCE(?, 'pending'), ?, ?)
-        """, (epic_id, name, description, status, current_time_str, current_time_str))
+        cursor.execute(_INSERT_TASK_SQL, (epic_id, name, description, status, current_time_str, current_time_str))
         
         task_id = cursor.lastrowid
         return {"task_id": task_id, "created": True}
@@ -291,57 +444,17 @@ def _import_task(cursor: sqlite3.Cursor, task_data: Dict[str, Any], epic_id: int
         
         # VERIFIED: Lock state preservation prevents import interference with active agent assignments
         
-        update_parts = ["updated_at = ?"]
-        update_values = [current_time_str]
-        
-        if description is not None:
-            update_parts.append("description = ?")
-            update_values.append(description)
-            
         # #SUGGEST_VALIDATION: Consider preserving status if task is currently locked
         # Locked tasks may have status changes that shouldn't be overridden by import
-        if status is not None:
-            if lock_holder is not None and lock_expires_at is not None:
-                # Task is locked - consider preserving current status
-                # VERIFIED: Status updates proceed normally even for locked tasks (current implementation)
-                pass
-            update_parts.append("status = ?")
-            update_values.append(status)
-        
-        update_values.extend([epic_id, name])  # WHERE clause
-        
-        cursor.execute(f"""
-            UPDATE tasks 
-            SET {', '.join(update_parts)}
-            WHERE epic_id = ? AND name = ?
-        """, update_values)
+        # VERIFIED: Status updates proceed normally even for locked tasks (current implementation)
+        cursor.execute(_UPDATE_TASK_SQL, (current_time_str, description, status, epic_id, name))
         
         return {"task_id": task_id, "created": False}
 
 
 def _import_standalone_task(cursor: sqlite3.Cursor, task_data: Dict[str, Any], current_time_str: str) -> Dict[str, Any]:
     """Import standalone task with UPSERT logic (no epic association)."""
-    if not isinstance(task_data, dict):
-        raise ValueError("Task data must be a dictionary")
-    
-    name = task_data.get("name")
-    if not name:
-        raise ValueError("Task must have 'name' field")
-    
-    description = task_data.get("description")
-    status = task_data.get("status")
-    
-    # Map UI vocabulary to database vocabulary
-    status_mapping = {
-        'TODO': 'pending',
-        'IN_PROGRESS': 'in_progress',
-        'DONE': 'completed',
-        'COMPLETED': 'completed',  # Alternative form of DONE
-        'REVIEW': 'review',
-        'BLOCKED': 'blocked'
-    }
-    if status is not None:
-        status = status_mapping.get(status, status)
+    name, description, status = _parse_task_fields(task_data)
     
     # Standalone tasks identified by name only (no epic constraint)
     cursor.execute("""
@@ -399,7 +512,7 @@ def import_project_from_file(db: TaskDatabase, yaml_file_path: str) -> Dict[str,
     """
     try:
         with open(yaml_file_path, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
+            yaml_data = yaml.load(f, Loader=_YamlSafeLoader)
             
         if not isinstance(yaml_data, dict):
             raise ValueError("YAML file must contain a dictionary at root level")
@@ -414,6 +527,110 @@ def import_project_from_file(db: TaskDatabase, yaml_file_path: str) -> Dict[str,
         raise RuntimeError(f"Import failed: {str(e)}")
 
 
+
+def import_project_iter(db: TaskDatabase, documents: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Import a stream of project documents in one transaction.
+    
+    Each document has the same shape as import_project's input and is imported
+    as a savepoint inside a single outer transaction, so only one document needs
+    to be in memory at a time while the whole stream still commits atomically.
+    
+    Args:
+        db: TaskDatabase instance
+        documents: Iterable of parsed YAML documents (e.g. from yaml.load_all)
+        
+    Returns:
+        Dict with import statistics summed across all documents
+        
+    Raises:
+        ValueError: For malformed YAML structure
+        RuntimeError: For database operation failures
+    """
+    totals = {
+        "projects_created": 0,
+        "projects_updated": 0,
+        "epics_created": 0,
+        "epics_updated": 0,
+        "tasks_created": 0,
+        "tasks_updated": 0,
+        "errors": []
+    }
+    
+    with db._connection_lock:
+        cursor = db._connection.cursor()
+        # Nest as a savepoint when the caller already holds a transaction
+        nested = db._connection.in_transaction
+        cursor.execute("SAVEPOINT import_project_iter" if nested else "BEGIN IMMEDIATE")
+        try:
+            for document in documents:
+                if not isinstance(document, dict):
+                    raise ValueError("Each YAML document must contain a dictionary at root level")
+                
+                stats = import_project(db, document)
+                totals["errors"].extend(stats.pop("errors"))
+                for key, count in stats.items():
+                    totals[key] += count
+            
+            cursor.execute("RELEASE import_project_iter" if nested else "COMMIT")
+        except Exception:
+            if nested:
+                cursor.execute("ROLLBACK TO import_project_iter")
+                cursor.execute("RELEASE import_project_iter")
+            else:
+                cursor.execute("ROLLBACK")
+            raise
+    
+    return totals
+
+
+def import_project_stream_from_file(db: TaskDatabase, yaml_file_path: str) -> Dict[str, Any]:
+    """
+    Import a multi-document YAML file (documents separated by ---) incrementally.
+    
+    Args:
+        db: TaskDatabase instance
+        yaml_file_path: Path to YAML file, typically written by dump_project_stream
+        
+    Returns:
+        Dict with import results
+    """
+    try:
+        with open(yaml_file_path, 'r', encoding='utf-8') as f:
+            return import_project_iter(db, yaml.load_all(f, Loader=_YamlSafeLoader))
+        
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"YAML file not found: {yaml_file_path}") from e
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML format: {str(e)}") from e
+    except Exception as e:
+        raise RuntimeError(f"Import failed: {str(e)}") from e
+
+
+def dump_project_stream(yaml_data: Dict[str, Any], stream: TextIO) -> None:
+    """
+    Write a project structure as a YAML stream with one document per epic.
+    
+    Every document repeats its project's name and description so it can be
+    imported on its own; import_project_stream_from_file reads it back.
+    
+    Args:
+        yaml_data: Project structure in import_project's format
+        stream: Writable text stream
+    """
+    def documents():
+        for project_data in yaml_data.get("projects", []):
+            project_fields = {key: value for key, value in project_data.items() if key != "epics"}
+            # Projects without epics still get a document so they are created
+            for epic_data in project_data.get("epics") or [None]:
+                epics = [epic_data] if epic_data is not None else []
+                yield {"projects": [dict(project_fields, epics=epics)]}
+        
+        if yaml_data.get("standalone_tasks"):
+            yield {"standalone_tasks": yaml_data["standalone_tasks"]}
+    
+    yaml.dump_all(documents(), stream, Dumper=_YamlSafeDumper, allow_unicode=True, sort_keys=False)
+
 # #SUGGEST_ERROR_HANDLING: Consider adding import validation function to verify data integrity
 # def validate_import_data(yaml_data: Dict[str, Any]) -> List[str]:
 #     """Validate YAML structure before import"""
@@ -787,6 +787,10 @@ class ProjectManagerMCPServer:
                 )
             
             # Assumption Validation Tools
+            # Built once so its bound write path is reused across captures
+            from .tools_lib import CaptureAssumptionValidationTool
+            capture_tool = CaptureAssumptionValidationTool(self.database, self.websocket_manager)
+
             @mcp.tool
             async def capture_assumption_validation(
                 task_id: str,
@@ -810,9 +814,6 @@ class ProjectManagerMCPServer:
                 Returns:
                     JSON string with success confirmation and validation record details
                 """
-                from .tools_lib import CaptureAssumptionValidationTool
-                
-                capture_tool = CaptureAssumptionValidationTool(self.database, self.websocket_manager)
                 return await capture_tool.apply(
                     task_id=task_id,
                     ra_tag_id=ra_tag_id,
@@ -31,14 +31,25 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PerformanceMetric:
     """Single performance measurement with timestamp."""
+    # Slotted because up to METRICS_HISTORY_SIZE instances are retained per history deque
+    __slots__ = ("timestamp", "value", "operation")
+
     timestamp: datetime
     value: float
     operation: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class SystemMetrics:
     """Current system performance metrics."""
+    # Immutable snapshot built per /api/metrics request; slotted to skip the instance dict
+    __slots__ = (
+        "active_connections", "total_tasks", "locked_tasks", "completed_tasks_today",
+        "avg_query_time_ms", "avg_broadcast_time_ms", "locks_acquired_today",
+        "expired_locks_cleaned", "lock_conflicts", "memory_usage_mb",
+        "cpu_usage_percent", "last_lock_cleanup",
+    )
+
     active_connections: int
     total_tasks: int
     locked_tasks: int
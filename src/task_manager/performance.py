@@ -13,6 +13,8 @@ from typing import Dict, Any, List, Optional, Set, Callable
 from contextlib import asynccontextmanager
 from functools import wraps
 
+import orjson
+
 from .monitoring import performance_monitor
 
 logger = logging.getLogger(__name__)
@@ -68,6 +70,11 @@ def timed_async_query(operation_name: str):
     return decorator
 
 
+def _serialize_event(event_data: Dict[str, Any]) -> str:
+    """Encode an event as the JSON text frame sent to every client."""
+    return orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class OptimizedConnectionManager:
     """
     Enhanced WebSocket connection manager with performance optimizations.
@@ -146,12 +153,15 @@ class OptimizedConnectionManager:
         
         start_time = time.time()
         
+        # Serialize once; every connection is sent the same message
+        messages = [_serialize_event(event_data)]
+        
         # Create broadcast tasks for all connections
         broadcast_tasks = []
         connections_to_broadcast = list(self.active_connections)
         
         for websocket in connections_to_broadcast:
-            task = self._safe_send_with_health_tracking(websocket, event_data)
+            task = self._send_messages_with_health_tracking(websocket, messages)
             broadcast_tasks.append(task)
         
         # Execute all broadcasts in parallel
@@ -187,6 +197,57 @@ class OptimizedConnectionManager:
             'duration_ms': duration_ms
         }
 
+    async def broadcast_many(self, events: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Broadcast several events in order with a single parallel pass.
+
+        Each event is still delivered as its own message, so clients receive the
+        same frames as from repeated optimized_broadcast calls; the events are
+        serialized once and every connection gets them back to back.
+
+        Args:
+            events: Event payloads to deliver, in order (JSON serializable)
+
+        Returns:
+            Dict with broadcast statistics (per connection, not per event)
+        """
+        if not events or not self.active_connections:
+            return {'sent': 0, 'failed': 0, 'duration_ms': 0.0}
+
+        start_time = time.time()
+        messages = [_serialize_event(event) for event in events]
+        connections_to_broadcast = list(self.active_connections)
+
+        results = await asyncio.gather(
+            *(self._send_messages_with_health_tracking(websocket, messages)
+              for websocket in connections_to_broadcast),
+            return_exceptions=True
+        )
+
+        successful_sends = sum(1 for result in results if result is True)
+        failed_sends = len(results) - successful_sends
+        duration_ms = (time.time() - start_time) * 1000
+
+        self._broadcast_stats['total_broadcasts'] += 1
+        self._broadcast_stats['failed_connections'] += failed_sends
+        current_avg = self._broadcast_stats['avg_broadcast_time_ms']
+        total_broadcasts = self._broadcast_stats['total_broadcasts']
+        self._broadcast_stats['avg_broadcast_time_ms'] = (
+            (current_avg * (total_broadcasts - 1) + duration_ms) / total_broadcasts
+        )
+        performance_monitor.record_broadcast_time(len(connections_to_broadcast), duration_ms)
+
+        logger.info(
+            f"Broadcast of {len(messages)} events completed: "
+            f"{successful_sends}/{len(connections_to_broadcast)} successful in {duration_ms:.1f}ms"
+        )
+
+        return {
+            'sent': successful_sends,
+            'failed': failed_sends,
+            'duration_ms': duration_ms
+        }
+
     async def broadcast(self, event_data: Dict[str, Any]) -> Dict[str, int]:
         """
         Compatibility wrapper to match simple ConnectionManager API.
@@ -238,12 +299,14 @@ class OptimizedConnectionManager:
 
         start_time = time.time()
 
+        messages = [_serialize_event(event_data)]
+
         # Create broadcast tasks for planning connections
         broadcast_tasks = []
         connections_to_broadcast = list(self.planning_connections)
 
         for websocket in connections_to_broadcast:
-            task = self._safe_send_with_health_tracking(websocket, event_data)
+            task = self._send_messages_with_health_tracking(websocket, messages)
             broadcast_tasks.append(task)
 
         results = await asyncio.gather(*broadcast_tasks, return_exceptions=True)
@@ -263,23 +326,21 @@ class OptimizedConnectionManager:
             'duration_ms': duration_ms
         }
     
-    async def _safe_send_with_health_tracking(self, websocket, event_data: Dict[str, Any]) -> bool:
+    async def _send_messages_with_health_tracking(self, websocket, messages: List[str]) -> bool:
         """
-        Safely send message with connection health tracking.
+        Send pre-serialized messages in order with connection health tracking.
         
         Args:
             websocket: WebSocket connection
-            event_data: Data to send
+            messages: JSON message strings to send
             
         Returns:
-            bool: True if successful, False if failed
+            bool: True if every message was sent, False on the first failure
         """
         try:
-            import json
-            message = json.dumps(event_data)
-            await websocket.send_text(message)
+            for message in messages:
+                await websocket.send_text(message)
             
-            # Update health tracking on success
             if websocket in self.connection_health:
                 self.connection_health[websocket]['last_successful_send'] = time.time()
                 self.connection_health[websocket]['failed_sends'] = 0
@@ -289,11 +350,9 @@ class OptimizedConnectionManager:
         except Exception as e:
             logger.warning(f"Failed to send WebSocket message: {e}")
             
-            # Update health tracking on failure
             if websocket in self.connection_health:
                 self.connection_health[websocket]['failed_sends'] += 1
             
-            # Remove unhealthy connection immediately to match expected semantics in tests
             await self.disconnect(websocket)
             return False
     
@@ -16,39 +16,95 @@ Standard Mode Implementation:
 
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class RAInstructionsManager:
-    """
-    Manager class for RA methodology system instructions.
-    
-    Standard Mode Assumptions:
-    - Instructions should be comprehensive yet concise for Claude effectiveness
-    - Versioning enables iterative improvement of methodology guidance
-    - Validation utilities help ensure RA compliance across agents
-    - Instructions integrate seamlessly with FastMCP server configuration
-    """
-    
-    def __init__(self):
-        """Initialize RA instructions manager with current version."""
-        self.version = "3.0.0"
-        self.last_updated = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-    
-    def get_full_instructions(self) -> str:
-        """
-        Get complete RA methodology system instructions.
-        
-        Standard Mode: Comprehensive instructions covering all RA workflow aspects
-        with specific guidance for MCP tool usage and multi-agent coordination.
-        
-        Returns:
-            Complete RA methodology instructions text
-        """
-        return f"""CRITICAL: You MUST use Response Awareness (RA) methodology for ALL programming and development tasks.
+# Static taxonomy built once at import; read-only views so the shared instance cannot
+# be mutated, and get_tag_taxonomy hands out plain dict copies
+_TAG_TAXONOMY = MappingProxyType({
+    "implementation_tags": MappingProxyType({
+        "COMPLETION_DRIVE_IMPL": "Implementation assumptions based on completion patterns rather than explicit requirements",
+        "COMPLETION_DRIVE_INTEGRATION": "Assumptions about how systems integrate based on typical patterns",
+        "CONTEXT_DEGRADED": "Areas where memory/context is fuzzy and educated guesses are being made",
+        "CONTEXT_RECONSTRUCT": "Actively filling in details that feel like they should be there"
+    }),
+    "pattern_detection_tags": MappingProxyType({
+        "CARGO_CULT": "Code added from pattern association rather than actual requirements",
+        "PATTERN_MOMENTUM": "Methods or features added because they feel like natural completions",
+        "ASSOCIATIVE_GENERATION": "Features that feel like they should exist in this context"
+    }),
+    "conflict_tags": MappingProxyType({
+        "PATTERN_CONFLICT": "Multiple contradictory implementation patterns feel equally valid",
+        "TRAINING_CONTRADICTION": "Different training contexts suggest opposing approaches"
+    }),
+    "suggestion_tags": MappingProxyType({
+        "SUGGEST_ERROR_HANDLING": "Error handling scenarios that feel necessary but aren't explicitly required",
+        "SUGGEST_EDGE_CASE": "Edge cases that should probably be handled",
+        "SUGGEST_VALIDATION": "Input validation that seems important for robustness",
+        "SUGGEST_CLEANUP": "Resource cleanup that feels necessary",
+        "SUGGEST_DEFENSIVE": "Defensive programming patterns that seem prudent"
+    }),
+})
+
+
+# Static per-mode guidelines built once at import; get_mode_guidelines copies one per call
+_MODE_GUIDELINES = {
+    "simple": {
+        "mode": "simple",
+        "approach": "Direct implementation with optional RA awareness",
+        "tagging_required": False,
+        "tagging_encouraged": True,
+        "knowledge_capture": "Optional, useful insights",
+        "testing_level": "Basic unit tests",
+        "verification_needed": False,
+        "implementation_pattern": "Read requirements → implement with optional RA tags → basic tests → capture useful knowledge → done",
+        "coordination_required": False,
+    },
+    "standard": {
+        "mode": "standard",
+        "approach": "Structured implementation with assumption awareness",
+        "tagging_required": False,
+        "tagging_encouraged": True,
+        "knowledge_capture": "Key decisions and lessons learned",
+        "testing_level": "Unit + integration tests",
+        "verification_needed": True,
+        "implementation_pattern": "Plan → implement with RA tags for key assumptions → document decisions in knowledge → comprehensive tests → verify against criteria",
+        "coordination_required": False,
+    },
+    "ra-light": {
+        "mode": "ra-light",
+        "approach": "Implementation with extensive RA tagging",
+        "tagging_required": True,
+        "tagging_encouraged": True,
+        "knowledge_capture": "Comprehensive documentation of all decisions",
+        "testing_level": "Unit + integration + edge case tests",
+        "verification_needed": True,
+        "implementation_pattern": "Plan → implement with comprehensive RA tags → create knowledge items for all assumptions → flag for verification → comprehensive testing",
+        "coordination_required": True,
+    },
+    "ra-full": {
+        "mode": "ra-full",
+        "approach": "Multi-agent orchestration with full RA workflow",
+        "tagging_required": True,
+        "tagging_encouraged": True,
+        "knowledge_capture": "Full knowledge management across agents",
+        "testing_level": "Complete test coverage with validation",
+        "verification_needed": True,
+        "implementation_pattern": "Deploy survey agent → parallel planning → synthesis → coordinated implementation with knowledge sharing → verification phase",
+        "coordination_required": True,
+    },
+}
+
+
+@lru_cache(maxsize=8)
+def _render_full_instructions(version: str, last_updated: str) -> str:
+    """Render the full RA instructions text; identical for a given version stamp."""
+    return f"""CRITICAL: You MUST use Response Awareness (RA) methodology for ALL programming and development tasks.
 
 ⚠️  MANDATORY REQUIREMENT: CREATE A TASK BEFORE DOING ANY WORK ⚠️
 NO CODE CHANGES, IMPLEMENTATIONS, OR PROGRAMMING WORK WITHOUT A TASK FIRST!
@@ -436,10 +492,39 @@ MISSING RA DATA IN UI:
 
 This methodology ensures high-quality, coordinated development with proper assumption tracking and multi-agent workflow support.
 
-Version: {self.version}
-Last Updated: {self.last_updated}
+Version: {version}
+Last Updated: {last_updated}
 """
 
+
+class RAInstructionsManager:
+    """
+    Manager class for RA methodology system instructions.
+    
+    Standard Mode Assumptions:
+    - Instructions should be comprehensive yet concise for Claude effectiveness
+    - Versioning enables iterative improvement of methodology guidance
+    - Validation utilities help ensure RA compliance across agents
+    - Instructions integrate seamlessly with FastMCP server configuration
+    """
+    
+    def __init__(self):
+        """Initialize RA instructions manager with current version."""
+        self.version = "3.0.0"
+        self.last_updated = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    
+    def get_full_instructions(self) -> str:
+        """
+        Get complete RA methodology system instructions.
+        
+        Standard Mode: Comprehensive instructions covering all RA workflow aspects
+        with specific guidance for MCP tool usage and multi-agent coordination.
+        
+        Returns:
+            Complete RA methodology instructions text
+        """
+        return _render_full_instructions(self.version, self.last_updated)
+
     def get_concise_instructions(self) -> str:
         """
         Get concise RA methodology instructions for performance-sensitive contexts.
@@ -488,30 +573,7 @@ Version: {self.version}"""
         Returns:
             Dictionary of tag categories with tag definitions
         """
-        return {
-            "implementation_tags": {
-                "COMPLETION_DRIVE_IMPL": "Implementation assumptions based on completion patterns rather than explicit requirements",
-                "COMPLETION_DRIVE_INTEGRATION": "Assumptions about how systems integrate based on typical patterns",
-                "CONTEXT_DEGRADED": "Areas where memory/context is fuzzy and educated guesses are being made",
-                "CONTEXT_RECONSTRUCT": "Actively filling in details that feel like they should be there"
-            },
-            "pattern_detection_tags": {
-                "CARGO_CULT": "Code added from pattern association rather than actual requirements",
-                "PATTERN_MOMENTUM": "Methods or features added because they feel like natural completions",
-                "ASSOCIATIVE_GENERATION": "Features that feel like they should exist in this context"
-            },
-            "conflict_tags": {
-                "PATTERN_CONFLICT": "Multiple contradictory implementation patterns feel equally valid",
-                "TRAINING_CONTRADICTION": "Different training contexts suggest opposing approaches"
-            },
-            "suggestion_tags": {
-                "SUGGEST_ERROR_HANDLING": "Error handling scenarios that feel necessary but aren't explicitly required",
-                "SUGGEST_EDGE_CASE": "Edge cases that should probably be handled",
-                "SUGGEST_VALIDATION": "Input validation that seems important for robustness",
-                "SUGGEST_CLEANUP": "Resource cleanup that feels necessary",
-                "SUGGEST_DEFENSIVE": "Defensive programming patterns that seem prudent"
-            }
-        }
+        return {category: dict(tags) for category, tags in _TAG_TAXONOMY.items()}
 
     def validate_ra_compliance(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -585,55 +647,16 @@ Version: {self.version}"""
         """
         if complexity_score <= 3:
             mode = "simple"
-            guidelines = {
-                "mode": mode,
-                "approach": "Direct implementation with optional RA awareness",
-                "tagging_required": False,
-                "tagging_encouraged": True,
-                "knowledge_capture": "Optional, useful insights",
-                "testing_level": "Basic unit tests",
-                "verification_needed": False,
-                "implementation_pattern": "Read requirements → implement with optional RA tags → basic tests → capture useful knowledge → done"
-            }
         elif complexity_score <= 6:
             mode = "standard"
-            guidelines = {
-                "mode": mode,
-                "approach": "Structured implementation with assumption awareness",
-                "tagging_required": False,
-                "tagging_encouraged": True,
-                "knowledge_capture": "Key decisions and lessons learned",
-                "testing_level": "Unit + integration tests",
-                "verification_needed": True,
-                "implementation_pattern": "Plan → implement with RA tags for key assumptions → document decisions in knowledge → comprehensive tests → verify against criteria"
-            }
         elif complexity_score <= 8:
             mode = "ra-light"
-            guidelines = {
-                "mode": mode,
-                "approach": "Implementation with extensive RA tagging",
-                "tagging_required": True,
-                "tagging_encouraged": True,
-                "knowledge_capture": "Comprehensive documentation of all decisions",
-                "testing_level": "Unit + integration + edge case tests",
-                "verification_needed": True,
-                "implementation_pattern": "Plan → implement with comprehensive RA tags → create knowledge items for all assumptions → flag for verification → comprehensive testing"
-            }
         else:
             mode = "ra-full"
-            guidelines = {
-                "mode": mode,
-                "approach": "Multi-agent orchestration with full RA workflow",
-                "tagging_required": True,
-                "tagging_encouraged": True,
-                "knowledge_capture": "Full knowledge management across agents",
-                "testing_level": "Complete test coverage with validation",
-                "verification_needed": True,
-                "implementation_pattern": "Deploy survey agent → parallel planning → synthesis → coordinated implementation with knowledge sharing → verification phase"
-            }
         
+        # Copy the prebuilt per-mode guidelines so callers get their own dict
+        guidelines = dict(_MODE_GUIDELINES[mode])
         guidelines["complexity_score"] = complexity_score
-        guidelines["coordination_required"] = mode in ["ra-light", "ra-full"]
         
         return guidelines
 
@@ -13,7 +13,10 @@ Pattern Recognition Rules:
 """
 
 import re
-from typing import Tuple, Dict
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
+import orjson
 
 
 # RA tag prefix to normalized category mapping
@@ -73,6 +76,27 @@ RA_TAG_MAPPINGS: Dict[str, str] = {
     "PATH_DECISION": "planning:path-decision",
 }
 
+# Matches: #PREFIX or #PREFIX_SUFFIX at start, followed by optional colon and description
+RA_TAG_PATTERN = re.compile(r'^#([A-Z_]+)(?::\s*.*)?$', re.IGNORECASE)
+
+# (category, subcategory) per tag prefix and category per normalized type, split once at import
+_TAG_PARTS = {
+    prefix: tuple(normalized_type.split(":", 1))
+    for prefix, normalized_type in RA_TAG_MAPPINGS.items()
+}
+_UNKNOWN_TAG_PARTS = ("unknown", "other")
+_CATEGORY_BY_TYPE = {
+    normalized_type: normalized_type.split(":")[0]
+    for normalized_type in set(RA_TAG_MAPPINGS.values()) | {"unknown:other"}
+}
+
+# Canonical "#PREFIX" heads for every mapped tag, so the common spelling resolves
+# with one dict lookup; other casings and malformed text fall back to the regex
+_TYPE_BY_TAG_HEAD = {f"#{prefix}": normalized_type for prefix, normalized_type in RA_TAG_MAPPINGS.items()}
+
+# Shared result for None/empty input; tuples are immutable so one instance serves every caller
+_UNKNOWN_EMPTY_TAG = ("unknown:other", "")
+
 
 def normalize_ra_tag(ra_tag_text: str) -> Tuple[str, str]:
     """
@@ -96,26 +120,85 @@ def normalize_ra_tag(ra_tag_text: str) -> Tuple[str, str]:
         >>> normalize_ra_tag("#UNKNOWN_TAG: Some description")
         ("unknown:other", "#UNKNOWN_TAG: Some description")
     """
+    if ra_tag_text is None or ra_tag_text == "":
+        return _UNKNOWN_EMPTY_TAG
     if not ra_tag_text or not isinstance(ra_tag_text, str):
-        return ("unknown:other", str(ra_tag_text) if ra_tag_text is not None else "")
+        return ("unknown:other", str(ra_tag_text))
     
-    # Preserve exact original text
-    original_text = ra_tag_text
+    return (_normalize_ra_tag_text(ra_tag_text), ra_tag_text)
+
+
+def get_normalized_type(ra_tag_text: str) -> str:
+    """
+    Get only the canonical tag type for RA tag text.
     
-    # Extract tag prefix using regex pattern
-    # Matches: #PREFIX or #PREFIX_SUFFIX at start, followed by optional colon and description
-    tag_pattern = r'^#([A-Z_]+)(?::\s*.*)?$'
-    match = re.match(tag_pattern, ra_tag_text.strip(), re.IGNORECASE)
+    Same classification as ``normalize_ra_tag(ra_tag_text)[0]`` for callers that
+    group or filter by type and have no use for the original text.
+    
+    Args:
+        ra_tag_text: Raw RA tag text
+        
+    Returns:
+        Canonical type like "error-handling:suggestion" or "unknown:other"
+    """
+    if not ra_tag_text or not isinstance(ra_tag_text, str):
+        return "unknown:other"
+    
+    return _normalize_ra_tag_text(ra_tag_text)
+
+
+def normalize_ra_tags(ra_tag_texts: Iterable[str]) -> list[Tuple[str, str]]:
+    """
+    Normalize a batch of RA tags.
+    
+    Args:
+        ra_tag_texts: Iterable of raw RA tag texts
+        
+    Returns:
+        List of (normalized_type, original_text) tuples, one per input, identical
+        to calling normalize_ra_tag() on each item
+    """
+    # Local bindings keep the per-tag work to one memoized lookup for string input
+    normalize_text = _normalize_ra_tag_text
+    normalized_tags = []
+    append = normalized_tags.append
+    for ra_tag_text in ra_tag_texts:
+        if ra_tag_text and isinstance(ra_tag_text, str):
+            append((normalize_text(ra_tag_text), ra_tag_text))
+        else:
+            append(normalize_ra_tag(ra_tag_text))
+    return normalized_tags
+
+
+@lru_cache(maxsize=4096)
+def _normalize_ra_tag_text(ra_tag_text: str) -> str:
+    """
+    Resolve the normalized type for RA tag text.
+
+    Memoized because analytics endpoints normalize the same handful of tag
+    texts once per validation row.
+    """
+    stripped = ra_tag_text.strip()
+    # Free-form text without the leading '#' can never match; skip the regex
+    if not stripped.startswith("#"):
+        return "unknown:other"
+    
+    head, _, description = stripped.partition(":")
+    normalized_type = _TYPE_BY_TAG_HEAD.get(head)
+    # RA_TAG_PATTERN's description group does not span lines, so multi-line
+    # text keeps going through the regex to preserve its classification
+    if normalized_type is not None and "\n" not in description:
+        return normalized_type
+    
+    match = RA_TAG_PATTERN.match(stripped)
     
     if not match:
-        return ("unknown:other", original_text)
+        return "unknown:other"
     
     tag_prefix = match.group(1).upper()
     
     # Look up normalized type from mapping
-    normalized_type = RA_TAG_MAPPINGS.get(tag_prefix, "unknown:other")
-    
-    return (normalized_type, original_text)
+    return RA_TAG_MAPPINGS.get(tag_prefix, "unknown:other")
 
 
 def extract_tag_category(tag_prefix: str) -> str:
@@ -143,11 +226,8 @@ def extract_tag_category(tag_prefix: str) -> str:
     
     tag_prefix = tag_prefix.upper().strip()
     
-    # Look up in mappings and extract category part (before colon)
-    normalized_type = RA_TAG_MAPPINGS.get(tag_prefix, "unknown:other")
-    category = normalized_type.split(":")[0]
-    
-    return category
+    # Look up the pre-split category part (before colon)
+    return _TAG_PARTS.get(tag_prefix, _UNKNOWN_TAG_PARTS)[0]
 
 
 def get_tag_subcategory(tag_prefix: str) -> str:
@@ -175,12 +255,8 @@ def get_tag_subcategory(tag_prefix: str) -> str:
     
     tag_prefix = tag_prefix.upper().strip()
     
-    # Look up in mappings and extract subcategory part (after colon)
-    normalized_type = RA_TAG_MAPPINGS.get(tag_prefix, "unknown:other")
-    parts = normalized_type.split(":")
-    subcategory = parts[1] if len(parts) > 1 else "other"
-    
-    return subcategory
+    # Look up the pre-split subcategory part (after colon)
+    return _TAG_PARTS.get(tag_prefix, _UNKNOWN_TAG_PARTS)[1]
 
 
 def parse_ra_tag_list(ra_tags_json: str) -> list[Tuple[str, str]]:
@@ -198,24 +274,17 @@ def parse_ra_tag_list(ra_tags_json: str) -> list[Tuple[str, str]]:
         [("error-handling:suggestion", "#SUGGEST_ERROR_HANDLING: Input validation"), 
          ("implementation:assumption", "#COMPLETION_DRIVE_IMPL: DB logic")]
     """
-    import json
-    
     if not ra_tags_json or not isinstance(ra_tags_json, str):
         return []
     
     try:
-        tags = json.loads(ra_tags_json)
+        tags = orjson.loads(ra_tags_json)
         if not isinstance(tags, list):
             return []
         
-        normalized_tags = []
-        for tag in tags:
-            if isinstance(tag, str):
-                normalized_tags.append(normalize_ra_tag(tag))
-        
-        return normalized_tags
+        return normalize_ra_tags(tag for tag in tags if isinstance(tag, str))
         
-    except (json.JSONDecodeError, TypeError):
+    except orjson.JSONDecodeError:
         return []
 
 
@@ -238,7 +307,9 @@ def get_category_stats(normalized_tags: list[Tuple[str, str]]) -> Dict[str, int]
     category_counts = {}
     
     for normalized_type, _ in normalized_tags:
-        category = normalized_type.split(":")[0]
+        category = _CATEGORY_BY_TYPE.get(normalized_type)
+        if category is None:
+            category = normalized_type.split(":")[0]
         category_counts[category] = category_counts.get(category, 0) + 1
     
     return category_counts
\ No newline at end of file
@@ -8,9 +8,11 @@ with automatic context enrichment for Response Awareness methodology.
 import json
 import logging
 import sqlite3
-from typing import Dict, Any, Optional, Union
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timezone, timedelta
 
+import orjson
+
 from .base import BaseTool
 from ..context_utils import create_enriched_context
 from ..ra_tag_utils import normalize_ra_tag
@@ -18,6 +20,98 @@ from ..ra_tag_utils import normalize_ra_tag
 # Configure logging for assumption tool operations
 logger = logging.getLogger(__name__)
 
+# Valid validation outcomes mapped to the confidence used when none is provided
+DEFAULT_CONFIDENCE_BY_OUTCOME: Dict[str, int] = {
+    'validated': 90,
+    'rejected': 10,
+    'partial': 75,  # Updated to match test expectations
+}
+
+# Statements shared by the single and batch capture paths
+_SELECT_RECENT_VALIDATION_SQL = """
+    SELECT id FROM assumption_validations 
+    WHERE task_id = ? 
+    AND ra_tag_id = ? 
+    AND validator_id = ?
+    AND validated_at > ?
+    LIMIT 1
+"""
+
+_UPDATE_VALIDATION_SQL = """
+    UPDATE assumption_validations 
+    SET outcome = ?, confidence = ?, notes = ?, 
+        context_snapshot = ?, validated_at = ?
+    WHERE id = ?
+"""
+
+_INSERT_VALIDATION_SQL = """
+    INSERT INTO assumption_validations 
+    (task_id, project_id, epic_id, ra_tag_id, validator_id, outcome, 
+     confidence, notes, context_snapshot, validated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _insert_params(row: Dict[str, Any], validated_at: str) -> Tuple[Any, ...]:
+    """Build INSERT parameters for a prepared validation row."""
+    return (
+        row['task_id'],
+        row['project_id'],
+        row['epic_id'],
+        row['ra_tag_id'],
+        row['reviewer'],
+        row['outcome'],
+        row['confidence'],
+        row['reason'],
+        '',  # context_snapshot - not needed for tag text
+        validated_at,
+    )
+
+
+def _update_params(row: Dict[str, Any], validated_at: str, validation_id: int) -> Tuple[Any, ...]:
+    """Build UPDATE parameters refreshing an existing validation record."""
+    return (
+        row['outcome'],
+        row['confidence'],
+        row['reason'],
+        '',  # context_snapshot - not needed for tag text
+        validated_at,
+        validation_id,
+    )
+
+
+def _event_data(row: Dict[str, Any], validation_id: int, operation: str) -> Dict[str, Any]:
+    """Build the WebSocket event payload for a captured validation."""
+    return {
+        "validation_id": validation_id,
+        "task_id": row['task_id'],
+        "ra_tag_id": row['ra_tag_id'],
+        "ra_tag_type": row['ra_tag_type'],
+        "outcome": row['outcome'],
+        "confidence": row['confidence'],
+        "operation": operation
+    }
+
+
+def _success_response(
+    row: Dict[str, Any], validation_id: int, operation: str, validated_at: str
+) -> Dict[str, Any]:
+    """Build the success response returned to the capturing reviewer."""
+    return {
+        "success": True,
+        "message": f"Assumption validation {operation} successfully",
+        "validation_id": validation_id,
+        "task_id": row['task_id'],
+        "ra_tag_id": row['ra_tag_id'],
+        "ra_tag_type": row['ra_tag_type'],
+        "outcome": row['outcome'],
+        "confidence": row['confidence'],
+        "reviewer": row['reviewer'],
+        "operation": operation,
+        "validated_at": validated_at
+    }
+
+
 class CaptureAssumptionValidationTool(BaseTool):
     """
     MCP tool for capturing structured validation outcomes for RA tags during task review.
@@ -35,6 +129,11 @@ class CaptureAssumptionValidationTool(BaseTool):
     - Comprehensive parameter validation with actionable error messages
     """
     
+    def __init__(self, database, websocket_manager):
+        super().__init__(database, websocket_manager)
+        # Bound on the first capture; servers may build the tool before a database exists
+        self._write_validation: Optional[Callable[[Dict[str, Any], str, str], Tuple[int, str]]] = None
+    
     async def apply(
         self,
         task_id: str,
@@ -58,222 +157,360 @@ class CaptureAssumptionValidationTool(BaseTool):
         Returns:
             JSON string with success confirmation and validation record details
         """
+        # orjson encodes the flat response dict in C; decode() keeps the str return type
+        return orjson.dumps(await self.apply_raw(
+            task_id, ra_tag_id, outcome, reason, confidence, reviewer_agent_id
+        )).decode()
+
+    async def apply_raw(
+        self,
+        task_id: str,
+        ra_tag_id: str,
+        outcome: str,
+        reason: str,
+        confidence: Optional[int] = None,
+        reviewer_agent_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Capture an assumption validation and return the result as a dict.
+        
+        Same behavior and arguments as apply(); in-process callers use this to
+        skip the JSON encode/decode round trip.
+        
+        Returns:
+            Response dict with success confirmation and validation record details
+        """
         try:
-            # Parameter validation
-            if not task_id:
-                return json.dumps({
-                    "success": False, 
-                    "error": "task_id parameter is required"
-                })
-            
-            if not ra_tag_id:
-                return json.dumps({
-                    "success": False, 
-                    "error": "ra_tag_id parameter is required"
-                })
-            
-            if outcome not in ['validated', 'rejected', 'partial']:
-                return json.dumps({
-                    "success": False, 
-                    "error": "outcome must be one of: validated, rejected, partial"
-                })
-            
-            if not reason:
-                return json.dumps({
-                    "success": False, 
-                    "error": "reason parameter is required"
-                })
-            
-            # Convert task_id to integer
-            try:
-                task_id_int = int(task_id)
-            except ValueError:
-                return json.dumps({
-                    "success": False, 
-                    "error": f"Invalid task_id format: {task_id}"
-                })
-            
-            # Get task details for context auto-population
-            task_details = self.db.get_task_details(task_id_int)
-            if not task_details:
-                return json.dumps({
-                    "success": False, 
-                    "error": f"Task {task_id} not found"
-                })
-            
-            project_id = task_details.get('project_id')
-            epic_id = task_details.get('epic_id')
-            
-            # If project_id is None, get it from the epic
-            if not project_id and epic_id:
-                epic_details = self.db.get_epic_with_project_info(epic_id)
-                if epic_details:
-                    project_id = epic_details.get('project_id')
-            
-            # Auto-populate confidence based on outcome if not provided
-            if confidence is None:
-                confidence_defaults = {
-                    'validated': 90,
-                    'rejected': 10, 
-                    'partial': 75  # Updated to match test expectations
-                }
-                confidence = confidence_defaults[outcome]
-            else:
-                # Convert confidence from string to int if needed (MCP compatibility)
-                if isinstance(confidence, str):
-                    try:
-                        confidence = int(confidence)
-                    except ValueError:
-                        return json.dumps({
-                            "success": False,
-                            "error": "confidence must be a valid integer between 0 and 100"
-                        })
-                
-                # Validate confidence range
-                if not (0 <= confidence <= 100):
-                    return json.dumps({
-                        "success": False,
-                        "error": "confidence must be between 0 and 100"
-                    })
-            
-            # Validate that the ra_tag_id exists in the task's RA tags
-            ra_tags = task_details.get('ra_tags', [])
-            if not ra_tags:
-                return json.dumps({
-                    "success": False,
-                    "error": f"Task {task_id} has no RA tags to validate"
-                })
-            
-            # Find the specific tag by ID
-            target_tag = None
-            for tag in ra_tags:
-                if isinstance(tag, dict) and tag.get('id') == ra_tag_id:
-                    target_tag = tag
-                    break
-            
-            if not target_tag:
-                return json.dumps({
-                    "success": False,
-                    "error": f"RA tag with ID '{ra_tag_id}' not found in task {task_id}"
-                })
-            
-            # Auto-populate reviewer_agent_id if not provided
-            if not reviewer_agent_id:
-                # Try to get from session context first
-                session_context = self._get_session_context()
-                if session_context and session_context.get('agent_id'):
-                    reviewer_agent_id = session_context['agent_id']
-                else:
-                    # Standard mode assumption: Use generic reviewer ID as fallback
-                    reviewer_agent_id = "mcp-reviewer-agent"
+            error, row = self._prepare_validation(
+                task_id, ra_tag_id, outcome, reason, confidence, reviewer_agent_id
+            )
+            if error:
+                return error
             
             # Get current timestamp for validation and deduplication window
-            current_time = datetime.now(timezone.utc)
-            validated_at = current_time.isoformat().replace('+00:00', 'Z')
+            validated_at, ten_minutes_ago = self._validation_timestamps()
             
-            # Check for duplicate validations within 10-minute window
-            ten_minutes_ago = (current_time - timedelta(minutes=10)).isoformat().replace('+00:00', 'Z')
-            
-            with self.db._connection_lock:
-                cursor = self.db._connection.cursor()
-                
-                # Check for existing validation in 10-minute window using exact tag ID
-                cursor.execute("""
-                    SELECT id FROM assumption_validations 
-                    WHERE task_id = ? 
-                    AND ra_tag_id = ? 
-                    AND validator_id = ?
-                    AND validated_at > ?
-                    LIMIT 1
-                """, (task_id_int, ra_tag_id, reviewer_agent_id, ten_minutes_ago))
-                
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # Update existing record instead of creating duplicate
-                    cursor.execute("""
-                        UPDATE assumption_validations 
-                        SET outcome = ?, confidence = ?, notes = ?, 
-                            context_snapshot = ?, validated_at = ?
-                        WHERE id = ?
-                    """, (
-                        outcome, 
-                        confidence, 
-                        reason,
-                        '',  # context_snapshot - not needed for tag text
-                        validated_at,
-                        existing[0]
-                    ))
-                    
-                    validation_id = existing[0]
-                    operation = "updated"
-                    
-                else:
-                    # Create new validation record with exact tag ID
-                    cursor.execute("""
-                        INSERT INTO assumption_validations 
-                        (task_id, project_id, epic_id, ra_tag_id, validator_id, outcome, 
-                         confidence, notes, context_snapshot, validated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        task_id_int,
-                        project_id,
-                        epic_id, 
-                        ra_tag_id,
-                        reviewer_agent_id,
-                        outcome,
-                        confidence,
-                        reason,
-                        '',  # context_snapshot - not needed for tag text
-                        validated_at
-                    ))
-                    
-                    validation_id = cursor.lastrowid
-                    operation = "created"
-                
-                self.db._connection.commit()
+            write_validation = self._write_validation
+            if write_validation is None:
+                write_validation = self._write_validation = self._make_write_validation()
+            validation_id, operation = write_validation(row, validated_at, ten_minutes_ago)
             
             # Broadcast WebSocket event for real-time updates
             if hasattr(self, 'websocket_manager') and self.websocket_manager is not None:
                 await self.websocket_manager.broadcast({
                     "type": "assumption_validation_captured",
-                    "data": {
-                        "validation_id": validation_id,
-                        "task_id": task_id_int,
-                        "ra_tag_id": ra_tag_id,
-                        "ra_tag_type": target_tag.get('type', ''),
-                        "outcome": outcome,
-                        "confidence": confidence,
-                        "operation": operation
-                    }
+                    "data": _event_data(row, validation_id, operation)
                 })
             
-            return json.dumps({
-                "success": True,
-                "message": f"Assumption validation {operation} successfully",
-                "validation_id": validation_id,
-                "task_id": task_id_int,
-                "ra_tag_id": ra_tag_id,
-                "ra_tag_type": target_tag.get('type', ''),
-                "outcome": outcome,
-                "confidence": confidence,
-                "reviewer": reviewer_agent_id,
-                "operation": operation,
-                "validated_at": validated_at
-            })
+            return _success_response(row, validation_id, operation, validated_at)
             
         except sqlite3.IntegrityError as e:
             logger.error(f"Database constraint violation in capture_assumption_validation: {e}")
-            return json.dumps({
+            return {
                 "success": False, 
                 "error": f"Database constraint violation: {str(e)}"
-            })
+            }
         except Exception as e:
             logger.error(f"Error in capture_assumption_validation: {e}")
-            return json.dumps({
+            return {
                 "success": False, 
                 "error": f"Failed to capture assumption validation: {str(e)}"
+            }
+
+    async def apply_many(self, validations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Capture a batch of assumption validations in a single transaction.
+        
+        Each entry takes the same keyword arguments as apply_raw(). Entries are
+        checked individually and invalid ones get their error response without
+        affecting the rest; valid entries are written in one transaction and
+        announced in a single WebSocket broadcast. Repeated
+        task/tag/reviewer entries within the batch update the same record, as
+        sequential apply() calls would.
+        
+        Args:
+            validations: List of validation argument dicts
+            
+        Returns:
+            Response dicts in the same order as the input validations
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(validations)
+        prepared: List[Tuple[int, Dict[str, Any]]] = []
+        task_relations_cache: Dict[int, Optional[Dict[str, Any]]] = {}
+        
+        for index, validation in enumerate(validations):
+            try:
+                error, row = self._prepare_validation(
+                    task_relations_cache=task_relations_cache, **validation
+                )
+            except Exception as e:
+                logger.error(f"Error in capture_assumption_validation: {e}")
+                error = {
+                    "success": False,
+                    "error": f"Failed to capture assumption validation: {str(e)}"
+                }
+            if error:
+                results[index] = error
+            else:
+                prepared.append((index, row))
+        
+        if not prepared:
+            return results
+        
+        validated_at, ten_minutes_ago = self._validation_timestamps()
+        
+        # Record per task/tag/reviewer: ("row", validation_id) for an existing
+        # record or ("insert", position) for one created earlier in this batch
+        targets: Dict[Tuple[int, str, str], Tuple[str, int]] = {}
+        insert_params: List[Tuple[Any, ...]] = []
+        insert_members: List[List[int]] = []
+        update_params: List[Tuple[Any, ...]] = []
+        operations: Dict[int, Tuple[str, Optional[int]]] = {}
+        
+        try:
+            with self.db._connection_lock, self.db._transaction() as cursor:
+                for index, row in prepared:
+                    key = (row['task_id'], row['ra_tag_id'], row['reviewer'])
+                    target = targets.get(key)
+                    if target is None:
+                        cursor.execute(_SELECT_RECENT_VALIDATION_SQL, key + (ten_minutes_ago,))
+                        existing = cursor.fetchone()
+                        if existing:
+                            target = targets[key] = ("row", existing[0])
+                    
+                    if target is None:
+                        targets[key] = ("insert", len(insert_params))
+                        insert_params.append(_insert_params(row, validated_at))
+                        insert_members.append([index])
+                        operations[index] = ("created", None)
+                    elif target[0] == "insert":
+                        # Later entry wins, matching an insert followed by an update
+                        insert_params[target[1]] = _insert_params(row, validated_at)
+                        insert_members[target[1]].append(index)
+                        operations[index] = ("updated", None)
+                    else:
+                        update_params.append(_update_params(row, validated_at, target[1]))
+                        operations[index] = ("updated", target[1])
+                
+                # Inserts run one at a time so each id is read back from lastrowid
+                for params, members in zip(insert_params, insert_members):
+                    cursor.execute(_INSERT_VALIDATION_SQL, params)
+                    for index in members:
+                        operations[index] = (operations[index][0], cursor.lastrowid)
+                if update_params:
+                    cursor.executemany(_UPDATE_VALIDATION_SQL, update_params)
+        except sqlite3.IntegrityError as e:
+            logger.error(f"Database constraint violation in capture_assumption_validation: {e}")
+            error = {"success": False, "error": f"Database constraint violation: {str(e)}"}
+            for index, _ in prepared:
+                results[index] = error
+            return results
+        except Exception as e:
+            logger.error(f"Error in capture_assumption_validation: {e}")
+            error = {"success": False, "error": f"Failed to capture assumption validation: {str(e)}"}
+            for index, _ in prepared:
+                results[index] = error
+            return results
+        
+        events = []
+        for index, row in prepared:
+            operation, validation_id = operations[index]
+            results[index] = _success_response(row, validation_id, operation, validated_at)
+            events.append(_event_data(row, validation_id, operation))
+        
+        # One broadcast for the whole batch instead of one per validation
+        if hasattr(self, 'websocket_manager') and self.websocket_manager is not None:
+            await self.websocket_manager.broadcast({
+                "type": "assumption_validations_captured",
+                "data": {"validations": events}
             })
+        
+        return results
+
+    def _prepare_validation(
+        self,
+        task_id: str,
+        ra_tag_id: str,
+        outcome: str,
+        reason: str,
+        confidence: Optional[int] = None,
+        reviewer_agent_id: Optional[str] = None,
+        task_relations_cache: Optional[Dict[int, Optional[Dict[str, Any]]]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Validate capture arguments and resolve the task context to write.
+        
+        Returns:
+            (error_response, None) when the arguments are rejected, otherwise
+            (None, row) with the fields of the validation record
+        """
+        # Parameter validation
+        if not task_id:
+            return {
+                "success": False, 
+                "error": "task_id parameter is required"
+            }, None
+        
+        if not ra_tag_id:
+            return {
+                "success": False, 
+                "error": "ra_tag_id parameter is required"
+            }, None
+        
+        if outcome not in DEFAULT_CONFIDENCE_BY_OUTCOME:
+            return {
+                "success": False, 
+                "error": "outcome must be one of: validated, rejected, partial"
+            }, None
+        
+        if not reason:
+            return {
+                "success": False, 
+                "error": "reason parameter is required"
+            }, None
+        
+        # Convert task_id to integer
+        try:
+            task_id_int = int(task_id)
+        except ValueError:
+            return {
+                "success": False, 
+                "error": f"Invalid task_id format: {task_id}"
+            }, None
+        
+        # Get task, epic and project context for auto-population in one JOIN query
+        if task_relations_cache is None:
+            task_relations = self.db.get_task_details_with_relations(task_id_int)
+        elif task_id_int in task_relations_cache:
+            task_relations = task_relations_cache[task_id_int]
+        else:
+            task_relations = task_relations_cache[task_id_int] = (
+                self.db.get_task_details_with_relations(task_id_int)
+            )
+        if not task_relations:
+            return {
+                "success": False, 
+                "error": f"Task {task_id} not found"
+            }, None
+        
+        task_details = task_relations['task']
+        
+        # Auto-populate confidence based on outcome if not provided
+        if confidence is None:
+            confidence = DEFAULT_CONFIDENCE_BY_OUTCOME[outcome]
+        else:
+            # Convert confidence from string to int if needed (MCP compatibility)
+            if isinstance(confidence, str):
+                try:
+                    confidence = int(confidence)
+                except ValueError:
+                    return {
+                        "success": False,
+                        "error": "confidence must be a valid integer between 0 and 100"
+                    }, None
+            
+            # Validate confidence range
+            if not (0 <= confidence <= 100):
+                return {
+                    "success": False,
+                    "error": "confidence must be between 0 and 100"
+                }, None
+        
+        # Validate that the ra_tag_id exists in the task's RA tags
+        ra_tags = task_details.get('ra_tags', [])
+        if not ra_tags:
+            return {
+                "success": False,
+                "error": f"Task {task_id} has no RA tags to validate"
+            }, None
+        
+        # Find the specific tag by ID
+        target_tag = None
+        for tag in ra_tags:
+            if isinstance(tag, dict) and tag.get('id') == ra_tag_id:
+                target_tag = tag
+                break
+        
+        if not target_tag:
+            return {
+                "success": False,
+                "error": f"RA tag with ID '{ra_tag_id}' not found in task {task_id}"
+            }, None
+        
+        # Auto-populate reviewer_agent_id if not provided
+        if not reviewer_agent_id:
+            # Try to get from session context first
+            session_context = self._get_session_context()
+            if session_context and session_context.get('agent_id'):
+                reviewer_agent_id = session_context['agent_id']
+            else:
+                # Standard mode assumption: Use generic reviewer ID as fallback
+                reviewer_agent_id = "mcp-reviewer-agent"
+        
+        return None, {
+            'task_id': task_id_int,
+            'project_id': task_relations['project']['id'],
+            'epic_id': task_relations['epic']['id'],
+            'ra_tag_id': ra_tag_id,
+            'ra_tag_type': target_tag.get('type', ''),
+            'reviewer': reviewer_agent_id,
+            'outcome': outcome,
+            'confidence': confidence,
+            'reason': reason,
+        }
+
+    def _make_write_validation(self) -> Callable[[Dict[str, Any], str, str], Tuple[int, str]]:
+        """
+        Build the single-capture write path with the connection, its lock and the
+        upsert statements bound as closure locals.
+        
+        Built once per tool instance so later captures skip the self.db attribute
+        lookups and global SQL lookups on the hot path.
+        
+        Returns:
+            Function taking (row, validated_at, ten_minutes_ago) and returning
+            (validation_id, operation)
+        """
+        connection = self.db._connection
+        connection_lock = self.db._connection_lock
+        select_sql = _SELECT_RECENT_VALIDATION_SQL
+        update_sql = _UPDATE_VALIDATION_SQL
+        insert_sql = _INSERT_VALIDATION_SQL
+        
+        def write_validation(
+            row: Dict[str, Any], validated_at: str, ten_minutes_ago: str
+        ) -> Tuple[int, str]:
+            with connection_lock:
+                cursor = connection.cursor()
+                
+                # Check for existing validation in 10-minute window using exact tag ID
+                cursor.execute(select_sql, (
+                    row['task_id'], row['ra_tag_id'], row['reviewer'], ten_minutes_ago
+                ))
+                existing = cursor.fetchone()
+                
+                if existing:
+                    # Update existing record instead of creating duplicate
+                    cursor.execute(update_sql, _update_params(row, validated_at, existing[0]))
+                    return existing[0], "updated"
+                
+                # Create new validation record with exact tag ID
+                cursor.execute(insert_sql, _insert_params(row, validated_at))
+                
+                # The connection runs in autocommit mode, so each write is already
+                # durable; an explicit commit() would only end a transaction or
+                # savepoint opened by the caller
+                return cursor.lastrowid, "created"
+        
+        return write_validation
+
+    @staticmethod
+    def _validation_timestamps() -> Tuple[str, str]:
+        """Return the validated_at timestamp and the start of the deduplication window."""
+        current_time = datetime.now(timezone.utc)
+        validated_at = current_time.isoformat().replace('+00:00', 'Z')
+        ten_minutes_ago = (current_time - timedelta(minutes=10)).isoformat().replace('+00:00', 'Z')
+        return validated_at, ten_minutes_ago
 
     def _get_session_context(self) -> Optional[Dict[str, Any]]:
         """
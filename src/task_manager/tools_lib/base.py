@@ -5,13 +5,14 @@ Provides the abstract BaseTool class with database and WebSocket integration,
 shared utilities, and common functionality for all tool implementations.
 """
 
-import json
 import logging
 import sqlite3
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 
+import orjson
+
 from ..database import TaskDatabase
 from ..api import ConnectionManager
 
@@ -77,7 +78,7 @@ class BaseTool(ABC):
             "message": message,
             **kwargs
         }
-        return json.dumps(response)
+        return orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS).decode()
 
     def _format_error_response(self, message: str, **kwargs) -> str:
         """
@@ -98,7 +99,7 @@ class BaseTool(ABC):
             "message": message,
             **kwargs
         }
-        return json.dumps(response)
+        return orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS).decode()
 
     async def _broadcast_event(self, event_type: str, **event_data):
         """
@@ -127,6 +128,36 @@ class BaseTool(ABC):
             # Standard Mode: Comprehensive error handling without blocking
             logger.warning(f"Failed to broadcast event {event_type}: {e}")
 
+    async def _broadcast_events(self, *events: Dict[str, Any]):
+        """
+        Broadcast several events from one tool action, in order.
+
+        Managers exposing broadcast_many deliver the whole group in one pass over
+        their connections; others receive one broadcast per event. As with
+        _broadcast_event, failures are logged and never raised.
+
+        Args:
+            *events: Event dicts, each with a "type" key plus its data fields
+        """
+        if not events:
+            return
+        timestamp = datetime.now(timezone.utc).isoformat() + 'Z'
+        stamped = [{"type": event["type"], "timestamp": timestamp, **event} for event in events]
+        if hasattr(self.websocket_manager, "broadcast_many"):
+            try:
+                await self.websocket_manager.broadcast_many(stamped)
+            except Exception as e:
+                logger.warning(f"Failed to broadcast events {[event['type'] for event in events]}: {e}")
+            return
+        
+        send = getattr(self.websocket_manager, "optimized_broadcast", None) or self.websocket_manager.broadcast
+        for event in stamped:
+            # A failed event must not stop the rest of the group
+            try:
+                await send(event)
+            except Exception as e:
+                logger.warning(f"Failed to broadcast {event['type']} event: {e}")
+
     def _parse_boolean(self, value: Optional[str], default: bool = True) -> bool:
         """
         Parse string boolean value to actual boolean.
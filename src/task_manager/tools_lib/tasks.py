@@ -175,13 +175,10 @@ class AcquireTaskLock(BaseTool):
             # Clear any expired locks and broadcast unlock events
             try:
                 expired_ids = self.db.cleanup_expired_locks_with_ids()
-                for eid in expired_ids:
-                    await self._broadcast_event(
-                        "task.unlocked",
-                        task_id=eid,
-                        agent_id=None,
-                        reason="lock_expired"
-                    )
+                await self._broadcast_events(*(
+                    {"type": "task.unlocked", "task_id": eid, "agent_id": None, "reason": "lock_expired"}
+                    for eid in expired_ids
+                ))
             except Exception:
                 pass
 
@@ -317,13 +314,10 @@ class UpdateTaskStatus(BaseTool):
             # Clear any expired locks and broadcast unlock events
             try:
                 expired_ids = self.db.cleanup_expired_locks_with_ids()
-                for eid in expired_ids:
-                    await self._broadcast_event(
-                        "task.unlocked",
-                        task_id=eid,
-                        agent_id=None,
-                        reason="lock_expired"
-                    )
+                await self._broadcast_events(*(
+                    {"type": "task.unlocked", "task_id": eid, "agent_id": None, "reason": "lock_expired"}
+                    for eid in expired_ids
+                ))
             except Exception:
                 pass
 
@@ -385,23 +379,22 @@ class UpdateTaskStatus(BaseTool):
                 }
                 ui_status = ui_status_map.get(db_status, db_status)
 
-                # Broadcast status change event
-                await self._broadcast_event(
-                    "task.status_changed",
-                    task_id=task_id_int,
-                    status=ui_status,
-                    agent_id=agent_id,
-                    lock_released=lock_released
-                )
-                
-                # Also broadcast lock release event if applicable
+                # Broadcast the status change, followed by the lock release if applicable
+                events = [{
+                    "type": "task.status_changed",
+                    "task_id": task_id_int,
+                    "status": ui_status,
+                    "agent_id": agent_id,
+                    "lock_released": lock_released
+                }]
                 if lock_released:
-                    await self._broadcast_event(
-                        "task.unlocked",
-                        task_id=task_id_int,
-                        agent_id=agent_id,
-                        reason="auto_release_on_completion"
-                    )
+                    events.append({
+                        "type": "task.unlocked",
+                        "task_id": task_id_int,
+                        "agent_id": agent_id,
+                        "reason": "auto_release_on_completion"
+                    })
+                await self._broadcast_events(*events)
                 
                 logger.info(f"Task {task_id} status updated to '{db_status}' by agent {agent_id}")
                 
@@ -834,7 +827,8 @@ class CreateTaskTool(BaseTool):
                 project_data=project_data,
                 epic_data=epic_data,
                 auto_flags=auto_flags,
-                session_id=session_id
+                session_id=session_id,
+                auto_switch=True
             )
             
             # Broadcast enriched event using ConnectionManager's new method
@@ -1055,13 +1049,10 @@ class UpdateTaskTool(BaseTool):
             # with other locking tools for system-wide lock hygiene
             try:
                 expired_ids = self.db.cleanup_expired_locks_with_ids()
-                for eid in expired_ids:
-                    await self._broadcast_event(
-                        "task.unlocked",
-                        task_id=eid,
-                        agent_id=None,
-                        reason="lock_expired"
-                    )
+                await self._broadcast_events(*(
+                    {"type": "task.unlocked", "task_id": eid, "agent_id": None, "reason": "lock_expired"}
+                    for eid in expired_ids
+                ))
             except Exception:
                 # #SUGGEST_ERROR_HANDLING: Lock cleanup errors should not block update operations
                 pass
@@ -1176,17 +1167,21 @@ class UpdateTaskTool(BaseTool):
                             "agent_id": agent_id
                         }]
                         
-                        # Generate logs appended payload
-                        logs_payload = generate_logs_appended_payload(
-                            task_id=task_id_int,
-                            log_entries=new_log_entries
-                        )
-                        
-                        # Broadcast task.logs.appended event
-                        if hasattr(self.websocket_manager, "broadcast_enriched_event"):
-                            await self.websocket_manager.broadcast_enriched_event("task.logs.appended", logs_payload)
+                        # Managers that coalesce logs merge rapid appends into one event
+                        if hasattr(self.websocket_manager, "enqueue_logs"):
+                            self.websocket_manager.enqueue_logs(task_id_int, new_log_entries)
                         else:
-                            await self._broadcast_event("task.logs.appended", **logs_payload)
+                            # Generate logs appended payload
+                            logs_payload = generate_logs_appended_payload(
+                                task_id=task_id_int,
+                                log_entries=new_log_entries
+                            )
+                            
+                            # Broadcast task.logs.appended event
+                            if hasattr(self.websocket_manager, "broadcast_enriched_event"):
+                                await self.websocket_manager.broadcast_enriched_event("task.logs.appended", logs_payload)
+                            else:
+                                await self._broadcast_event("task.logs.appended", **logs_payload)
                 
                 # Broadcast additional lock events if relevant
                 # Lock event broadcasting provides separate lock state notifications
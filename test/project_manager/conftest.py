@@ -13,6 +13,8 @@ import json
 import multiprocessing
 import os
 import pytest
+import pytest_asyncio.plugin
+import shutil
 import signal
 import socket
 import tempfile
@@ -33,12 +35,45 @@ import sys
 project_root = Path(__file__).parent.parent.parent / "src"
 sys.path.insert(0, str(project_root))
 
+# The API lifespan opens DATABASE_PATH at import time; give every xdist worker
+# its own file instead of sharing project_manager.db in the working directory.
+# The app imports before any fixture runs, so tmp_path_factory is too late here;
+# the directory is removed again in pytest_sessionfinish
+_database_dir = None
+if "DATABASE_PATH" not in os.environ:
+    _database_dir = tempfile.mkdtemp(prefix="pm-test-")
+    os.environ["DATABASE_PATH"] = os.path.join(_database_dir, "project_manager.db")
+
+# Loops created for async tests would otherwise inherit asyncio debug mode
+# (per-task source tracebacks, slow-callback timing) from the environment;
+# any non-empty value enables it, so "0" has to be removed rather than set
+os.environ.pop("PYTHONASYNCIODEBUG", None)
+
 from task_manager.database import TaskDatabase
 from task_manager.api import app as fastapi_app, connection_manager, get_database
 from task_manager.mcp_server import create_mcp_server
 from task_manager.cli import main as cli_main
 from task_manager.importer import import_project_from_file
 
+try:
+    import uvloop
+except ImportError:  # uvicorn[standard] only pulls in uvloop off Windows
+    uvloop = None
+
+
+# pytest-asyncio selects event loops through this hook from 1.4 on; older
+# releases would reject the unknown hook, so it is only defined when usable
+if uvloop is not None and hasattr(pytest_asyncio.plugin, "PytestAsyncioSpecs"):
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop for cheaper task scheduling per await."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the per-worker database directory created at import time."""
+    if _database_dir is not None:
+        shutil.rmtree(_database_dir, ignore_errors=True)
+
 
 class IntegrationTestDatabase:
     """
@@ -425,8 +460,15 @@ def test_project_yaml(tmp_path):
     return str(project_file)
 
 
+@pytest.fixture(scope="module")
+def shared_api_client():
+    """Provide one FastAPI test client (and app lifespan) shared across a test module."""
+    with TestClient(fastapi_app) as client:
+        yield client
+
+
 @pytest.fixture  
-def api_client(integration_db):
+def api_client(shared_api_client, integration_db):
     """Provide FastAPI test client with database override."""
     # Override database dependency to use test database
     def get_test_database():
@@ -434,8 +476,7 @@ def api_client(integration_db):
         
     fastapi_app.dependency_overrides[get_database] = get_test_database
     
-    with TestClient(fastapi_app) as client:
-        yield client
+    yield shared_api_client
         
     # Cleanup dependency override
     fastapi_app.dependency_overrides.clear()
@@ -6,22 +6,46 @@ according to RA-Light mode requirements for thorough validation.
 """
 
 import asyncio
-import json
+import orjson
 import pytest
 import tempfile
 import os
+from datetime import datetime, timezone
 from typing import Dict, Any, List
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from fastapi.testclient import TestClient
 from fastapi import FastAPI
 import websockets
 import threading
 import time
 
 # Import the modules under test  
-from task_manager.api import app, connection_manager, get_database
+from task_manager.api import (
+    BROADCAST_BATCH_SIZE, SEND_QUEUE_SIZE, ConnectionManager, app, connection_manager, get_database,
+    extract_session_id, generate_enriched_task_payload, generate_enriched_task_payloads_batch,
+    generate_logs_appended_payload, parse_capabilities, _TASK_KEYS, _VARIANTS
+)
 from task_manager.database import TaskDatabase
+from task_manager import api, assumptions
+from task_manager.routers import knowledge
+
+# Routers declare their own database dependency, so each needs its own override
+DATABASE_DEPENDENCIES = (get_database, assumptions.get_database, knowledge.get_database)
+
+
+class RecordingWebSocket:
+    """Lightweight WebSocket stub that records sent messages without AsyncMock overhead."""
+
+    __slots__ = ("sent_messages",)
+
+    def __init__(self):
+        self.sent_messages: List[str] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        self.sent_messages.append(message)
 
 
 class TestDatabaseFixture:
@@ -69,18 +93,18 @@ def test_db():
 
 
 @pytest.fixture
-def client(test_db):
+def client(shared_api_client, test_db):
     """Provide FastAPI test client with database dependency override."""
     db, fixture = test_db
     
-    # Override database dependency
+    # Override database dependency for every router
     def get_test_database():
         return db
     
-    app.dependency_overrides[get_database] = get_test_database
+    for dependency in DATABASE_DEPENDENCIES:
+        app.dependency_overrides[dependency] = get_test_database
     
-    with TestClient(app) as test_client:
-        yield test_client, fixture
+    yield shared_api_client, fixture
     
     # Clean up dependency override
     app.dependency_overrides.clear()
@@ -411,23 +435,12 @@ class TestConnectionManager:
         # Clear any existing connections from other tests
         connection_manager.active_connections.clear()
         
-        # Create multiple mock WebSocket connections
-        mock_ws1 = AsyncMock()
-        mock_ws2 = AsyncMock()
-        mock_ws3 = AsyncMock()
-        
-        mock_ws1.accept = AsyncMock()
-        mock_ws2.accept = AsyncMock() 
-        mock_ws3.accept = AsyncMock()
-        
-        mock_ws1.send_text = AsyncMock()
-        mock_ws2.send_text = AsyncMock()
-        mock_ws3.send_text = AsyncMock()
+        # Create multiple recording WebSocket connections
+        connections = [RecordingWebSocket() for _ in range(3)]
         
         # Connect all WebSockets
-        await connection_manager.connect(mock_ws1)
-        await connection_manager.connect(mock_ws2)
-        await connection_manager.connect(mock_ws3)
+        for ws in connections:
+            await connection_manager.connect(ws)
         
         assert connection_manager.get_connection_count() == 3
         
@@ -436,10 +449,209 @@ class TestConnectionManager:
         await connection_manager.broadcast(test_event)
         
         # Verify all connections received the message
-        expected_message = json.dumps(test_event)
-        mock_ws1.send_text.assert_called_once_with(expected_message)
-        mock_ws2.send_text.assert_called_once_with(expected_message)
-        mock_ws3.send_text.assert_called_once_with(expected_message)
+        expected_message = orjson.dumps(test_event).decode()
+        for ws in connections:
+            assert ws.sent_messages == [expected_message]
+    
+    @pytest.mark.asyncio
+    async def test_connection_manager_signals_broadcast_done(self):
+        """Test that broadcast_done is set once a broadcast is queued, even with no clients."""
+        manager = ConnectionManager()
+        assert not manager.broadcast_done.is_set()
+        
+        await manager.broadcast({"type": "test", "data": "no_clients"})
+        assert manager.broadcast_done.is_set()
+        
+        manager.broadcast_done.clear()
+        ws = RecordingWebSocket()
+        await manager.connect(ws)
+        await manager.broadcast({"type": "test", "data": "one_client"})
+        assert manager.broadcast_done.is_set()
+        await manager.flush()
+        assert len(ws.sent_messages) == 1
+    
+    @pytest.mark.asyncio
+    async def test_connection_manager_broadcasts_in_batches(self):
+        """Test large broadcasts yield to the event loop between batches."""
+        manager = ConnectionManager()
+        connections = [RecordingWebSocket() for _ in range(BROADCAST_BATCH_SIZE * 2 + 1)]
+        for ws in connections:
+            await manager.connect(ws)
+        
+        with patch("task_manager.api.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await manager.broadcast({"type": "test", "data": "many_clients"})
+        
+        assert sleep.await_count == 2
+        await manager.flush()
+        assert all(len(ws.sent_messages) == 1 for ws in connections)
+    
+    @pytest.mark.asyncio
+    async def test_close_stops_writer_tasks(self):
+        """Test close() cancels every client writer task."""
+        manager = ConnectionManager()
+        for _ in range(3):
+            await manager.connect(RecordingWebSocket())
+        writers = list(manager._writers.values())
+        
+        await manager.close()
+        
+        assert all(writer.done() for writer in writers)
+        assert manager._writers == {} and manager._queues == {}
+    
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_oldest_messages(self):
+        """Test a stalled client's queue drops its oldest messages without delaying others."""
+        manager = ConnectionManager()
+        release = asyncio.Event()
+        
+        class StalledWebSocket(RecordingWebSocket):
+            __slots__ = ()
+            
+            async def send_text(self, message: str):
+                await release.wait()
+                self.sent_messages.append(message)
+        
+        fast, slow = RecordingWebSocket(), StalledWebSocket()
+        await manager.connect(fast)
+        await manager.connect(slow)
+        
+        total = SEND_QUEUE_SIZE + 10
+        for seq in range(total):
+            await manager.broadcast({"seq": seq})
+            await asyncio.sleep(0)  # Let writers run, as between separate events
+        
+        assert len(fast.sent_messages) == total
+        # One message is in flight with the writer, the queue holds the newest ones
+        assert manager.events_dropped == total - SEND_QUEUE_SIZE - 1
+        
+        release.set()
+        await manager.flush()
+        received = [orjson.loads(message)["seq"] for message in slow.sent_messages]
+        assert received == [0] + list(range(total - SEND_QUEUE_SIZE, total))
+    
+    @pytest.mark.asyncio
+    async def test_enriched_event_timestamp_format(self):
+        """Test enriched events carry a second-resolution UTC timestamp."""
+        manager = ConnectionManager()
+        ws = RecordingWebSocket()
+        await manager.connect(ws)
+        
+        await manager.broadcast_enriched_event("task.created", {"task": {"id": 1}})
+        await manager.broadcast_enriched_event("task.updated", {"task": {"id": 1}})
+        await manager.flush()
+        
+        first, second = (orjson.loads(message) for message in ws.sent_messages)
+        assert first["data"] == {"task": {"id": 1}}
+        parsed = datetime.strptime(first["timestamp"], "%Y-%m-%dT%H:%M:%SZ")
+        assert abs(parsed.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).total_seconds() < 5
+        assert second["timestamp"] >= first["timestamp"]
+    
+    @pytest.mark.asyncio
+    async def test_auto_switch_sent_only_to_subscribed_clients(self):
+        """Test auto_switch_recommended reaches only clients that negotiated it."""
+        manager = ConnectionManager()
+        subscribed, plain = RecordingWebSocket(), RecordingWebSocket()
+        await manager.connect(subscribed, capabilities=parse_capabilities("auto_switch"))
+        await manager.connect(plain)
+        
+        data = generate_enriched_task_payload({"id": 1}, session_id="s", auto_switch=True)
+        await manager.broadcast_enriched_event("task.created", data)
+        await manager.flush()
+        
+        assert orjson.loads(subscribed.sent_messages[0])["data"]["auto_switch_recommended"] is True
+        slim = orjson.loads(plain.sent_messages[0])["data"]
+        assert "auto_switch_recommended" not in slim
+        assert slim["initiator"] == "s"
+        
+        await manager.disconnect(subscribed)
+        assert manager.connection_capabilities == {}
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_accepts_serialized_payload(self):
+        """Test pre-serialized bytes are sent as the same text frame as the dict."""
+        manager = ConnectionManager()
+        ws = RecordingWebSocket()
+        await manager.connect(ws)
+        
+        event = {"type": "test", "data": {"id": 1}}
+        await manager.broadcast(event)
+        await manager.broadcast(orjson.dumps(event))
+        await manager.flush()
+        
+        assert ws.sent_messages[0] == ws.sent_messages[1]
+    
+    @pytest.mark.asyncio
+    async def test_log_appends_coalesced_into_one_event(self):
+        """Test log batches queued within the window go out as one merged event."""
+        manager = ConnectionManager()
+        manager.active_connections.add(RecordingWebSocket())
+        manager.broadcast_enriched_event = AsyncMock()
+        
+        manager.enqueue_logs(7, [{"seq": 3}])
+        manager.enqueue_logs(7, [{"seq": 1}, {"seq": 2}], session_id="s")
+        manager.enqueue_logs(7, [{"seq": 4}])
+        await manager._log_flush_task
+        
+        manager.broadcast_enriched_event.assert_awaited_once()
+        event_type, payload = manager.broadcast_enriched_event.await_args[0]
+        assert event_type == "task.logs.appended"
+        assert payload["log_count"] == 4
+        assert payload["sequence_range"] == {"start": 1, "end": 4}
+        assert payload["initiator"] == "s"
+        assert manager._log_flush_task is None
+    
+    @pytest.mark.asyncio
+    async def test_close_sends_pending_log_entries(self):
+        """Test log entries still inside the coalescing window are sent on close()."""
+        manager = ConnectionManager()
+        ws = RecordingWebSocket()
+        await manager.connect(ws)
+        
+        manager.enqueue_logs(7, [{"seq": 1}])
+        await manager.close()
+        
+        assert manager._log_flush_task is None
+        (message,) = ws.sent_messages
+        assert orjson.loads(message)["data"]["log_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_log_flush_is_logged(self, caplog):
+        """Test a failing coalesced broadcast is logged rather than left unretrieved."""
+        manager = ConnectionManager()
+        manager.active_connections.add(RecordingWebSocket())
+        manager.broadcast_enriched_event = AsyncMock(side_effect=RuntimeError("send failed"))
+        
+        manager.enqueue_logs(7, [{"seq": 1}])
+        flush_task = manager._log_flush_task
+        await asyncio.gather(flush_task, return_exceptions=True)
+        await asyncio.sleep(0)  # Done callbacks run on the next loop iteration
+        
+        assert "Failed to broadcast coalesced log entries: send failed" in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_enriched_payload_not_built_without_clients(self):
+        """Test enriched events cost nothing when no client is connected."""
+        manager = ConnectionManager()
+        manager.broadcast = AsyncMock()
+        
+        with patch.object(api, "generate_enriched_task_payload") as build:
+            await manager.maybe_broadcast_enriched(
+                "task.created", lambda: api.generate_enriched_task_payload({"id": 1})
+            )
+            await manager.broadcast_enriched_event("task.updated", {"task": {"id": 1}})
+        
+        build.assert_not_called()
+        manager.broadcast.assert_not_called()
+        assert manager.broadcast_done.is_set()
+        
+        manager.enqueue_logs(1, [{"seq": 1}])
+        assert manager._log_flush_task is None
+    
+    def test_parse_capabilities(self):
+        """Test parsing of the caps handshake query parameter."""
+        assert parse_capabilities(None) == set()
+        assert parse_capabilities("") == set()
+        assert parse_capabilities("auto_switch, compact,") == {"auto_switch", "compact"}
     
     @pytest.mark.asyncio
     async def test_connection_manager_failed_send(self):
@@ -477,6 +689,133 @@ class TestConnectionManager:
         assert connection_manager.get_connection_count() == 0
 
 
+
+class TestEnrichedPayloadVariants:
+    """Test the per-shape enriched payload builders."""
+    
+    def test_one_variant_per_optional_section_combination(self):
+        """Test every project/epic/flags/session combination has a builder."""
+        assert len(_VARIANTS) == 16
+    
+    def test_variants_include_only_present_sections(self):
+        """Test each builder emits exactly the sections that were supplied."""
+        task = {"id": 1, "name": "Task", "status": "pending"}
+        optional = {
+            "project": {"id": 2, "name": "Project"},
+            "epic": {"id": 3, "name": "Epic", "project_id": 2},
+            "flags": {"project_created": True},
+            "initiator": "session-1",
+        }
+        for mask in range(16):
+            args = [value if mask & (1 << bit) else None for bit, value in enumerate(optional.values())]
+            payload = generate_enriched_task_payload(task, *args)
+            
+            expected = {name for bit, name in enumerate(optional) if mask & (1 << bit)}
+            assert set(payload) == {"task"} | expected
+            assert payload["task"]["description"] == ""
+            for name in expected:
+                assert payload[name] == optional[name]
+    
+    def test_task_section_follows_task_keys(self):
+        """Test the task section lists _TASK_KEYS in order, with defaults for missing keys."""
+        payload = generate_enriched_task_payload({"name": "Incomplete", "extra": 1})
+        assert tuple(payload["task"]) == _TASK_KEYS
+        assert payload["task"]["id"] is None
+        assert payload["task"]["description"] == ""
+    
+    def test_compact_flags_mask(self):
+        """Test compact_flags swaps the flags dict for a packed int."""
+        flags = {"project_created": True, "epic_created": True, "task_moved": False}
+        payload = generate_enriched_task_payload({"id": 1}, auto_flags=flags, compact_flags=True)
+        assert payload["flags_mask"] == 3
+        assert "flags" not in payload
+        assert generate_enriched_task_payload({"id": 1}, auto_flags=flags)["flags"] == flags
+        
+        # Full context with only epic_created set, as sent on task creation
+        payload = generate_enriched_task_payload(
+            {"id": 1}, {"id": 2, "name": "Project"}, {"id": 3, "name": "Epic", "project_id": 2},
+            {"project_created": False, "epic_created": True}, "s", auto_switch=True, compact_flags=True
+        )
+        assert payload["flags_mask"] == 2
+        assert "flags" not in payload
+        assert set(payload) == {"task", "project", "epic", "initiator", "auto_switch_recommended", "flags_mask"}
+    
+    @pytest.mark.parametrize("uniform_shape, expected_keys", [
+        (False, {"task"}),
+        (True, {"task", "project", "epic"}),
+    ])
+    def test_uniform_shape(self, uniform_shape, expected_keys):
+        """Test uniform_shape fills missing project/epic context with placeholders."""
+        payload = generate_enriched_task_payload({"id": 1}, uniform_shape=uniform_shape)
+        assert set(payload) == expected_keys
+        if uniform_shape:
+            assert payload["project"] == {"id": None, "name": ""}
+            assert payload["epic"] == {"id": None, "name": "", "project_id": None}
+    
+    def test_batch_payloads_share_context(self):
+        """Test batch generation matches per-task payloads and shares context sections."""
+        tasks = [{"id": task_id, "name": f"Task {task_id}", "status": "pending"} for task_id in range(1000)]
+        project = {"id": 2, "name": "Project"}
+        epic = {"id": 3, "name": "Epic", "project_id": 2}
+        
+        payloads = generate_enriched_task_payloads_batch(tasks, project, epic, session_id="s")
+        
+        assert len(payloads) == 1000
+        assert payloads[0]["project"] is payloads[1]["project"]
+        assert payloads[999] == generate_enriched_task_payload(tasks[999], project, epic, session_id="s")
+        assert generate_enriched_task_payloads_batch([]) == []
+    
+    def test_auto_switch_requires_session(self):
+        """Test the auto-switch recommendation is opt-in and tied to a session."""
+        task = {"id": 1}
+        assert "auto_switch_recommended" not in generate_enriched_task_payload(task, auto_switch=True)
+        assert "auto_switch_recommended" not in generate_enriched_task_payload(task, session_id="s")
+        payload = generate_enriched_task_payload(task, session_id="s", auto_switch=True)
+        assert payload["auto_switch_recommended"] is True
+
+
+
+
+class TestSessionIdExtraction:
+    """Test client session ID extraction and validation."""
+    
+    @pytest.mark.parametrize("session_id, expected", [
+        ("session_abc123", "session_abc123"),
+        ("session-with-dashes", "session-with-dashes"),
+        ("", None),
+        ("bad session!", None),
+        (123, None),
+    ])
+    def test_validate_rejects_malformed_ids(self, session_id, expected):
+        """Test validate=True keeps letters, digits, '-' and '_' only."""
+        assert extract_session_id({"client_session_id": session_id}, validate=True) == expected
+    
+    def test_no_validation_by_default(self):
+        """Test IDs are returned unchanged without validate."""
+        assert extract_session_id({"client_session_id": "bad session!"}) == "bad session!"
+        assert extract_session_id({"client_session_id": ""}) == ""
+        assert extract_session_id({}, validate=True) is None
+
+
+class TestLogsAppendedPayload:
+    """Test task.logs.appended payload generation."""
+    
+    def test_sequence_range_large_batch(self):
+        """Test sequence range over a large, out-of-order batch."""
+        log_entries = [{"seq": seq, "kind": "update"} for seq in range(100, 200)]
+        log_entries.reverse()
+        log_entries.append({"kind": "update"})  # Entries without seq count as 0
+        
+        payload = generate_logs_appended_payload(789, log_entries)
+        
+        assert payload["sequence_range"] == {"start": 0, "end": 199}
+        assert payload["log_count"] == 101
+    
+    def test_no_sequence_range_without_entries(self):
+        """Test an empty batch carries no sequence range."""
+        assert "sequence_range" not in generate_logs_appended_payload(789, [])
+
+
 class TestWebSocketIntegration:
     """Integration tests for WebSocket functionality."""
     
@@ -602,14 +941,12 @@ class TestConcurrencyAndPerformance:
     @pytest.mark.asyncio
     async def test_websocket_broadcast_performance(self):
         """Test WebSocket broadcast performance with multiple connections."""
-        # Create multiple mock connections
+        # Create multiple recording connections
         connections = []
         for i in range(50):  # Test with 50 connections
-            mock_ws = AsyncMock()
-            mock_ws.accept = AsyncMock()
-            mock_ws.send_text = AsyncMock()
-            connections.append(mock_ws)
-            await connection_manager.connect(mock_ws)
+            ws = RecordingWebSocket()
+            connections.append(ws)
+            await connection_manager.connect(ws)
         
         assert connection_manager.get_connection_count() == 50
         
@@ -627,9 +964,9 @@ class TestConcurrencyAndPerformance:
         assert broadcast_time < 1.0
         
         # Verify all connections received message
-        expected_message = json.dumps(test_event)
+        expected_message = orjson.dumps(test_event).decode()
         for ws in connections:
-            ws.send_text.assert_called_once_with(expected_message)
+            assert ws.sent_messages == [expected_message]
         
         # Clean up connections
         for ws in connections:
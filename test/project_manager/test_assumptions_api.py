@@ -0,0 +1,409 @@
+"""
+Test suite for the assumption intelligence REST endpoints.
+
+Covers /api/assumptions/insights, /recent, /tag-types and /tag-details against
+a real temporary database, including RA tag resolution from task ra_tags JSON.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from task_manager import assumptions
+from task_manager.api import app
+from task_manager.database import TaskDatabase
+
+
+RA_TAGS = (
+    {"id": "ra_tag_impl0001", "type": "COMPLETION_DRIVE_IMPL", "text": "#COMPLETION_DRIVE_IMPL: Cache strategy"},
+    {"id": "ra_tag_error001", "type": "SUGGEST_ERROR_HANDLING", "text": "#SUGGEST_ERROR_HANDLING: Retry on busy"},
+    {"id": "ra_tag_patt0001", "type": "PATTERN_MOMENTUM", "text": "#PATTERN_MOMENTUM: Reused router layout"},
+)
+RA_TAGS_JSON = json.dumps(RA_TAGS)
+LEGACY_RA_TAGS_JSON = json.dumps(["#COMPLETION_DRIVE_IMPL: legacy string tag"])
+
+
+class AssumptionsTestData:
+    """Temporary database seeded with a task carrying RA tags and validations."""
+
+    __test__ = False  # Helper class, not a test
+
+    def __init__(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+        self.db = TaskDatabase(self.db_path, fast_unsafe=True)
+
+        self.project_id = self.db.create_project("Assumptions Project", "Project for assumption tests")
+        self.epic_id = self.db.create_epic(self.project_id, "Assumptions Epic", "Epic for assumption tests")
+        self.task_id = self.db.create_task(self.epic_id, "Assumptions Task", "Task with RA tags")
+        self._set_ra_tags(self.task_id, RA_TAGS_JSON)
+
+    def _set_ra_tags(self, task_id, ra_tags_json):
+        self.db.execute_prepared(
+            "UPDATE tasks SET ra_tags = ? WHERE id = ?", (ra_tags_json, task_id)
+        )
+
+    def add_validation(self, ra_tag_id, outcome, confidence, validator_id, task_id=None):
+        self.db.execute_prepared(
+            """
+            INSERT INTO assumption_validations
+                (task_id, project_id, epic_id, ra_tag_id, validator_id, outcome,
+                 confidence, notes, validated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (task_id or self.task_id, self.project_id, self.epic_id, ra_tag_id,
+             validator_id, outcome, confidence, f"{outcome} by {validator_id}",
+             self.db._get_current_time_str()),
+        )
+
+    def cleanup(self):
+        self.db.close()
+        os.unlink(self.db_path)
+
+
+@pytest.fixture
+def assumptions_data():
+    """Provide seeded assumptions database."""
+    data = AssumptionsTestData()
+    yield data
+    data.cleanup()
+
+
+@pytest.fixture
+def client(shared_api_client, assumptions_data):
+    """Provide FastAPI test client bound to the seeded database."""
+    app.dependency_overrides[assumptions.get_database] = lambda: assumptions_data.db
+    assumptions._cache.clear()
+
+    yield shared_api_client
+
+    app.dependency_overrides.clear()
+    assumptions._cache.clear()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_async_api_client():
+    """Provide one httpx client over the ASGI app, reused by every async test in the module."""
+    # ASGITransport calls the app in-process, so there is no socket pool to size;
+    # reusing the client is what avoids per-test client and transport setup
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture
+def async_api_client(shared_async_api_client, assumptions_data):
+    """Provide the shared httpx client bound to the seeded database."""
+    app.dependency_overrides[assumptions.get_database] = lambda: assumptions_data.db
+    assumptions._cache.clear()
+
+    yield shared_async_api_client
+
+    app.dependency_overrides.clear()
+    assumptions._cache.clear()
+
+
+class TestInsightsEndpoint:
+    """Test suite for /api/assumptions/insights."""
+
+    def test_insights_resolves_tag_types_per_validation(self, client, assumptions_data):
+        """Each validation row is attributed to the RA tag type from its task's ra_tags."""
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, "reviewer-a")
+        assumptions_data.add_validation("ra_tag_impl0001", "partial", 50, "reviewer-b")
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-a")
+
+        response = client.get("/api/assumptions/insights")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total_validations"] == 3
+        assert data["outcome_breakdown"] == {"validated": 1, "partial": 1, "rejected": 1}
+        assert data["tag_type_breakdown"] == {"COMPLETION_DRIVE_IMPL": 2, "SUGGEST_ERROR_HANDLING": 1}
+        assert data["success_rate"] == 0.5
+
+    def test_insights_filtered_by_normalized_tag_type(self, client, assumptions_data):
+        """Outcome counts are recomputed over the validations matching ra_tag_type."""
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, "reviewer-a")
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-a")
+
+        response = client.get("/api/assumptions/insights", params={"ra_tag_type": "unknown:other"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_validations"] == 2
+        assert data["outcome_breakdown"] == {"validated": 1, "rejected": 1}
+
+        response = client.get("/api/assumptions/insights", params={"ra_tag_type": "implementation:api"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_validations"] == 0
+        assert data["outcome_breakdown"] == {}
+
+    def test_insights_cache_hit_and_write_invalidation(self, client, assumptions_data):
+        """Cached insights are reused until the database reports a write."""
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, "reviewer-a")
+
+        first = client.get("/api/assumptions/insights")
+        assert first.status_code == 200
+        assert first.json()["total_validations"] == 1
+
+        second = client.get("/api/assumptions/insights")
+        assert second.json() == first.json()
+
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-a")
+        third = client.get("/api/assumptions/insights")
+        assert third.status_code == 200
+        assert third.json()["total_validations"] == 2
+
+    def test_insights_with_no_validations(self, client):
+        """Empty databases return zeroed insights."""
+        response = client.get("/api/assumptions/insights")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_validations"] == 0
+        assert data["recent_examples"] == []
+
+    def test_insights_unknown_tag_ids(self, client, assumptions_data):
+        """Validations for tags missing from the task, or legacy string tags, fall back to UNKNOWN."""
+        legacy_task_id = assumptions_data.db.create_task(assumptions_data.epic_id, "Legacy Task")
+        assumptions_data._set_ra_tags(legacy_task_id, LEGACY_RA_TAGS_JSON)
+        assumptions_data.add_validation("ra_tag_missing1", "validated", 90, "reviewer-a")
+        assumptions_data.add_validation("ra_tag_legacy01", "rejected", 10, "reviewer-a", task_id=legacy_task_id)
+
+        response = client.get("/api/assumptions/insights")
+        assert response.status_code == 200
+        assert response.json()["tag_type_breakdown"] == {"UNKNOWN": 2}
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concurrent_insights_requests(self, request, async_api_client, assumptions_data):
+        """100 concurrent insight requests all succeed with consistent results."""
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, "reviewer-a")
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-b")
+
+        durations_ns = [0] * 100
+
+        async def make_request(index):
+            params = {"ra_tag_type": "unknown:other"} if index % 2 else None
+            request_start = time.perf_counter_ns()
+            response = await async_api_client.get("/api/assumptions/insights", params=params)
+            durations_ns[index] = time.perf_counter_ns() - request_start
+            return response
+
+        start_ns = time.perf_counter_ns()
+        responses = await asyncio.gather(*(make_request(i) for i in range(100)))
+        elapsed_ns = time.perf_counter_ns() - start_ns
+
+        assert all(response.status_code == 200 for response in responses)
+        assert {response.json()["total_validations"] for response in responses} == {2}
+        assert 0 < statistics.mean(durations_ns) <= max(durations_ns) <= elapsed_ns
+        # Timing is reported rather than asserted so a slow runner cannot fail the test.
+        request.node.add_report_section("call", "Concurrent Insights Results", "\n".join([
+            f"Requests: {len(responses)}",
+            f"Total time: {elapsed_ns / 1e6:.1f}ms",
+            f"Mean request time: {statistics.mean(durations_ns) / 1e6:.1f}ms",
+        ]))
+
+
+class TestRecentValidationsEndpoint:
+    """Test suite for /api/assumptions/recent."""
+
+    def test_recent_validations_include_tag_context(self, client, assumptions_data):
+        """Recent validations carry resolved and normalized RA tag types."""
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, "reviewer-a")
+        assumptions_data.add_validation("ra_tag_patt0001", "partial", 60, "reviewer-a")
+
+        response = client.get("/api/assumptions/recent")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total_count"] == 2
+        assert data["has_more"] is False
+        tags = {v["ra_tag_id"]: v["ra_tag"] for v in data["validations"]}
+        assert tags == {
+            "ra_tag_impl0001": "COMPLETION_DRIVE_IMPL",
+            "ra_tag_patt0001": "PATTERN_MOMENTUM",
+        }
+        assert all(v["task_name"] == "Assumptions Task" for v in data["validations"])
+
+    def test_recent_validations_pagination_total_count(self, client, assumptions_data):
+        """Total count covers every matching validation across paginated pages."""
+        for index in range(3):
+            assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, f"reviewer-{index}")
+
+        response = client.get("/api/assumptions/recent", params={"limit": 2})
+        assert response.status_code == 200
+        first_page = response.json()
+        assert first_page["total_count"] == 3
+        assert first_page["has_more"] is True
+        assert len(first_page["validations"]) == 2
+
+        response = client.get(
+            "/api/assumptions/recent", params={"limit": 2, "before_id": first_page["next_cursor"]}
+        )
+        assert response.status_code == 200
+        second_page = response.json()
+        assert second_page["total_count"] == 3
+        assert second_page["has_more"] is False
+        assert len(second_page["validations"]) == 1
+
+    def test_recent_validations_empty(self, client):
+        """No validations yields an empty first page without more results."""
+        response = client.get("/api/assumptions/recent")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["validations"] == []
+        assert data["total_count"] == 0
+        assert data["next_cursor"] is None
+
+
+class TestTagTypesEndpoint:
+    """Test suite for /api/assumptions/tag-types and /tag-details."""
+
+    def test_tag_types_counts_and_examples(self, client, assumptions_data):
+        """Tag types aggregate validation counts with example tag text."""
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, "reviewer-a")
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 80, "reviewer-b")
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-a")
+
+        response = client.get("/api/assumptions/tag-types")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert sum(t["count"] for t in data["tag_types"]) == 3
+        examples = [e for t in data["tag_types"] for e in t["example_tags"]]
+        assert "#COMPLETION_DRIVE_IMPL: Cache strategy" in examples
+        assert "#SUGGEST_ERROR_HANDLING: Retry on busy" in examples
+
+    def test_tag_details_filters_by_type(self, client, assumptions_data):
+        """Tag details only include validations of the requested tag type."""
+        assumptions_data.add_validation("ra_tag_impl0001", "validated", 90, "reviewer-a")
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-a")
+
+        response = client.get(
+            "/api/assumptions/tag-details", params={"tag_type": "SUGGEST_ERROR_HANDLING"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total_validations"] == 1
+        assert data["rejected_count"] == 1
+        assert data["validations"][0]["ra_tag_id"] == "ra_tag_error001"
+
+    def test_tag_details_etag_revalidation(self, client, assumptions_data):
+        """Repeat requests reuse the cached body's ETag until a write changes the data."""
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-a")
+        params = {"tag_type": "SUGGEST_ERROR_HANDLING"}
+
+        first = client.get("/api/assumptions/tag-details", params=params)
+        etag = first.headers["ETag"]
+        assert client.get("/api/assumptions/tag-details", params=params).headers["ETag"] == etag
+
+        not_modified = client.get(
+            "/api/assumptions/tag-details", params=params, headers={"If-None-Match": etag}
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        assumptions_data.add_validation("ra_tag_error001", "validated", 80, "reviewer-b")
+        changed = client.get(
+            "/api/assumptions/tag-details", params=params, headers={"If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["total_validations"] == 2
+
+    def test_tag_details_if_none_match_lists(self, client, assumptions_data):
+        """Weak tags, comma-separated lists and * all revalidate against the ETag."""
+        assumptions_data.add_validation("ra_tag_error001", "rejected", 10, "reviewer-a")
+        params = {"tag_type": "SUGGEST_ERROR_HANDLING"}
+        etag = client.get("/api/assumptions/tag-details", params=params).headers["ETag"]
+
+        for header in (f"W/{etag}", f'"stale", {etag}', f'"stale",W/{etag}', "*"):
+            response = client.get(
+                "/api/assumptions/tag-details", params=params, headers={"If-None-Match": header}
+            )
+            assert response.status_code == 304, header
+
+        stale = client.get(
+            "/api/assumptions/tag-details", params=params, headers={"If-None-Match": '"stale"'}
+        )
+        assert stale.status_code == 200
+
+
+class TestDataVersion:
+    """Test suite for the cache invalidation data version."""
+
+    def test_data_version_tracks_writes_on_connection(self):
+        """total_changes in the version moves with writes made through the connection."""
+        connection = sqlite3.connect(":memory:", isolation_level=None)
+        # Plain stand-ins for the lock and connection; no Mock context-manager plumbing
+        db = SimpleNamespace(_connection_lock=nullcontext(), _connection=connection)
+        try:
+            connection.execute("CREATE TABLE validations (id INTEGER PRIMARY KEY)")
+            before = assumptions._get_data_version(db)
+            assert assumptions._get_data_version(db) == before
+
+            connection.execute("INSERT INTO validations DEFAULT VALUES")
+            assert assumptions._get_data_version(db) != before
+        finally:
+            connection.close()
+
+
+class TestSuccessRate:
+    """Test suite for the memoized success-rate scoring."""
+
+    def test_success_rate_weights_partial_outcomes(self):
+        """Partial validations count half; empty breakdowns score zero."""
+        assert assumptions._calculate_success_rate({"validated": 1, "partial": 1, "rejected": 2}) == 0.375
+        assert assumptions._calculate_success_rate({}) == 0.0
+
+    def test_success_rate_reuses_cached_counts(self):
+        """Equal outcome counts hit the cache regardless of dict ordering or extra keys."""
+        assumptions._success_rate_for_counts.cache_clear()
+
+        first = assumptions._calculate_success_rate({"validated": 3, "rejected": 1})
+        second = assumptions._calculate_success_rate({"rejected": 1, "validated": 3, "other": 9})
+
+        assert first == second == 0.75
+        assert assumptions._success_rate_for_counts.cache_info().hits == 1
+
+
+class TestRaTagResolutionBenchmark:
+    """Benchmark guarding the per-request RA tag index used by the endpoints."""
+
+    @pytest.mark.benchmark
+    def test_lookup_ra_tag_benchmark(self, benchmark):
+        """Resolving 100 validation rows against one task's tags stays index-based."""
+        tag_ids = [tag["id"] for tag in RA_TAGS]
+        rows = [(RA_TAGS_JSON, tag_ids[i % len(tag_ids)]) for i in range(100)]
+
+        def resolve_rows():
+            tag_indexes = {}
+            return [assumptions._lookup_ra_tag(tag_indexes, blob, tag_id) for blob, tag_id in rows]
+
+        resolved = benchmark(resolve_rows)
+
+        assert len(resolved) == 100
+        assert resolved[0] == ("COMPLETION_DRIVE_IMPL", "#COMPLETION_DRIVE_IMPL: Cache strategy")
+        assert {tag_type for tag_type, _ in resolved} == {tag["type"] for tag in RA_TAGS}
+
+    def test_lookup_ra_tag_shares_type_strings(self):
+        """Tag types parsed from separate task blobs resolve to one shared string."""
+        other_blob = json.dumps([{**RA_TAGS[0], "text": "#COMPLETION_DRIVE_IMPL: Other task"}])
+        tag_indexes = {}
+
+        first_type, _ = assumptions._lookup_ra_tag(tag_indexes, RA_TAGS_JSON, RA_TAGS[0]["id"])
+        second_type, second_text = assumptions._lookup_ra_tag(tag_indexes, other_blob, RA_TAGS[0]["id"])
+
+        assert second_text == "#COMPLETION_DRIVE_IMPL: Other task"
+        assert first_type is second_type
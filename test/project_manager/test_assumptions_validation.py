@@ -1,26 +1,100 @@
+import asyncio
+import hashlib
+
+import orjson
 import pytest
-import tempfile
-import os
 from datetime import datetime, timezone, timedelta
 
 from task_manager.database import TaskDatabase
 from task_manager.tools_lib import CaptureAssumptionValidationTool, GetTaskDetailsTool, CreateTaskTool
 
 
-class TestAssumptionValidationSystem:
-    """Comprehensive test suite for RA assumption validation system."""
+RA_TAG_STRINGS = (
+    "#COMPLETION_DRIVE_IMPL: Test database connection handling",
+    "#SUGGEST_ERROR_HANDLING: Validate input parameters",
+    "#PATTERN_MOMENTUM: Using existing validation patterns",
+    "#CONTEXT_RECONSTRUCT: Inferring expected behavior",
+)
+
+
+def create_ra_tags_with_ids(ra_tag_strings):
+    """Helper to create RA tags with proper ID formatting for testing."""
+    ra_tags = []
+    for tag_text in ra_tag_strings:
+        # Extract type from tag text (e.g., "#COMPLETION_DRIVE_IMPL:" -> "COMPLETION_DRIVE_IMPL")
+        if tag_text.startswith("#") and ":" in tag_text:
+            tag_type = tag_text[1 : tag_text.index(":")]
+        else:
+            tag_type = "UNKNOWN"
+
+        # Generate consistent ID for testing
+        tag_id = f"ra_tag_{hashlib.md5(tag_text.encode()).hexdigest()[:8]}"
+
+        ra_tags.append(
+            {
+                "id": tag_id,
+                "type": tag_type,
+                "text": tag_text,
+                "created_at": "2025-09-11T04:00:00.000000+00:00Z",
+            }
+        )
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database for testing."""
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        temp_file.close()
+    return ra_tags
+
+
+# Built once at import; tests only read the tag dicts
+RA_TAGS_WITH_IDS = create_ra_tags_with_ids(RA_TAG_STRINGS)
+RA_TAGS_WITH_IDS_JSON = orjson.dumps(RA_TAGS_WITH_IDS).decode()
+
+
+@pytest.fixture(scope="module")
+def temp_db(tmp_path_factory):
+    """Create one temporary database shared by every test in the module."""
+    db = TaskDatabase(str(tmp_path_factory.mktemp("validation") / "test.db"), fast_unsafe=True)
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def test_task_with_ra_tags(temp_db):
+    """Create a test task with RA tags for validation testing."""
+    # Create project and epic
+    project_id = temp_db.create_project("Test Project", "Test description")
+    epic_id = temp_db.create_epic(project_id, "Test Epic", "Test epic description")
 
-        db = TaskDatabase(temp_file.name)
-        yield db
+    # Create task with properly formatted RA tags
+    task_id = temp_db.create_task(
+        epic_id,
+        "Test Task",
+        "Test task description",
+        ra_mode="standard",
+        ra_score=6,
+        ra_tags=list(RA_TAG_STRINGS),  # Use original strings for DB storage
+    )
 
-        db.close()
-        os.unlink(temp_file.name)
+    # Manually update the task's RA tags to include IDs by directly modifying database
+    temp_db.execute_prepared(
+        "UPDATE tasks SET ra_tags = ? WHERE id = ?", (RA_TAGS_WITH_IDS_JSON, task_id)
+    )
+
+    return {
+        "task_id": task_id,
+        "project_id": project_id,
+        "epic_id": epic_id,
+        "ra_tags": RA_TAGS_WITH_IDS,
+    }
+
+
+class TestAssumptionValidationSystem:
+    """Comprehensive test suite for RA assumption validation system."""
+
+    @pytest.fixture(autouse=True)
+    def _rollback_test_writes(self, temp_db):
+        """Run each test inside a SAVEPOINT so the shared database is restored afterwards."""
+        temp_db.execute_prepared("SAVEPOINT test_case")
+        yield
+        temp_db.execute_prepared("ROLLBACK TO test_case")
+        temp_db.execute_prepared("RELEASE test_case")
 
     @pytest.fixture
     def validation_tool(self, temp_db):
@@ -39,84 +113,10 @@ class TestAssumptionValidationSystem:
 
     async def get_task_details_parsed(self, task_details_tool, task_id):
         """Helper method to get properly parsed task details."""
-        import json
-
         result = await task_details_tool.apply(str(task_id))
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
         return result_data
 
-    def create_ra_tags_with_ids(self, ra_tag_strings):
-        """Helper to create RA tags with proper ID formatting for testing."""
-        import hashlib
-
-        ra_tags = []
-        for tag_text in ra_tag_strings:
-            # Extract type from tag text (e.g., "#COMPLETION_DRIVE_IMPL:" -> "COMPLETION_DRIVE_IMPL")
-            if tag_text.startswith("#") and ":" in tag_text:
-                tag_type = tag_text[1 : tag_text.index(":")]
-            else:
-                tag_type = "UNKNOWN"
-
-            # Generate consistent ID for testing
-            tag_id = f"ra_tag_{hashlib.md5(tag_text.encode()).hexdigest()[:8]}"
-
-            ra_tags.append(
-                {
-                    "id": tag_id,
-                    "type": tag_type,
-                    "text": tag_text,
-                    "created_at": "2025-09-11T04:00:00.000000+00:00Z",
-                }
-            )
-
-        return ra_tags
-
-    @pytest.fixture
-    def test_task_with_ra_tags(self, temp_db):
-        """Create a test task with RA tags for validation testing."""
-        import json
-
-        # Create project and epic
-        project_id = temp_db.create_project("Test Project", "Test description")
-        epic_id = temp_db.create_epic(project_id, "Test Epic", "Test epic description")
-
-        # Create RA tags with proper formatting
-        ra_tag_strings = [
-            "#COMPLETION_DRIVE_IMPL: Test database connection handling",
-            "#SUGGEST_ERROR_HANDLING: Validate input parameters",
-            "#PATTERN_MOMENTUM: Using existing validation patterns",
-            "#CONTEXT_RECONSTRUCT: Inferring expected behavior",
-        ]
-        ra_tags_with_ids = self.create_ra_tags_with_ids(ra_tag_strings)
-
-        # Create task with properly formatted RA tags
-        task_id = temp_db.create_task(
-            epic_id,
-            "Test Task",
-            "Test task description",
-            ra_mode="standard",
-            ra_score=6,
-            ra_tags=ra_tag_strings,  # Use original strings for DB storage
-        )
-
-        # Manually update the task's RA tags to include IDs by directly modifying database
-        with temp_db._connection_lock:
-            cursor = temp_db._connection.cursor()
-            cursor.execute(
-                """
-                UPDATE tasks SET ra_tags = ? WHERE id = ?
-            """,
-                (json.dumps(ra_tags_with_ids), task_id),
-            )
-            temp_db._connection.commit()
-
-        return {
-            "task_id": task_id,
-            "project_id": project_id,
-            "epic_id": epic_id,
-            "ra_tags": ra_tags_with_ids,
-        }
-
 
 class TestValidationCreation(TestAssumptionValidationSystem):
     """Test validation record creation scenarios."""
@@ -136,9 +136,7 @@ class TestValidationCreation(TestAssumptionValidationSystem):
             reviewer_agent_id="test-reviewer",
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is True
         assert result_data["task_id"] == task_id
@@ -158,21 +156,19 @@ class TestValidationCreation(TestAssumptionValidationSystem):
 
         test_cases = [("validated", 90), ("rejected", 10), ("partial", 75)]
 
-        for i, (outcome, expected_confidence) in enumerate(test_cases):
-            ra_tag_id = ra_tags[i]["id"]
-
-            result = await validation_tool.apply(
+        # Distinct tags and reviewers, so the captures are independent and can run together
+        results = await asyncio.gather(*(
+            validation_tool.apply_raw(
                 task_id=str(task_id),
-                ra_tag_id=ra_tag_id,
+                ra_tag_id=ra_tags[i]["id"],
                 outcome=outcome,
                 reason=f"Test {outcome} validation",
                 reviewer_agent_id=f"test-reviewer-{i}",
             )
+            for i, (outcome, _) in enumerate(test_cases)
+        ))
 
-            import json
-
-            result_data = json.loads(result)
-
+        for result_data, (outcome, expected_confidence) in zip(results, test_cases):
             assert result_data["success"] is True
             assert result_data["confidence"] == expected_confidence
             assert result_data["outcome"] == outcome
@@ -190,9 +186,7 @@ class TestValidationCreation(TestAssumptionValidationSystem):
             reason="Test with default reviewer",
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is True
         assert result_data["reviewer"] == "mcp-reviewer-agent"
@@ -208,9 +202,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             task_id="", ra_tag_id="test_tag", outcome="validated", reason="Test reason"
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "task_id parameter is required" in result_data["error"]
@@ -222,9 +214,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             task_id="1", ra_tag_id="", outcome="validated", reason="Test reason"
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "ra_tag_id parameter is required" in result_data["error"]
@@ -236,9 +226,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             task_id="1", ra_tag_id="test_tag", outcome="invalid_outcome", reason="Test reason"
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "outcome must be one of: validated, rejected, partial" in result_data["error"]
@@ -250,9 +238,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             task_id="1", ra_tag_id="test_tag", outcome="validated", reason=""
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "reason parameter is required" in result_data["error"]
@@ -264,9 +250,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             task_id="not_a_number", ra_tag_id="test_tag", outcome="validated", reason="Test reason"
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "Invalid task_id format" in result_data["error"]
@@ -278,9 +262,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             task_id="999", ra_tag_id="test_tag", outcome="validated", reason="Test reason"
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "Task 999 not found" in result_data["error"]
@@ -297,9 +279,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             reason="Test reason",
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert (
@@ -312,19 +292,18 @@ class TestValidationErrors(TestAssumptionValidationSystem):
         task_id = test_task_with_ra_tags["task_id"]
         ra_tag_id = test_task_with_ra_tags["ra_tags"][0]["id"]
 
-        for invalid_confidence in [-1, 101, 150]:
-            result = await validation_tool.apply(
+        results = await asyncio.gather(*(
+            validation_tool.apply_raw(
                 task_id=str(task_id),
                 ra_tag_id=ra_tag_id,
                 outcome="validated",
                 reason="Test reason",
                 confidence=invalid_confidence,
             )
+            for invalid_confidence in [-1, 101, 150]
+        ))
 
-            import json
-
-            result_data = json.loads(result)
-
+        for result_data in results:
             assert result_data["success"] is False
             assert "confidence must be between 0 and 100" in result_data["error"]
 
@@ -340,9 +319,7 @@ class TestValidationErrors(TestAssumptionValidationSystem):
             task_id=str(task_id), ra_tag_id="any_tag_id", outcome="validated", reason="Test reason"
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert f"Task {task_id} has no RA tags to validate" in result_data["error"]
@@ -370,9 +347,7 @@ class TestValidationUpdates(TestAssumptionValidationSystem):
             reviewer_agent_id=reviewer_id,
         )
 
-        import json
-
-        result1_data = json.loads(result1)
+        result1_data = orjson.loads(result1)
         assert result1_data["operation"] == "created"
         initial_validation_id = result1_data["validation_id"]
 
@@ -386,7 +361,7 @@ class TestValidationUpdates(TestAssumptionValidationSystem):
             reviewer_agent_id=reviewer_id,
         )
 
-        result2_data = json.loads(result2)
+        result2_data = orjson.loads(result2)
         assert result2_data["operation"] == "updated"
         assert result2_data["validation_id"] == initial_validation_id
         assert result2_data["outcome"] == "rejected"
@@ -418,10 +393,8 @@ class TestValidationUpdates(TestAssumptionValidationSystem):
             reviewer_agent_id="reviewer-2",
         )
 
-        import json
-
-        result1_data = json.loads(result1)
-        result2_data = json.loads(result2)
+        result1_data = orjson.loads(result1)
+        result2_data = orjson.loads(result2)
 
         assert result1_data["operation"] == "created"
         assert result2_data["operation"] == "created"
@@ -430,6 +403,103 @@ class TestValidationUpdates(TestAssumptionValidationSystem):
         assert result2_data["reviewer"] == "reviewer-2"
 
 
+    @pytest.mark.asyncio
+    async def test_write_path_bound_once(self, validation_tool, test_task_with_ra_tags):
+        """The closure-bound write path is built on first capture and then reused."""
+        task_id = str(test_task_with_ra_tags["task_id"])
+        ra_tag_id = test_task_with_ra_tags["ra_tags"][0]["id"]
+        assert validation_tool._write_validation is None
+
+        first = await validation_tool.apply_raw(task_id, ra_tag_id, "validated", "First", reviewer_agent_id="bound")
+        write_validation = validation_tool._write_validation
+        second = await validation_tool.apply_raw(task_id, ra_tag_id, "partial", "Second", reviewer_agent_id="bound")
+
+        assert validation_tool._write_validation is write_validation
+        assert (first["operation"], second["operation"]) == ("created", "updated")
+        assert first["validation_id"] == second["validation_id"]
+
+
+class TestBatchValidation(TestAssumptionValidationSystem):
+    """Test the single-transaction apply_many capture path."""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_stored_records(self, validation_tool, test_task_with_ra_tags, temp_db):
+        """Batch results carry the ids of the rows actually written."""
+        task_id = test_task_with_ra_tags["task_id"]
+        ra_tags = test_task_with_ra_tags["ra_tags"]
+
+        results = await validation_tool.apply_many([
+            {
+                "task_id": str(task_id),
+                "ra_tag_id": ra_tag["id"],
+                "outcome": outcome,
+                "reason": f"Batch {outcome}",
+                "reviewer_agent_id": "batch-reviewer",
+            }
+            for ra_tag, outcome in zip(ra_tags, ("validated", "rejected", "partial"))
+        ])
+
+        assert [r["operation"] for r in results] == ["created"] * 3
+        assert [r["confidence"] for r in results] == [90, 10, 75]
+
+        stored = dict(temp_db.execute_prepared(
+            "SELECT id, ra_tag_id FROM assumption_validations WHERE validator_id = ?",
+            ("batch-reviewer",),
+        ))
+        assert stored == {r["validation_id"]: r["ra_tag_id"] for r in results}
+
+    @pytest.mark.asyncio
+    async def test_batch_deduplicates_like_sequential_calls(
+        self, validation_tool, test_task_with_ra_tags, temp_db
+    ):
+        """Repeats in the batch and recent existing records are updated, not duplicated."""
+        task_id = str(test_task_with_ra_tags["task_id"])
+        first_tag, second_tag = (tag["id"] for tag in test_task_with_ra_tags["ra_tags"][:2])
+
+        existing = await validation_tool.apply_raw(
+            task_id, first_tag, "validated", "Earlier review", reviewer_agent_id="dedup-reviewer"
+        )
+
+        results = await validation_tool.apply_many([
+            {"task_id": task_id, "ra_tag_id": first_tag, "outcome": "partial",
+             "reason": "Revisited", "reviewer_agent_id": "dedup-reviewer"},
+            {"task_id": task_id, "ra_tag_id": second_tag, "outcome": "validated",
+             "reason": "First pass", "reviewer_agent_id": "dedup-reviewer"},
+            {"task_id": task_id, "ra_tag_id": second_tag, "outcome": "rejected",
+             "reason": "Second pass", "reviewer_agent_id": "dedup-reviewer"},
+        ])
+
+        assert [r["operation"] for r in results] == ["updated", "created", "updated"]
+        assert results[0]["validation_id"] == existing["validation_id"]
+        assert results[1]["validation_id"] == results[2]["validation_id"]
+
+        rows = temp_db.execute_prepared(
+            "SELECT ra_tag_id, outcome FROM assumption_validations WHERE validator_id = ?",
+            ("dedup-reviewer",),
+        )
+        assert sorted(rows) == sorted([(first_tag, "partial"), (second_tag, "rejected")])
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_invalid_entries_individually(
+        self, validation_tool, test_task_with_ra_tags
+    ):
+        """Rejected entries get their own error while valid entries are still written."""
+        task_id = str(test_task_with_ra_tags["task_id"])
+        ra_tag_id = test_task_with_ra_tags["ra_tags"][0]["id"]
+
+        results = await validation_tool.apply_many([
+            {"task_id": task_id, "ra_tag_id": "missing", "outcome": "validated", "reason": "x"},
+            {"task_id": task_id, "ra_tag_id": ra_tag_id, "outcome": "validated", "reason": "ok"},
+            {"task_id": task_id, "ra_tag_id": ra_tag_id, "outcome": "unknown", "reason": "x"},
+        ])
+
+        assert results[0]["success"] is False
+        assert "not found" in results[0]["error"]
+        assert results[1]["success"] is True
+        assert results[2]["success"] is False
+        assert "outcome must be one of" in results[2]["error"]
+
+
 class TestValidationIntegration(TestAssumptionValidationSystem):
     """Test integration with database and task system."""
 
@@ -450,27 +520,20 @@ class TestValidationIntegration(TestAssumptionValidationSystem):
             reason="Test context population",
         )
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         # Verify validation was created successfully
         assert result_data["success"] is True
         validation_id = result_data["validation_id"]
 
         # Query database directly to verify context was populated
-        with temp_db._connection_lock:
-            cursor = temp_db._connection.cursor()
-            cursor.execute(
-                """
-                SELECT project_id, epic_id FROM assumption_validations 
-                WHERE id = ?
-            """,
-                (validation_id,),
-            )
-            result_row = cursor.fetchone()
+        rows = temp_db.execute_prepared(
+            "SELECT project_id, epic_id FROM assumption_validations WHERE id = ?",
+            (validation_id,),
+        )
 
-        assert result_row is not None
+        assert len(rows) == 1
+        result_row = rows[0]
         assert result_row[0] == project_id  # project_id
         assert result_row[1] == epic_id  # epic_id
 
@@ -488,19 +551,18 @@ class TestValidationIntegration(TestAssumptionValidationSystem):
             "CONTEXT_RECONSTRUCT",
         ]
 
-        for i, ra_tag in enumerate(ra_tags):
-            result = await validation_tool.apply(
-                task_id=str(task_id),
-                ra_tag_id=ra_tag["id"],
-                outcome="validated",
-                reason=f"Validation for {ra_tag['type']} tag",
-                reviewer_agent_id=f"reviewer-{i}",
-            )
-
-            import json
-
-            result_data = json.loads(result)
-
+        results = await validation_tool.apply_many([
+            {
+                "task_id": str(task_id),
+                "ra_tag_id": ra_tag["id"],
+                "outcome": "validated",
+                "reason": f"Validation for {ra_tag['type']} tag",
+                "reviewer_agent_id": f"reviewer-{i}",
+            }
+            for i, ra_tag in enumerate(ra_tags)
+        ])
+
+        for i, result_data in enumerate(results):
             assert result_data["success"] is True
             assert result_data["ra_tag_type"] == expected_types[i]
 
@@ -521,9 +583,7 @@ class TestValidationIntegration(TestAssumptionValidationSystem):
 
         after_validation = datetime.now(timezone.utc)
 
-        import json
-
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         # Parse timestamp from result
         validated_at_str = result_data["validated_at"]
@@ -0,0 +1,91 @@
+"""
+Tests for RA tag context detection utilities.
+
+Covers language detection from file names and symbol extraction around a line.
+"""
+
+import pytest
+
+from src.task_manager.context_utils import (
+    SYMBOL_PATTERNS,
+    detect_language,
+    extract_symbol_context,
+)
+
+
+PYTHON_SOURCE = '''\
+import os
+
+
+class Loader:
+    def load(self, path):
+        return os.path.exists(path)
+
+
+async def fetch(url):
+    return url
+'''
+
+
+class TestDetectLanguage:
+    """Tests for detect_language()."""
+
+    def test_known_extensions(self):
+        assert detect_language("src/app.py") == "python"
+        assert detect_language("web/app.tsx") == "typescript"
+        assert detect_language("README.md") == "markdown"
+
+    def test_suffix_edge_cases(self):
+        assert detect_language("build/Dockerfile") == "dockerfile"
+        assert detect_language("SRC/MAIN.PY") == "python"
+        assert detect_language("archive.tar.yml") == "yaml"
+        assert detect_language("home/.md") is None
+        assert detect_language("trailing.") is None
+
+    def test_unknown_and_empty(self):
+        assert detect_language("notes.unknownext") is None
+        assert detect_language("") is None
+
+    def test_non_string_path_returns_none(self):
+        assert detect_language(["app.py"]) is None
+
+
+class TestExtractSymbolContext:
+    """Tests for extract_symbol_context()."""
+
+    @pytest.fixture
+    def python_file(self, tmp_path):
+        path = tmp_path / "module.py"
+        path.write_text(PYTHON_SOURCE)
+        return str(path)
+
+    def test_finds_enclosing_method(self, python_file):
+        assert extract_symbol_context(python_file, 6) == "load"
+
+    def test_finds_async_function(self, python_file):
+        assert extract_symbol_context(python_file, 10) == "fetch"
+
+    def test_pattern_scan_language(self, tmp_path):
+        path = tmp_path / "server.go"
+        path.write_text("package main\n\nfunc (s *Server) Serve(addr string) {\n\treturn\n}\n")
+        assert extract_symbol_context(str(path), 4) == "Serve"
+
+    def test_pattern_order_wins_over_position(self, tmp_path):
+        path = tmp_path / "handlers.js"
+        path.write_text("const api = {\n  save: function persist(item) {\n    return item;\n")
+        # The function-declaration pattern is listed before object methods
+        assert extract_symbol_context(str(path), 3) == "persist"
+
+    def test_line_out_of_range(self, python_file):
+        assert extract_symbol_context(python_file, 500) is None
+
+    def test_language_without_patterns(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}\n')
+        assert "json" not in SYMBOL_PATTERNS
+        assert extract_symbol_context(str(path), 1) is None
+
+    def test_keyword_lookalikes_are_not_symbols(self, tmp_path):
+        path = tmp_path / "lookalike.py"
+        path.write_text("definitely = 1\nclassify(x)\nasync_value = 2\n")
+        assert extract_symbol_context(str(path), 3) is None
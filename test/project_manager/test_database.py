@@ -9,121 +9,182 @@ Tests cover:
 - Error handling and edge cases
 """
 
+import asyncio
 import pytest
-import tempfile
 import threading
 import time
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import sqlite3
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from task_manager.database import TaskDatabase
 
+# Shared SQL literals: identical strings hit sqlite3's per-connection statement cache
+_PRAGMA_JOURNAL = "PRAGMA journal_mode"
+_PRAGMA_SYNCHRONOUS = "PRAGMA synchronous"
+_PRAGMA_BUSY_TIMEOUT = "PRAGMA busy_timeout"
+_PRAGMA_FOREIGN_KEYS_ON = "PRAGMA foreign_keys = ON"
+_INDEX_NAMES_SQL = "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%' ORDER BY name"
+
+
+@contextmanager
+def thread_local_databases(db_path: str):
+    """
+    Yield a getter returning one TaskDatabase per calling thread.
+
+    Worker threads open their connection on first use and reuse it for every
+    later call; all connections are closed when the context exits.
+    """
+    local = threading.local()
+    opened = []
+    opened_lock = threading.Lock()
+
+    def get_db() -> TaskDatabase:
+        db = getattr(local, "db", None)
+        if db is None:
+            db = local.db = TaskDatabase(db_path)
+            with opened_lock:
+                opened.append(db)
+        return db
+
+    try:
+        yield get_db
+    finally:
+        for db in opened:
+            db.close()
+
+
+# Schema template built once per test process and copied into each test database
+_template_db = None
+
+
+def create_test_database(db_path: str, **kwargs) -> TaskDatabase:
+    """
+    Create a TaskDatabase at db_path from a pre-initialized schema template.
+
+    The template runs the full schema initialization once in memory; each test
+    database is then a page copy via the SQLite online backup API instead of
+    replaying every CREATE statement on disk.
+    """
+    global _template_db
+    if _template_db is None:
+        _template_db = TaskDatabase(":memory:")
+
+    target = sqlite3.connect(db_path)
+    try:
+        with _template_db._connection_lock:
+            _template_db._connection.backup(target)
+    finally:
+        target.close()
+
+    return TaskDatabase(db_path, **kwargs)
+
 
 class TestTaskDatabaseInitialization:
     """Test database initialization and schema creation."""
     
-    def test_database_initialization(self):
+    def test_database_initialization(self, tmp_path):
         """Test basic database initialization with WAL mode."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            db_path = tmp_file.name
+        db_path = str(tmp_path / "test.db")
         
-        try:
-            # #COMPLETION_DRIVE_IMPL: Testing WAL mode configuration assumptions
-            db = TaskDatabase(db_path)
-            
-            # Verify WAL mode is enabled
-            cursor = db._connection.cursor()
-            cursor.execute("PRAGMA journal_mode")
-            journal_mode = cursor.fetchone()[0]
-            assert journal_mode.upper() == 'WAL', f"Expected WAL mode, got {journal_mode}"
-            
-            # Verify other PRAGMA settings
-            cursor.execute("PRAGMA synchronous")
-            sync_mode = cursor.fetchone()[0]
-            assert sync_mode == 1, f"Expected synchronous=NORMAL (1), got {sync_mode}"  # NORMAL = 1
-            
-            cursor.execute("PRAGMA busy_timeout")
-            timeout = cursor.fetchone()[0]
-            assert timeout == 5000, f"Expected busy_timeout=5000ms, got {timeout}"
-            
-            db.close()
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        # #COMPLETION_DRIVE_IMPL: Testing WAL mode configuration assumptions
+        db = TaskDatabase(db_path)
+        
+        # Verify WAL mode is enabled
+        cursor = db._connection.cursor()
+        cursor.execute(_PRAGMA_JOURNAL)
+        journal_mode = cursor.fetchone()[0]
+        assert journal_mode.upper() == 'WAL', f"Expected WAL mode, got {journal_mode}"
+        
+        # Verify other PRAGMA settings
+        cursor.execute(_PRAGMA_SYNCHRONOUS)
+        sync_mode = cursor.fetchone()[0]
+        assert sync_mode == 1, f"Expected synchronous=NORMAL (1), got {sync_mode}"  # NORMAL = 1
+        
+        cursor.execute(_PRAGMA_BUSY_TIMEOUT)
+        timeout = cursor.fetchone()[0]
+        assert timeout == 5000, f"Expected busy_timeout=5000ms, got {timeout}"
+        
+        db.close()
+    
+    def test_fast_unsafe_initialization(self, tmp_path):
+        """Test fast_unsafe swaps WAL for an in-memory journal without fsync."""
+        db_path = str(tmp_path / "test.db")
+        
+        db = TaskDatabase(db_path, fast_unsafe=True)
+        
+        cursor = db._connection.cursor()
+        cursor.execute(_PRAGMA_JOURNAL)
+        assert cursor.fetchone()[0].upper() == 'MEMORY'
+        cursor.execute(_PRAGMA_SYNCHRONOUS)
+        assert cursor.fetchone()[0] == 0  # OFF = 0
+        cursor.execute(_PRAGMA_BUSY_TIMEOUT)
+        assert cursor.fetchone()[0] == 5000
+        
+        db.close()
+        assert not Path(db_path + "-wal").exists()
     
-    def test_schema_creation(self):
+    def test_schema_creation(self, tmp_path):
         """Test database schema is created correctly."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            db_path = tmp_file.name
-        
-        try:
-            db = TaskDatabase(db_path)
-            cursor = db._connection.cursor()
-            
-            # Check all tables exist - updated for new schema
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name IN ('projects', 'epics', 'tasks', 'task_logs')
-                ORDER BY name
-            """)
-            tables = [row[0] for row in cursor.fetchall()]
-            expected_tables = ['epics', 'projects', 'task_logs', 'tasks']
-            assert set(tables) >= set(expected_tables), f"Missing tables: {set(expected_tables) - set(tables)}"
-            
-            # Check indexes exist
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='index' AND name LIKE 'idx_%'
-                ORDER BY name
-            """)
-            indexes = [row[0] for row in cursor.fetchall()]
-            expected_indexes = ['idx_epics_project_id', 'idx_tasks_epic_id', 'idx_tasks_status_created', 'idx_task_logs_task_seq']
-            assert set(indexes) >= set(expected_indexes), f"Missing indexes: {set(expected_indexes) - set(indexes)}"
-            
-            db.close()
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        db_path = str(tmp_path / "test.db")
+        
+        db = TaskDatabase(db_path)
+        cursor = db._connection.cursor()
+        
+        # Check all tables exist - updated for new schema
+        cursor.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name IN ('projects', 'epics', 'tasks', 'task_logs')
+            ORDER BY name
+        """)
+        tables = [row[0] for row in cursor.fetchall()]
+        expected_tables = ['epics', 'projects', 'task_logs', 'tasks']
+        assert set(tables) >= set(expected_tables), f"Missing tables: {set(expected_tables) - set(tables)}"
+        
+        # Check indexes exist
+        cursor.execute(_INDEX_NAMES_SQL)
+        indexes = [row[0] for row in cursor.fetchall()]
+        expected_indexes = ['idx_epics_project_id', 'idx_tasks_epic_id', 'idx_tasks_status_created', 'idx_task_logs_task_seq']
+        assert set(indexes) >= set(expected_indexes), f"Missing indexes: {set(expected_indexes) - set(indexes)}"
+        
+        db.close()
     
-    def test_directory_creation(self):
+    def test_directory_creation(self, tmp_path):
         """Test database directory is created if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            db_path = Path(tmp_dir) / "subdir" / "test.db"
-            
-            # Ensure subdir doesn't exist
-            assert not db_path.parent.exists()
-            
-            # Testing verified: parent directory creation works correctly
-            db = TaskDatabase(str(db_path))
-            assert db_path.parent.exists(), "Database directory should be created"
-            assert db_path.exists(), "Database file should be created"
-            
-            db.close()
+        db_path = tmp_path / "subdir" / "test.db"
+        
+        # Ensure subdir doesn't exist
+        assert not db_path.parent.exists()
+        
+        # Testing verified: parent directory creation works correctly
+        db = TaskDatabase(str(db_path))
+        assert db_path.parent.exists(), "Database directory should be created"
+        assert db_path.exists(), "Database file should be created"
+        
+        db.close()
 
 
 class TestAtomicLocking:
     """Test atomic lock operations and race condition prevention."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database for each test."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
+        self.db_path = str(tmp_path / "test.db")
+        # Injected clock lets expiry tests advance time instead of sleeping
+        self.now = datetime.now(timezone.utc)
+        self.db = create_test_database(self.db_path, clock=lambda: self.now, fast_unsafe=True)
         
         # Create test data - updated for new hierarchy
         self.project_id = self.db.create_project("Test Project", "Test project description")
         self.epic_id = self.db.create_epic(self.project_id, "Test Epic", "Test epic description")
         self.task_id = self.db.create_task(self.epic_id, "Test Task", "Test task description")
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
+        
+        yield
         self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
     
     def test_successful_lock_acquisition(self):
         """Test successful lock acquisition on available task."""
@@ -138,6 +199,7 @@ class TestAtomicLocking:
         assert status["is_locked"] is True, "Task should be locked"
         assert status["lock_holder"] == agent_id, "Lock holder should match agent"
         assert status["lock_expires_at"] is not None, "Lock expiration should be set"
+        assert isinstance(status["lock_expires_at"], str), "Lock expiration is stored as ISO text"
     
     def test_lock_acquisition_failure(self):
         """Test lock acquisition fails when task already locked."""
@@ -196,8 +258,8 @@ class TestAtomicLocking:
         result = self.db.acquire_task_lock_atomic(self.task_id, agent_id, lock_duration_seconds=1)
         assert result is True, "Lock acquisition should succeed"
         
-        # Wait for lock to expire - 2 second sleep verified sufficient for 1 second timeout
-        time.sleep(2)
+        # Advance the clock past the 1 second lock timeout
+        self.now += timedelta(seconds=2)
         
         # Try to acquire lock with different agent (should succeed due to cleanup)
         agent2 = "test_agent_2"
@@ -208,6 +270,21 @@ class TestAtomicLocking:
         status = self.db.get_task_lock_status(self.task_id)
         assert status["lock_holder"] == agent2, "Lock holder should be new agent"
     
+    def test_status_update_follows_injected_clock(self):
+        """Test status updates check lock expiry against the injected clock, not wall time."""
+        agent_id = "test_agent_1"
+        # A clock a day behind wall time: the lock is live on the injected clock
+        # even though its expiry is already in the wall-clock past
+        self.now -= timedelta(days=1)
+        self.db.acquire_task_lock_atomic(self.task_id, agent_id, lock_duration_seconds=1)
+        
+        result = self.db.update_task_status(self.task_id, "in_progress", agent_id)
+        assert result["success"] is True
+        
+        self.now += timedelta(seconds=2)
+        result = self.db.update_task_status(self.task_id, "review", agent_id)
+        assert result["success"] is False
+    
     def test_manual_lock_cleanup(self):
         """Test manual cleanup of expired locks."""
         agent_id = "test_agent_1"
@@ -215,8 +292,8 @@ class TestAtomicLocking:
         # Acquire lock with short timeout
         self.db.acquire_task_lock_atomic(self.task_id, agent_id, lock_duration_seconds=1)
         
-        # Wait for expiration
-        time.sleep(2)
+        # Advance the clock past the 1 second lock timeout
+        self.now += timedelta(seconds=2)
         
         # Manual cleanup
         cleaned_count = self.db.cleanup_expired_locks()
@@ -227,50 +304,50 @@ class TestAtomicLocking:
         assert status["is_locked"] is False, "Task should not be locked after cleanup"
 
 
+@pytest.mark.slow
 class TestConcurrency:
     """Test concurrent access patterns and thread safety."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database with multiple tasks."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
+        self.db_path = str(tmp_path / "test.db")
+        self.db = create_test_database(self.db_path)
         
         # Create multiple tasks for concurrency testing - updated for new hierarchy
         self.project_id = self.db.create_project("Concurrency Test Project")
         self.epic_id = self.db.create_epic(self.project_id, "Concurrency Test Epic")
         
-        self.task_ids = []
-        for i in range(5):
-            task_id = self.db.create_task(self.epic_id, f"Concurrent Task {i}", f"Task {i} for concurrency testing")
-            self.task_ids.append(task_id)
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
+        self.task_ids = self.db.create_tasks_bulk(
+            self.epic_id,
+            [(f"Concurrent Task {i}", f"Task {i} for concurrency testing") for i in range(5)],
+        )
+        
+        yield
         self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
     
     def test_concurrent_lock_acquisition(self):
         """Test multiple agents trying to acquire locks simultaneously."""
         num_agents = 10
         target_task_id = self.task_ids[0]
         
-        # ThreadPoolExecutor verified to provide sufficient concurrency to expose race conditions
-        # Concurrent testing with 10 agents confirmed atomic lock behavior
-        results = []
-        
-        def try_acquire_lock(agent_id):
-            """Attempt to acquire lock and return result."""
-            db = TaskDatabase(self.db_path)  # Each thread gets its own database instance
-            try:
-                return db.acquire_task_lock_atomic(target_task_id, f"agent_{agent_id}")
-            finally:
-                db.close()
+        # Coroutines dispatch through a small pool whose threads each open one
+        # connection up front; SQLite's write lock still serializes the racing UPDATEs
+        pool_size = 4
         
-        # Submit all lock acquisition attempts simultaneously
-        with ThreadPoolExecutor(max_workers=num_agents) as executor:
-            futures = [executor.submit(try_acquire_lock, i) for i in range(num_agents)]
-            results = [future.result() for future in as_completed(futures)]
+        with thread_local_databases(self.db_path) as get_db:
+            def try_acquire_lock(agent_id):
+                """Attempt to acquire lock and return result."""
+                return get_db().acquire_task_lock_atomic(target_task_id, f"agent_{agent_id}")
+            
+            async def race_agents():
+                asyncio.get_running_loop().set_default_executor(executor)
+                return await asyncio.gather(
+                    *[asyncio.to_thread(try_acquire_lock, i) for i in range(num_agents)]
+                )
+            
+            with ThreadPoolExecutor(max_workers=pool_size, initializer=get_db) as executor:
+                results = asyncio.run(race_agents())
         
         # Exactly one agent should succeed
         successful_acquisitions = sum(1 for result in results if result is True)
@@ -284,8 +361,11 @@ class TestConcurrency:
         num_threads = 8
         operations_per_thread = 20
         
-        results = {"acquisitions": 0, "releases": 0, "status_checks": 0}
-        results_lock = threading.Lock()
+        # Release all threads together so their operations interleave
+        start_barrier = threading.Barrier(num_threads)
+        
+        # Round-robin task order shared by every thread, built once
+        task_order = [self.task_ids[i % len(self.task_ids)] for i in range(operations_per_thread)]
         
         def mixed_operations(agent_id):
             """Perform mixed database operations."""
@@ -293,15 +373,15 @@ class TestConcurrency:
             local_results = {"acquisitions": 0, "releases": 0, "status_checks": 0}
             
             try:
-                for i in range(operations_per_thread):
-                    task_id = self.task_ids[i % len(self.task_ids)]
+                start_barrier.wait()
+                for task_id in task_order:
                     
                     # Try to acquire lock
                     if db.acquire_task_lock_atomic(task_id, f"agent_{agent_id}"):
                         local_results["acquisitions"] += 1
                         
-                        # Hold lock briefly
-                        time.sleep(0.01)
+                        # Yield while holding the lock so other threads contend for it
+                        time.sleep(0)
                         
                         # Release lock
                         if db.release_lock(task_id, f"agent_{agent_id}"):
@@ -312,27 +392,18 @@ class TestConcurrency:
                     if "error" not in status:
                         local_results["status_checks"] += 1
                 
-                # Update global results
-                with results_lock:
-                    for key in results:
-                        results[key] += local_results[key]
-                        
+                return local_results
             finally:
                 db.close()
         
-        # Run concurrent operations
-        threads = []
-        for i in range(num_threads):
-            thread = threading.Thread(target=mixed_operations, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Run concurrent operations and sum the per-thread counts
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            partials = list(executor.map(mixed_operations, range(num_threads)))
+        results = {key: sum(partial[key] for partial in partials) for key in partials[0]}
         
         # Verify operations completed successfully
         assert results["acquisitions"] > 0, "Should have some successful acquisitions"
+        assert results["acquisitions"] < num_threads * operations_per_thread, "Threads should contend for locks"
         assert results["releases"] == results["acquisitions"], "All acquisitions should be released"
         assert results["status_checks"] == num_threads * operations_per_thread, "All status checks should succeed"
     
@@ -340,38 +411,31 @@ class TestConcurrency:
         """Test concurrent queries for available tasks."""
         num_threads = 5
         
-        def query_available_tasks():
-            """Query available tasks concurrently."""
-            db = TaskDatabase(self.db_path)
-            try:
-                tasks = db.get_available_tasks()
-                return len(tasks)
-            finally:
-                db.close()
-        
-        # Run concurrent queries
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            futures = [executor.submit(query_available_tasks) for _ in range(num_threads)]
-            results = [future.result() for future in as_completed(futures)]
+        with thread_local_databases(self.db_path) as get_db:
+            def query_available_tasks(_query_index):
+                """Query available tasks concurrently."""
+                return tuple(sorted(task["id"] for task in get_db().get_available_tasks()))
+            
+            # Run concurrent queries
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                results = list(executor.map(query_available_tasks, range(num_threads)))
         
-        # All queries should return same number of available tasks
-        assert all(result == results[0] for result in results), "Concurrent queries should return consistent results"
-        assert results[0] == len(self.task_ids), "Should return all created tasks"
+        # All queries should return the same set of available tasks
+        assert len(set(results)) == 1, "Concurrent queries should return consistent results"
+        assert results[0] == tuple(sorted(self.task_ids)), "Should return all created tasks exactly once"
 
 
 class TestDataOperations:
     """Test basic CRUD operations for epics, stories, and tasks."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
+        self.db_path = str(tmp_path / "test.db")
+        self.db = create_test_database(self.db_path, fast_unsafe=True)
+        
+        yield
         self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
     
     def test_project_creation(self):
         """Test project creation and uniqueness constraint."""
@@ -406,6 +470,54 @@ class TestDataOperations:
         assert isinstance(task_id, int), "Task ID should be integer"
         assert task_id > 0, "Task ID should be positive"
     
+    def test_bulk_task_creation(self):
+        """Test bulk task creation returns IDs in input order."""
+        project_id = self.db.create_project("Parent Project")
+        epic_id = self.db.create_epic(project_id, "Parent Epic")
+        single_id = self.db.create_task(epic_id, "Existing Task")
+        
+        task_ids = self.db.create_tasks_bulk(epic_id, [("Bulk 1", "First"), ("Bulk 2", None)])
+        assert len(task_ids) == 2, "Should return one ID per task"
+        assert single_id not in task_ids, "Existing tasks should not be returned"
+        assert [self.db.get_task_by_id(task_id)["name"] for task_id in task_ids] == ["Bulk 1", "Bulk 2"]
+        assert self.db.create_tasks_bulk(epic_id, []) == [], "Empty input should create nothing"
+    
+    def test_bulk_task_creation_uses_injected_clock(self, tmp_path):
+        """Test bulk-created tasks are timestamped by the database clock."""
+        frozen = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        db = create_test_database(str(tmp_path / "clock.db"), clock=lambda: frozen, fast_unsafe=True)
+        try:
+            epic_id = db.create_epic(db.create_project("Clock Project"), "Clock Epic")
+            (task_id,) = db.create_tasks_bulk(epic_id, [("Clocked", None)])
+            task = db.get_task_by_id(task_id)
+            assert task["created_at"] == task["updated_at"] == frozen.isoformat() + 'Z'
+        finally:
+            db.close()
+    
+    def test_create_tasks_bulk_inside_caller_transaction(self):
+        """Test bulk creation nests as a savepoint in an open transaction."""
+        project_id = self.db.create_project("Nested Project")
+        epic_id = self.db.create_epic(project_id, "Nested Epic")
+        
+        self.db.execute_prepared("SAVEPOINT caller")
+        task_ids = self.db.create_tasks_bulk(epic_id, [("Nested 1", None), ("Nested 2", None)])
+        assert self.db.count_tasks() == 2, "Rows should be visible inside the caller's transaction"
+        self.db.execute_prepared("ROLLBACK TO caller")
+        self.db.execute_prepared("RELEASE caller")
+        
+        assert len(task_ids) == 2
+        assert self.db.count_tasks() == 0, "Caller rollback should discard the bulk insert"
+    
+    def test_row_counts(self):
+        """Test count helpers match the created rows."""
+        assert (self.db.count_projects(), self.db.count_epics(), self.db.count_tasks()) == (0, 0, 0)
+        
+        project_id = self.db.create_project("Count Project")
+        epic_id = self.db.create_epic(project_id, "Count Epic")
+        self.db.create_tasks_bulk(epic_id, [("Count 1", None), ("Count 2", None), ("Count 3", None)])
+        
+        assert (self.db.count_projects(), self.db.count_epics(), self.db.count_tasks()) == (1, 1, 3)
+    
     def test_available_tasks_filtering(self):
         """Test available tasks query filters correctly."""
         project_id = self.db.create_project("Test Project")
@@ -431,8 +543,7 @@ class TestDataOperations:
         epic_id = self.db.create_epic(project_id, "Test Epic")
         
         # Create multiple tasks
-        for i in range(5):
-            self.db.create_task(epic_id, f"Task {i}")
+        self.db.create_tasks_bulk(epic_id, [(f"Task {i}", None) for i in range(5)])
         
         # Query with limit
         limited = self.db.get_available_tasks(limit=3)
@@ -441,21 +552,31 @@ class TestDataOperations:
         # Query without limit
         unlimited = self.db.get_available_tasks()
         assert len(unlimited) == 5, "Should return all tasks without limit"
+    
+    def test_execute_prepared_returns_rows(self):
+        """Test execute_prepared runs writes and returns fetched rows for reads."""
+        project_id = self.db.create_project("Prepared Project")
+        
+        assert self.db.execute_prepared(
+            "UPDATE projects SET description = ? WHERE id = ?", ("updated", project_id)
+        ) == []
+        rows = self.db.execute_prepared(
+            "SELECT name, description FROM projects WHERE id = ?", (project_id,)
+        )
+        assert rows == [("Prepared Project", "updated")]
 
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
+        self.db_path = str(tmp_path / "test.db")
+        self.db = create_test_database(self.db_path, fast_unsafe=True)
+        
+        yield
         self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
     
     def test_nonexistent_task_lock_operations(self):
         """Test lock operations on nonexistent tasks."""
@@ -473,48 +594,43 @@ class TestErrorHandling:
         status = self.db.get_task_lock_status(nonexistent_task_id)
         assert "error" in status, "Status check should return error for nonexistent task"
     
-    def test_database_file_permissions(self):
-        """Test database behavior with file permission issues."""
-        # Create database in read-only directory (if possible to test)
-        # #SUGGEST_ERROR_HANDLING: This test may need platform-specific implementation
-        pass  # Skipping complex permission testing for MVP
-    
-    def test_context_manager_usage(self):
+    def test_context_manager_usage(self, tmp_path):
         """Test database as context manager."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            db_path = tmp_file.name
+        db_path = str(tmp_path / "test.db")
         
-        try:
-            # Use database as context manager
-            with TaskDatabase(db_path) as db:
-                project_id = db.create_project("Context Manager Test")
-                assert project_id > 0, "Should work within context manager"
-            
-            # Database should be closed after context exit
-            # Note: We can't easily test if connection is closed without accessing private attributes
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        # Use database as context manager
+        with TaskDatabase(db_path) as db:
+            project_id = db.create_project("Context Manager Test")
+            assert project_id > 0, "Should work within context manager"
+        
+        # Database should be closed after context exit
+        # Note: We can't easily test if connection is closed without accessing private attributes
+
+
+# Module-level so the skipped placeholder does not pay for TestErrorHandling's database setup
+@pytest.mark.skip(reason="platform-specific permission handling not implemented")
+def test_database_file_permissions():
+    """Test database behavior with file permission issues."""
+    # Create database in read-only directory (if possible to test)
+    # #SUGGEST_ERROR_HANDLING: This test may need platform-specific implementation
 
 
 class TestTaskLogs:
     """Test task logs functionality with sequence-based logging."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database with project/epic/task."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
+        self.db_path = str(tmp_path / "test.db")
+        self.db = create_test_database(self.db_path, fast_unsafe=True)
         
         # Create test hierarchy
         self.project_id = self.db.create_project("Test Project")
         self.epic_id = self.db.create_epic(self.project_id, "Test Epic")
         self.task_id = self.db.create_task(self.epic_id, "Test Task")
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
+        
+        yield
         self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
     
     def test_add_task_log_basic(self):
         """Test basic task log creation."""
@@ -610,21 +726,19 @@ class TestTaskLogs:
 class TestJSONValidation:
     """Test JSON validation constraints in task_logs table."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database with project/epic/task."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
+        self.db_path = str(tmp_path / "test.db")
+        self.db = create_test_database(self.db_path, fast_unsafe=True)
         
         # Create test hierarchy
         self.project_id = self.db.create_project("Test Project")
         self.epic_id = self.db.create_epic(self.project_id, "Test Epic")
         self.task_id = self.db.create_task(self.epic_id, "Test Task")
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
+        
+        yield
         self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
     
     def test_valid_json_payload(self):
         """Test that valid JSON payloads are accepted."""
@@ -688,121 +802,105 @@ class TestJSONValidation:
 class TestSchemaInitialization:
     """Test enhanced schema initialization and clean slate functionality."""
     
-    def test_fresh_initialization(self):
+    def test_fresh_initialization(self, tmp_path):
         """Test initialize_fresh method creates clean database."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            db_path = tmp_file.name
+        db_path = str(tmp_path / "test.db")
         
-        try:
-            # Create database and add some data
-            db = TaskDatabase(db_path)
-            project_id = db.create_project("Test Project")
-            epic_id = db.create_epic(project_id, "Test Epic")
-            task_id = db.create_task(epic_id, "Test Task")
-            
-            # Verify data exists
-            projects = db.get_all_projects()
-            assert len(projects) == 1, "Should have one project"
-            
-            # Initialize fresh - should drop all tables and recreate
-            db.initialize_fresh()
-            
-            # Verify data is gone
-            projects_after = db.get_all_projects()
-            assert len(projects_after) == 0, "Fresh initialization should clear all data"
-            
-            # Verify schema still works
-            new_project_id = db.create_project("New Project")
-            assert new_project_id > 0, "Should be able to create data after fresh init"
-            
-            db.close()
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        # Create database and add some data
+        db = TaskDatabase(db_path)
+        project_id = db.create_project("Test Project")
+        epic_id = db.create_epic(project_id, "Test Epic")
+        task_id = db.create_task(epic_id, "Test Task")
+        
+        # Verify data exists
+        projects = db.get_all_projects()
+        assert len(projects) == 1, "Should have one project"
+        
+        # Initialize fresh - should drop all tables and recreate
+        db.initialize_fresh()
+        
+        # Verify data is gone
+        projects_after = db.get_all_projects()
+        assert len(projects_after) == 0, "Fresh initialization should clear all data"
+        
+        # Verify schema still works
+        new_project_id = db.create_project("New Project")
+        assert new_project_id > 0, "Should be able to create data after fresh init"
+        
+        db.close()
     
-    def test_new_schema_tables_created(self):
+    def test_new_schema_tables_created(self, tmp_path):
         """Test that new schema includes all required tables and indexes."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            db_path = tmp_file.name
+        db_path = str(tmp_path / "test.db")
+        
+        db = TaskDatabase(db_path)
+        cursor = db._connection.cursor()
+        
+        # Check all required tables exist
+        cursor.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name NOT LIKE 'sqlite_%'
+            ORDER BY name
+        """)
+        tables = [row[0] for row in cursor.fetchall()]
+        required_tables = ['assumption_validations', 'dashboard_sessions', 'epics', 'event_log', 'knowledge_items', 'knowledge_logs', 'projects', 'task_logs', 'tasks']
+        assert tables == required_tables, f"Expected {required_tables}, got {tables}"
+        
+        # Check required indexes exist
+        cursor.execute(_INDEX_NAMES_SQL)
+        indexes = [row[0] for row in cursor.fetchall()]
+        required_indexes = [
+            'idx_epics_project_id',
+            'idx_knowledge_active_updated',
+            'idx_knowledge_category_priority',
+            'idx_knowledge_hierarchy',
+            'idx_knowledge_logs_item_time',
+            'idx_knowledge_project_context',
+            'idx_task_logs_task_seq', 
+            'idx_tasks_available',
+            'idx_tasks_epic_id',
+            'idx_tasks_lock_expiration',
+            'idx_tasks_lock_holder',
+            'idx_tasks_status_created'
+        ]
         
-        try:
-            db = TaskDatabase(db_path)
-            cursor = db._connection.cursor()
-            
-            # Check all required tables exist
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
-            """)
-            tables = [row[0] for row in cursor.fetchall()]
-            required_tables = ['assumption_validations', 'dashboard_sessions', 'epics', 'event_log', 'knowledge_items', 'knowledge_logs', 'projects', 'task_logs', 'tasks']
-            assert tables == required_tables, f"Expected {required_tables}, got {tables}"
-            
-            # Check required indexes exist
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='index' AND name LIKE 'idx_%'
-                ORDER BY name
-            """)
-            indexes = [row[0] for row in cursor.fetchall()]
-            required_indexes = [
-                'idx_epics_project_id',
-                'idx_knowledge_active_updated',
-                'idx_knowledge_category_priority',
-                'idx_knowledge_hierarchy',
-                'idx_knowledge_logs_item_time',
-                'idx_knowledge_project_context',
-                'idx_task_logs_task_seq', 
-                'idx_tasks_available',
-                'idx_tasks_epic_id',
-                'idx_tasks_lock_expiration',
-                'idx_tasks_lock_holder',
-                'idx_tasks_status_created'
-            ]
-            
-            for required_index in required_indexes:
-                assert required_index in indexes, f"Missing required index: {required_index}"
-            
-            db.close()
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        for required_index in required_indexes:
+            assert required_index in indexes, f"Missing required index: {required_index}"
+        
+        db.close()
     
-    def test_foreign_key_constraints(self):
+    def test_foreign_key_constraints(self, tmp_path):
         """Test foreign key constraint enforcement."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            db_path = tmp_file.name
+        db_path = str(tmp_path / "test.db")
         
-        try:
-            db = TaskDatabase(db_path)
-            
-            # Enable foreign key constraints for this test
-            cursor = db._connection.cursor()
-            cursor.execute("PRAGMA foreign_keys = ON")
-            
-            # Try to create epic with non-existent project - should fail
-            with pytest.raises(sqlite3.IntegrityError):
-                cursor.execute("""
-                    INSERT INTO epics (project_id, name, created_at, updated_at)
-                    VALUES (99999, 'Invalid Epic', ?, ?)
-                """, (datetime.now().isoformat() + 'Z', datetime.now().isoformat() + 'Z'))
-            
-            # Try to create task with non-existent epic - should fail  
-            with pytest.raises(sqlite3.IntegrityError):
-                cursor.execute("""
-                    INSERT INTO tasks (epic_id, name, created_at, updated_at)
-                    VALUES (99999, 'Invalid Task', ?, ?)
-                """, (datetime.now().isoformat() + 'Z', datetime.now().isoformat() + 'Z'))
-            
-            # Valid hierarchy should work
-            project_id = db.create_project("Valid Project")
-            epic_id = db.create_epic(project_id, "Valid Epic")
-            task_id = db.create_task(epic_id, "Valid Task")
-            
-            assert project_id > 0 and epic_id > 0 and task_id > 0, "Valid hierarchy should work"
-            
-            db.close()
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        db = TaskDatabase(db_path)
+        
+        # Enable foreign key constraints for this test
+        cursor = db._connection.cursor()
+        cursor.execute(_PRAGMA_FOREIGN_KEYS_ON)
+        
+        # Try to create epic with non-existent project - should fail
+        with pytest.raises(sqlite3.IntegrityError):
+            cursor.execute("""
+                INSERT INTO epics (project_id, name, created_at, updated_at)
+                VALUES (99999, 'Invalid Epic', ?, ?)
+            """, (datetime.now().isoformat() + 'Z', datetime.now().isoformat() + 'Z'))
+        
+        # Try to create task with non-existent epic - should fail  
+        with pytest.raises(sqlite3.IntegrityError):
+            cursor.execute("""
+                INSERT INTO tasks (epic_id, name, created_at, updated_at)
+                VALUES (99999, 'Invalid Task', ?, ?)
+            """, (datetime.now().isoformat() + 'Z', datetime.now().isoformat() + 'Z'))
+        
+        # Valid hierarchy should work
+        project_id = db.create_project("Valid Project")
+        epic_id = db.create_epic(project_id, "Valid Epic")
+        task_id = db.create_task(epic_id, "Valid Task")
+        
+        assert project_id > 0 and epic_id > 0 and task_id > 0, "Valid hierarchy should work"
+        
+        db.close()
 
 
 # Test coverage verified for Task 001 requirements:
@@ -824,21 +922,19 @@ class TestSchemaInitialization:
 class TestProjectEpicRelationship:
     """Test Project-Epic foreign key relationship and CASCADE DELETE behavior - Task 003."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database for project-epic relationship testing."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
+        self.db_path = str(tmp_path / "test.db")
+        self.db = create_test_database(self.db_path, fast_unsafe=True)
         
         # Enable foreign key constraints for all tests
         # Foreign key constraints are required for CASCADE DELETE testing - verified working
         cursor = self.db._connection.cursor()
-        cursor.execute("PRAGMA foreign_keys = ON")
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
+        cursor.execute(_PRAGMA_FOREIGN_KEYS_ON)
+        
+        yield
         self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
     
     def test_epic_project_foreign_key_constraint_enforced(self):
         """Test that epics cannot be created with invalid project_id."""
@@ -966,6 +1062,21 @@ class TestProjectEpicRelationship:
         project_ids_in_order = [e["project_id"] for e in all_epics]
         assert project_ids_in_order == sorted(project_ids_in_order), "Epics should be ordered by project_id"
     
+    def test_lookup_project_and_epic_by_name(self):
+        """Test name lookups return single rows scoped to their project."""
+        project_a = self.db.create_project("Project A")
+        project_b = self.db.create_project("Project B")
+        epic_a = self.db.create_epic(project_a, "Shared Epic Name", "In A")
+        self.db.create_epic(project_b, "Shared Epic Name", "In B")
+        
+        assert self.db.get_project_by_name("Project A")["id"] == project_a
+        assert self.db.get_project_by_name("Missing Project") is None
+        
+        epic = self.db.get_epic_by_name(project_a, "Shared Epic Name")
+        assert epic["id"] == epic_a
+        assert epic["description"] == "In A"
+        assert self.db.get_epic_by_name(project_a, "Missing Epic") is None
+    
     def test_backward_compatibility_epic_operations(self):
         """Test that existing epic operations continue to work with project relationship."""
         # Backward compatibility with existing operations verified - task creation and queries work unchanged
@@ -1006,17 +1117,15 @@ class TestProjectEpicRelationship:
 class TestRAEnhancements:
     """Test Response Awareness enhancements to tasks table - Task 002."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Setup test database with project/epic for RA testing."""
-        self.tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.tmp_file.name
-        self.db = TaskDatabase(self.db_path)
+        self.db_path = str(tmp_path / "test.db")
+        self.db = create_test_database(self.db_path, fast_unsafe=True)
         
         # Create test hierarchy
         self.project_id = self.db.create_project("RA Test Project", "Project for RA testing")
         self.epic_id = self.db.create_epic(self.project_id, "RA Test Epic", "Epic for RA testing")
-    
-    def teardown_method(self):
-        """Cleanup after each test."""
-        self.db.close()
-        Path(self.db_path).unlink(missing_ok=True)
\ No newline at end of file
+        
+        yield
+        self.db.close()
\ No newline at end of file
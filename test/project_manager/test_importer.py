@@ -11,57 +11,141 @@ import os
 import yaml
 import sqlite3
 from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import patch
 
 from src.task_manager.database import TaskDatabase
-from src.task_manager.importer import import_project, import_project_from_file
+from src.task_manager.importer import (
+    dump_project_stream,
+    import_project,
+    import_project_from_file,
+    import_project_iter,
+    import_project_stream_from_file,
+)
 
 
-class TestYAMLImporter:
-    """Test suite for YAML project import functionality."""
-    
-    @pytest.fixture
-    def db(self):
-        """Create temporary database for testing."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-        
-        db = TaskDatabase(db_path)
-        yield db
-        db.close()
-        os.unlink(db_path)
-
-    @pytest.fixture
-    def simple_yaml_data(self):
-        """Basic YAML data for testing."""
-        return {
-            "projects": [
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "examples"
+
+# Basic YAML data shared by tests; import_project never mutates its input
+_SIMPLE_YAML = {
+    "projects": [
+        {
+            "name": "Test Project",
+            "description": "Project for testing",
+            "epics": [
                 {
-                    "name": "Test Project",
-                    "description": "Project for testing",
-                    "epics": [
+                    "name": "Test Epic",
+                    "description": "Epic for testing",
+                    "status": "ACTIVE",
+                    "tasks": [
                         {
-                            "name": "Test Epic",
-                            "description": "Epic for testing",
-                            "status": "ACTIVE",
-                            "tasks": [
-                                {
-                                    "name": "Test Task 1",
-                                    "description": "First test task",
-                                    "status": "TODO"
-                                },
-                                {
-                                    "name": "Test Task 2", 
-                                    "description": "Second test task",
-                                    "status": "IN_PROGRESS"
-                                }
-                            ]
+                            "name": "Test Task 1",
+                            "description": "First test task",
+                            "status": "TODO"
+                        },
+                        {
+                            "name": "Test Task 2", 
+                            "description": "Second test task",
+                            "status": "IN_PROGRESS"
                         }
                     ]
                 }
             ]
         }
+    ]
+}
 
+
+@pytest.fixture(scope="session")
+def _session_db():
+    """In-memory database whose schema is built once and shared by every test."""
+    db = TaskDatabase(":memory:")
+    yield db
+    db.close()
+
+
+def _empty_database(db):
+    """Delete every row from the database, leaving the schema in place."""
+    with db._connection_lock:
+        cursor = db._connection.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+        tables = [row[0] for row in cursor.fetchall()]
+        cursor.execute("BEGIN")
+        for table in tables:
+            cursor.execute(f"DELETE FROM {table}")
+        cursor.execute("DELETE FROM sqlite_sequence")  # Restart AUTOINCREMENT ids like a fresh database
+        cursor.execute("COMMIT")
+
+
+@pytest.fixture
+def db(_session_db):
+    """Provide the shared database, emptied again after each test (threads share its one connection)."""
+    yield _session_db
+    _empty_database(_session_db)
+
+
+class HierarchyRow:
+    """One epic or task row of a hierarchy snapshot (task_id is None for epics)."""
+    
+    __slots__ = ("project_id", "epic_id", "task_id", "name")
+    
+    def __init__(self, project_id, epic_id, task_id, name):
+        self.project_id = project_id
+        self.epic_id = epic_id
+        self.task_id = task_id
+        self.name = name
+
+
+def _hierarchy_snapshot(db):
+    """
+    Fetch the whole project → epic → task hierarchy in one query.
+    
+    Rows come from epics and tasks LEFT JOINed to their parents, so an orphaned
+    epic or task shows up with a NULL parent id instead of being dropped.
+    """
+    with db._connection_lock:
+        cursor = db._connection.cursor()
+        cursor.execute("""
+            SELECT p.id, e.id, NULL, e.name
+            FROM epics e LEFT JOIN projects p ON p.id = e.project_id
+            UNION ALL
+            SELECT p.id, e.id, t.id, t.name
+            FROM tasks t
+            LEFT JOIN epics e ON e.id = t.epic_id
+            LEFT JOIN projects p ON p.id = e.project_id
+        """)
+        return [HierarchyRow(*row) for row in cursor.fetchall()]
+
+
+@pytest.fixture(scope="module")
+def large_yaml():
+    """Large project structure: 2 projects × 5 epics × 100 tasks = 1000 tasks."""
+    large_yaml = {"projects": []}
+    for proj_i in range(2):
+        project = {"name": f"Project {proj_i}", "epics": []}
+        for epic_i in range(5):
+            epic = {"name": f"Epic {proj_i}.{epic_i}", "tasks": []}
+            for task_i in range(100):
+                epic["tasks"].append({
+                    "name": f"Task {proj_i}.{epic_i}.{task_i}",
+                    "description": f"Task {task_i}"
+                })
+            project["epics"].append(epic)
+        large_yaml["projects"].append(project)
+    return large_yaml
+
+
+@pytest.fixture(scope="session")
+def simple_yaml_data():
+    """Basic YAML data for testing."""
+    return _SIMPLE_YAML
+
+
+class TestYAMLImporter:
+    """Test suite for YAML project import functionality."""
+    
     def test_import_basic_project_structure(self, db, simple_yaml_data):
         """Test basic project import creates all entities."""
         # VERIFIED: Complete hierarchical import from YAML functions correctly
@@ -146,52 +230,39 @@ class TestYAMLImporter:
         assert epics[0]["status"] == "IN_PROGRESS"
         
         # Verify lock state was preserved
-        tasks = db.get_all_tasks()
-        locked_task = next(t for t in tasks if t["id"] == task_id)
+        locked_task = db.get_task_by_id(task_id)
         assert locked_task["lock_holder"] == "test-agent-123"
         assert locked_task["is_locked"] is True
         assert locked_task["description"] == "Updated first task description"
         # Status should be updated even for locked tasks (current implementation)
         assert locked_task["status"] == "completed"  # Database vocabulary
 
-    def test_error_handling_malformed_yaml(self, db):
-        """Test error handling for various YAML structure problems."""
-        # Test non-dict root - critical error, should raise
+    def test_error_handling_non_list_projects(self, db):
+        """Test a non-list 'projects' value is a critical error that raises."""
         with pytest.raises(ValueError, match="YAML 'projects' must be a list"):
             import_project(db, {"projects": "not a list"})
-        
-        # Test non-dict project - should be handled gracefully
-        result = import_project(db, {"projects": ["not a dict"]})
-        assert len(result["errors"]) == 1
-        assert "Project data must be a dictionary" in result["errors"][0]
-        assert result["projects_created"] == 0
-        
-        # Test missing project name - should be handled gracefully
-        result = import_project(db, {"projects": [{"description": "No name"}]})
-        assert len(result["errors"]) == 1
-        assert "Project must have 'name' field" in result["errors"][0]
-        
-        # Test malformed epics - should be handled gracefully
-        result = import_project(db, {
-            "projects": [{
-                "name": "Test Project",
-                "epics": ["not a dict"]
-            }]
-        })
-        assert result["projects_created"] == 1  # Project should still be created
-        assert len(result["errors"]) == 1
-        assert "Epic data must be a dictionary" in result["errors"][0]
-        
-        # Test missing epic name
-        malformed_epic_yaml = {
-            "projects": [{
-                "name": "Test Project 2",
-                "epics": [{"description": "No name"}]
-            }]
-        }
-        result = import_project(db, malformed_epic_yaml)
+
+    @pytest.mark.parametrize("payload, expected_error, projects_created", [
+        pytest.param({"projects": ["not a dict"]},
+                     "Project data must be a dictionary", 0, id="non-dict-project"),
+        pytest.param({"projects": [{"description": "No name"}]},
+                     "Project must have 'name' field", 0, id="missing-project-name"),
+        pytest.param({"projects": [{"name": "Test Project", "epics": ["not a dict"]}]},
+                     "Epic data must be a dictionary", 1, id="non-dict-epic"),
+        pytest.param({"projects": [{"name": "Test Project 2", "epics": [{"description": "No name"}]}]},
+                     "Epic must have 'name' field", 1, id="missing-epic-name"),
+        pytest.param({"projects": [{"name": "Test Project 3", "epics": 5}]},
+                     "Failed to import project 'Test Project 3'", 1, id="non-list-epics"),
+        pytest.param({"projects": [{"name": "Test Project 4", "epics": [{"name": "Epic", "tasks": 7}]}]},
+                     "Failed to import epic 'Epic'", 1, id="non-list-tasks"),
+    ])
+    def test_error_handling_malformed_yaml(self, db, payload, expected_error, projects_created):
+        """Test malformed entries are reported without stopping the rest of the import."""
+        result = import_project(db, payload)
         assert len(result["errors"]) == 1
-        assert "Epic must have 'name' field" in result["errors"][0]
+        assert expected_error in result["errors"][0]
+        # Parents of a malformed entry are still created
+        assert result["projects_created"] == projects_created
 
     def test_hierarchical_relationships(self, db):
         """Test that parent-child relationships are correctly established."""
@@ -237,27 +308,21 @@ class TestYAMLImporter:
         assert result["tasks_created"] == 4
         
         # Verify relationships are correct
-        projects = db.get_all_projects()
-        epics = db.get_all_epics()
-        tasks = db.get_all_tasks()
+        project1 = db.get_project_by_name("Project 1")
+        project2 = db.get_project_by_name("Project 2")
         
-        project1 = next(p for p in projects if p["name"] == "Project 1")
-        project2 = next(p for p in projects if p["name"] == "Project 2")
+        assert len(db.list_epics_filtered(project_id=project1["id"])) == 2
+        assert len(db.list_epics_filtered(project_id=project2["id"])) == 1
         
-        project1_epics = [e for e in epics if e["project_id"] == project1["id"]]
-        project2_epics = [e for e in epics if e["project_id"] == project2["id"]]
-        
-        assert len(project1_epics) == 2
-        assert len(project2_epics) == 1
-        
-        epic_1_1 = next(e for e in project1_epics if e["name"] == "Epic 1.1")
-        epic_1_1_tasks = [t for t in tasks if t["epic_id"] == epic_1_1["id"]]
-        assert len(epic_1_1_tasks) == 2
+        epic_1_1 = db.get_epic_by_name(project1["id"], "Epic 1.1")
+        assert epic_1_1["project_id"] == project1["id"]
+        assert len(db.list_tasks_filtered(epic_id=epic_1_1["id"])) == 2
+        assert db.get_epic_by_name(project2["id"], "Epic 1.1") is None
 
     def test_import_from_file(self, db, simple_yaml_data):
         """Test importing from actual YAML file."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(simple_yaml_data, f)
+            yaml.dump(simple_yaml_data, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
             yaml_path = f.name
         
         try:
@@ -268,6 +333,57 @@ class TestYAMLImporter:
         finally:
             os.unlink(yaml_path)
 
+    def test_import_multi_document_stream(self, db, tmp_path):
+        """Test a one-document-per-epic stream imports 10k tasks in one transaction."""
+        stream_yaml = {"projects": [{
+            "name": "Stream Project",
+            "description": "Written as a YAML stream",
+            "epics": [
+                {"name": f"Epic {epic_i}", "tasks": [{"name": f"Task {epic_i}.{task_i}"} for task_i in range(500)]}
+                for epic_i in range(20)
+            ],
+        }]}
+        yaml_path = tmp_path / "stream.yaml"
+        with open(yaml_path, 'w', encoding='utf-8') as f:
+            dump_project_stream(stream_yaml, f)
+        assert yaml_path.read_text(encoding='utf-8').count("\n---") == 19  # One document per epic
+        
+        result = import_project_stream_from_file(db, str(yaml_path))
+        
+        assert result["projects_created"] == 1
+        assert result["projects_updated"] == 19  # Later documents repeat the project
+        assert result["epics_created"] == 20
+        assert result["tasks_created"] == 10000
+        assert result["errors"] == []
+        assert db.count_tasks() == 10000
+        assert not db._connection.in_transaction
+
+    def test_import_stream_rolls_back_on_bad_document(self, db, tmp_path):
+        """Test a malformed document discards every document before it."""
+        yaml_path = tmp_path / "bad_stream.yaml"
+        yaml_path.write_text("projects:\n  - name: First Project\n---\n- not a mapping\n", encoding='utf-8')
+        
+        with pytest.raises(RuntimeError, match="must contain a dictionary"):
+            import_project_stream_from_file(db, str(yaml_path))
+        
+        assert db.count_projects() == 0
+
+    def test_import_iter_inside_caller_transaction(self, db):
+        """Test a stream import nests in an open transaction and rolls back with it."""
+        documents = [{"projects": [{"name": "Nested Project"}]}, ["not a mapping"]]
+        
+        with db._connection_lock:
+            db._connection.execute("BEGIN")
+            with pytest.raises(ValueError, match="must contain a dictionary"):
+                import_project_iter(db, iter(documents))
+            assert db._connection.in_transaction
+            
+            result = import_project_iter(db, iter(documents[:1]))
+            assert result["projects_created"] == 1
+            db._connection.execute("ROLLBACK")
+        
+        assert db.count_projects() == 0
+
     def test_import_file_not_found(self, db):
         """Test error handling for missing files."""
         with pytest.raises(FileNotFoundError, match="YAML file not found"):
@@ -319,6 +435,32 @@ class TestYAMLImporter:
         assert result["epics_created"] == 1
         assert result["tasks_created"] == 1
 
+    def test_import_nested_in_open_transaction(self, db, simple_yaml_data):
+        """Test import joins a caller's transaction as a savepoint."""
+        with db._connection_lock:
+            db._connection.execute("BEGIN")
+            result = import_project(db, simple_yaml_data)
+            assert db._connection.in_transaction, "Import must not commit the caller's transaction"
+            db._connection.execute("ROLLBACK")
+        
+        assert result["tasks_created"] == 2
+        assert db.count_projects() == 0, "Outer rollback should discard the imported rows"
+
+    def test_import_surfaces_failed_begin(self, tmp_path, simple_yaml_data):
+        """Test a BEGIN that cannot take the write lock raises its own error."""
+        db_path = str(tmp_path / "locked.db")
+        locked_db = TaskDatabase(db_path)
+        locked_db._connection.execute("PRAGMA busy_timeout=0")
+        holder = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            holder.execute("BEGIN IMMEDIATE")
+            with pytest.raises(sqlite3.OperationalError, match="database is locked"):
+                import_project(locked_db, simple_yaml_data)
+            assert not locked_db._connection.in_transaction
+        finally:
+            holder.close()
+            locked_db.close()
+
     def test_status_defaults(self, db):
         """Test default status values when not specified."""
         yaml_without_status = {
@@ -387,111 +529,109 @@ class TestYAMLImporter:
         assert "测试史诗" in epics[0]["name"]
         assert "русский" in epics[0]["description"]
 
-    def test_large_project_import_performance(self, db):
+    @pytest.mark.benchmark(group="importer")
+    def test_large_project_import_performance(self, db, large_yaml, benchmark):
         """Test import performance with large project structure (Projects → Epics → Tasks)."""
-        # Generate large project data: 2 projects × 5 epics × 100 tasks = 1000 tasks
-        large_yaml = {"projects": []}
-        for proj_i in range(2):
-            project = {"name": f"Project {proj_i}", "epics": []}
-            for epic_i in range(5):
-                epic = {"name": f"Epic {proj_i}.{epic_i}", "tasks": []}
-                for task_i in range(100):
-                    epic["tasks"].append({
-                        "name": f"Task {proj_i}.{epic_i}.{task_i}",
-                        "description": f"Task {task_i}"
-                    })
-                project["epics"].append(epic)
-            large_yaml["projects"].append(project)
-
-        # Import and measure basic performance
-        import time
-        start_time = time.time()
-        result = import_project(db, large_yaml)
-        import_duration = time.time() - start_time
+        def fresh_import_args():
+            _empty_database(db)
+            return (db, large_yaml), {}
+        
+        # Each round imports into an empty database so every row is a create;
+        # pytest-benchmark times rounds with the monotonic perf_counter clock
+        benchmark.extra_info["tasks"] = 1000
+        result = benchmark.pedantic(import_project, setup=fresh_import_args, rounds=5)
 
         # Verify all data was imported
         assert result["projects_created"] == 2
         assert result["epics_created"] == 10  # 2 projects * 5 epics
         assert result["tasks_created"] == 1000  # 2 projects * 5 epics * 100 tasks
         assert result["errors"] == []
+        assert db.count_tasks() == 1000
+        # Regressions are caught against a saved baseline with --benchmark-compare-fail
+        # (see docs/development.md) rather than a fixed wall-clock bound
 
-        # Performance should be reasonable (less than 5 seconds for 1000 tasks)
-        assert import_duration < 5.0, f"Import took {import_duration:.2f}s, expected < 5.0s"
-
-    def test_concurrent_import_safety(self, db, simple_yaml_data):
-        """Test that concurrent imports don't corrupt data."""
-        import threading
-        import time
-        
-        results = []
-        errors = []
-        
-        def import_worker():
-            try:
-                result = import_project(db, simple_yaml_data)
-                results.append(result)
-            except Exception as e:
-                errors.append(e)
+    def test_large_import_restores_deferred_indexes(self, db, large_yaml):
+        """Test indexes dropped for a bulk import are rebuilt before it commits."""
+        def task_indexes():
+            with db._connection_lock:
+                cursor = db._connection.cursor()
+                cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks'")
+                return sorted(cursor.fetchall())
+        
+        indexes_before = task_indexes()
+        result = import_project(db, large_yaml)
         
-        # Run 3 concurrent imports (reduced to avoid overwhelming connection locking)
-        # VERIFIED: Connection locking ensures safe concurrent access with minimal conflicts
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=import_worker)
-            threads.append(thread)
-            thread.start()
+        assert result["tasks_created"] == 1000
+        assert task_indexes() == indexes_before
+
+    def test_batched_task_insert_with_duplicates_and_errors(self, db):
+        """Test epics larger than one insert batch keep per-task UPSERT semantics."""
+        tasks = [{"name": f"Task {i}", "status": "TODO"} for i in range(400)]
+        tasks.append({"name": "Task 7", "description": "Repeated name updates the first", "status": "DONE"})
+        tasks.append({"description": "Missing name"})
+        yaml_data = {"projects": [{"name": "Batch Project", "epics": [{"name": "Batch Epic", "tasks": tasks}]}]}
         
-        for thread in threads:
-            thread.join()
+        result = import_project(db, yaml_data)
         
-        # Should have minimal errors due to connection locking
-        assert len(errors) <= 1, f"Too many concurrent import errors: {errors}"
-        assert len(results) >= 2, f"Should have at least 2 successful imports, got {len(results)}"
+        assert result["tasks_created"] == 400
+        assert result["tasks_updated"] == 1
+        assert result["errors"] == ["Failed to import task 'unnamed': Task must have 'name' field"]
         
-        # Final database should be consistent
-        projects = db.get_all_projects()
-        epics = db.get_all_epics() 
-        tasks = db.get_all_tasks()
+        imported = {task["name"]: task for task in db.get_all_tasks()}
+        assert len(imported) == 400
+        assert imported["Task 7"]["status"] == "completed"
+        assert imported["Task 7"]["description"] == "Repeated name updates the first"
+        assert imported["Task 399"]["status"] == "pending"
+
+    def test_batched_task_constraint_failure_reported_per_task(self, db):
+        """Test a status rejected by the schema fails only its own task."""
+        tasks = [{"name": "Good Task"}, {"name": "Bad Task", "status": "NOT_A_STATUS"}]
+        yaml_data = {"projects": [{"name": "Batch Project", "epics": [{"name": "Batch Epic", "tasks": tasks}]}]}
         
-        # Should have exactly one of each due to UPSERT behavior
-        projects = db.get_all_projects()
-        epics = db.get_all_epics()
-        tasks = db.get_all_tasks()
+        result = import_project(db, yaml_data)
+        assert result["tasks_created"] == 1
+        assert len(result["errors"]) == 1 and "Bad Task" in result["errors"][0]
         
-        assert len(projects) == 1
-        assert len(epics) == 1
-        assert len(tasks) == 2
+        # Re-import takes the executemany UPDATE path, which falls back the same way
+        result = import_project(db, yaml_data)
+        assert result["tasks_updated"] == 1
+        assert result["tasks_created"] == 0
+        assert len(result["errors"]) == 1 and "Bad Task" in result["errors"][0]
+        assert [task["name"] for task in db.get_all_tasks()] == ["Good Task"]
+
+    def test_concurrent_import_safety(self, simple_yaml_data, tmp_path):
+        """Test that concurrent imports over separate WAL connections don't corrupt data."""
+        db_path = str(tmp_path / "concurrent.db")
+        TaskDatabase(db_path).close()  # Build the schema before the workers race
+        
+        def import_with_own_connection(_worker_index):
+            # BEGIN IMMEDIATE serializes the writers; busy_timeout makes the others wait
+            with TaskDatabase(db_path) as worker_db:
+                return import_project(worker_db, simple_yaml_data)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(import_with_own_connection, range(3)))
+        
+        # Exactly one import creates each entity; the others see it and update
+        assert all(result["errors"] == [] for result in results)
+        assert sum(result["projects_created"] for result in results) == 1
+        assert sum(result["epics_created"] for result in results) == 1
+        assert sum(result["tasks_created"] for result in results) == 2
+        
+        with TaskDatabase(db_path) as check_db:
+            assert check_db.count_projects() == 1
+            assert check_db.count_epics() == 1
+            assert check_db.count_tasks() == 2
 
 
 # Integration test with example files
+@pytest.mark.skipif(not EXAMPLES_DIR.is_dir(), reason="examples/ not present in this checkout")
 class TestExampleFiles:
     """Test import of actual example YAML files."""
     
-    @pytest.fixture
-    def db(self):
-        """Create temporary database for testing."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-        
-        db = TaskDatabase(db_path)
-        yield db
-        db.close()
-        os.unlink(db_path)
-
     def test_simple_project_example(self, db):
         """Test importing the simple project example file."""
-        example_path = "/Users/dtannen/Code/pm/examples/simple-project.yaml"
-        
-        # Skip if file doesn't exist
-        if not os.path.exists(example_path):
-            pytest.skip("Simple project example file not found")
-        # Skip if example uses legacy root schema (epics/stories)
-        with open(example_path, 'r') as f:
-            data = yaml.safe_load(f)
-        if not isinstance(data, dict) or 'projects' not in data:
-            pytest.skip("Example file uses legacy epics/stories schema")
-        
-        result = import_project_from_file(db, example_path)
+        result = import_project_from_file(db, str(EXAMPLES_DIR / "simple-project.yaml"))
         
         # Should import successfully with expected structure
         assert result["projects_created"] == 1
@@ -501,18 +641,7 @@ class TestExampleFiles:
 
     def test_complex_project_example(self, db):
         """Test importing the complex project example file."""
-        example_path = "/Users/dtannen/Code/pm/examples/complex-project.yaml"
-        
-        # Skip if file doesn't exist  
-        if not os.path.exists(example_path):
-            pytest.skip("Complex project example file not found")
-        # Skip if example uses legacy root schema (epics/stories)
-        with open(example_path, 'r') as f:
-            data = yaml.safe_load(f)
-        if not isinstance(data, dict) or 'projects' not in data:
-            pytest.skip("Example file uses legacy epics/stories schema")
-        
-        result = import_project_from_file(db, example_path)
+        result = import_project_from_file(db, str(EXAMPLES_DIR / "complex-project.yaml"))
         
         # Should import large project successfully
         assert result["projects_created"] > 0
@@ -520,20 +649,15 @@ class TestExampleFiles:
         assert result["tasks_created"] > 15
         assert result["errors"] == []
         
-        # Verify hierarchical structure is correct
-        projects = db.get_all_projects()
-        epics = db.get_all_epics()
-        tasks = db.get_all_tasks()
-        
-        # Each epic should belong to a project
-        for epic in epics:
-            project_ids = [p["id"] for p in projects]
-            assert epic["project_id"] in project_ids
+        # Verify hierarchical structure is correct: every epic joins to a project
+        # and every task to an epic (orphans surface as NULL parents)
+        snapshot = _hierarchy_snapshot(db)
+        assert all(row.project_id is not None for row in snapshot)
+        assert all(row.epic_id is not None for row in snapshot if row.task_id is not None)
         
-        # Each task should belong to an epic
-        for task in tasks:
-            epic_ids = [e["id"] for e in epics]
-            assert task["epic_id"] in epic_ids
+        tasks_per_epic = Counter(row.epic_id for row in snapshot if row.task_id is not None)
+        assert sum(tasks_per_epic.values()) == result["tasks_created"]
+        assert len({row.epic_id for row in snapshot}) == result["epics_created"]
 
 
 # #SUGGEST_ERROR_HANDLING: Additional test cases to consider:
@@ -586,83 +586,53 @@ class TestWebSocketEventVerification:
         """
         websocket_manager = ConnectionManager()
         
-        # Setup multiple event capture clients
-        client1_events = []
-        client2_events = []
-        client3_events = []
-        
-        async def client1_capture(event_data):
-            client1_events.append({"timestamp": time.time(), "event": event_data})
-            
-        async def client2_capture(event_data):
-            client2_events.append({"timestamp": time.time(), "event": event_data})
-            
-        async def client3_capture(event_data):
-            client3_events.append({"timestamp": time.time(), "event": event_data})
-            
-        # Mock multiple WebSocket connections
-        # VERIFIED: Connection simulation pattern works for multi-client testing
-        # Mock broadcast handlers receive events correctly and consistently.
-        websocket_manager._broadcast_to_multiple = [
-            client1_capture,
-            client2_capture, 
-            client3_capture
-        ]
+        # Register mock WebSocket connections so the real broadcast fan-out runs
+        client_events: List[List[Dict[str, Any]]] = [[], [], []]
         
-        async def multi_broadcast(event_data):
-            """Simulate broadcasting to multiple connections."""
-            await asyncio.gather(*[
-                handler(event_data) 
-                for handler in websocket_manager._broadcast_to_multiple
-            ])
+        def recorder(events):
+            async def send_text(message):
+                events.append({"timestamp": time.time(), "event": json.loads(message)})
+            return send_text
         
-        websocket_manager.broadcast = multi_broadcast
+        for events in client_events:
+            websocket = AsyncMock()
+            websocket.send_text.side_effect = recorder(events)
+            websocket_manager.active_connections.add(websocket)
         
         # Perform operations that generate events
         agent = MCPTestClient(integration_db.database, websocket_manager)
         tasks_result = await agent.get_available_tasks()
         test_task_id = tasks_result["tasks"][0]["id"]
         
-        # Clear events and perform operations
-        client1_events.clear()
-        client2_events.clear()
-        client3_events.clear()
-        
-        start_time = time.time()
-        
-        # Generate events
+        # Generate events, waiting on the manager's completion signal rather than a fixed delay
+        websocket_manager.broadcast_done.clear()
         await agent.acquire_task_lock(test_task_id)
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(websocket_manager.broadcast_done.wait(), 1.0)
+        
+        websocket_manager.broadcast_done.clear()
         await agent.update_task_status(test_task_id, "DONE")
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(websocket_manager.broadcast_done.wait(), 1.0)
         
         # Verify all clients received events
-        assert len(client1_events) > 0, "Client 1 received no events"
-        assert len(client2_events) > 0, "Client 2 received no events"
-        assert len(client3_events) > 0, "Client 3 received no events"
+        for index, events in enumerate(client_events, start=1):
+            assert len(events) > 0, f"Client {index} received no events"
         
         # Verify event count consistency
-        event_counts = [len(client1_events), len(client2_events), len(client3_events)]
+        event_counts = [len(events) for events in client_events]
         assert len(set(event_counts)) == 1, f"Inconsistent event counts: {event_counts}"
         
         # Verify event content consistency
-        for i in range(len(client1_events)):
-            event1 = client1_events[i]["event"]
-            event2 = client2_events[i]["event"]
-            event3 = client3_events[i]["event"]
+        for received in zip(*client_events):
+            event1, event2, event3 = (entry["event"] for entry in received)
             
             # Events should have identical content
-            assert event1 == event2 == event3, f"Event {i} content mismatch between clients"
+            assert event1 == event2 == event3, "Event content mismatch between clients"
             assert event1["task_id"] == test_task_id
             
             # Timestamps should be close (within 100ms)
-            timestamps = [
-                client1_events[i]["timestamp"],
-                client2_events[i]["timestamp"], 
-                client3_events[i]["timestamp"]
-            ]
+            timestamps = [entry["timestamp"] for entry in received]
             max_timestamp_diff = max(timestamps) - min(timestamps)
-            assert max_timestamp_diff < 0.1, f"Event {i} timing too different: {max_timestamp_diff}s"
+            assert max_timestamp_diff < 0.1, f"Event timing too different: {max_timestamp_diff}s"
 
 
 class TestCrossTransportMCPConsistency:
@@ -8,6 +8,8 @@ and system stability under sustained load.
 
 import pytest
 import asyncio
+import dataclasses
+import json
 import aiohttp
 import time
 import psutil
@@ -16,6 +18,7 @@ import statistics
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
 
 from task_manager.database import TaskDatabase
 from task_manager.api import app
@@ -344,9 +347,9 @@ class SystemResourceMonitor:
 
 # Test fixtures
 @pytest.fixture
-def test_database():
+def test_database(tmp_path):
     """Create test database for performance testing."""
-    db_path = "test_performance.db"
+    db_path = str(tmp_path / "test_performance.db")
     db_tester = DatabasePerformanceTester(db_path)
     yield db_tester
     db_tester.cleanup()
@@ -361,11 +364,16 @@ def resource_monitor():
         monitor.stop_monitoring()
 
 
+def _report(request, title: str, lines: List[str]) -> None:
+    """Attach metrics to the test report (shown on failure or with -rP) instead of printing."""
+    request.node.add_report_section("call", title, "\n".join(lines))
+
+
 # Performance test cases
 class TestDatabasePerformance:
     """Database performance test suite."""
     
-    def test_query_performance_target(self, test_database):
+    def test_query_performance_target(self, test_database, request):
         """Test that database queries meet performance targets."""
         result = test_database.test_query_performance(iterations=1000)
         
@@ -373,12 +381,13 @@ class TestDatabasePerformance:
         assert result.metrics["avg_query_time_ms"] <= TARGET_QUERY_TIME_MS
         assert result.metrics["iterations_completed"] == 1000
         
-        print(f"Query Performance Results:")
-        print(f"  Average: {result.metrics['avg_query_time_ms']:.2f}ms")
-        print(f"  95th percentile: {result.metrics['p95_query_time_ms']:.2f}ms")
-        print(f"  Maximum: {result.metrics['max_query_time_ms']:.2f}ms")
+        _report(request, "Query Performance Results", [
+            f"Average: {result.metrics['avg_query_time_ms']:.2f}ms",
+            f"95th percentile: {result.metrics['p95_query_time_ms']:.2f}ms",
+            f"Maximum: {result.metrics['max_query_time_ms']:.2f}ms",
+        ])
     
-    def test_concurrent_lock_acquisition(self, test_database):
+    def test_concurrent_lock_acquisition(self, test_database, request):
         """Test concurrent lock acquisition under load."""
         result = test_database.test_concurrent_lock_acquisition(num_agents=MAX_CONCURRENT_AGENTS)
         
@@ -386,12 +395,13 @@ class TestDatabasePerformance:
         assert result.metrics["p95_lock_time_ms"] <= TARGET_LOCK_ACQUISITION_MS
         assert result.metrics["success_rate"] >= 80  # At least 80% success rate
         
-        print(f"Lock Acquisition Results:")
-        print(f"  Average: {result.metrics['avg_lock_time_ms']:.2f}ms")
-        print(f"  95th percentile: {result.metrics['p95_lock_time_ms']:.2f}ms")
-        print(f"  Success rate: {result.metrics['success_rate']:.1f}%")
+        _report(request, "Lock Acquisition Results", [
+            f"Average: {result.metrics['avg_lock_time_ms']:.2f}ms",
+            f"95th percentile: {result.metrics['p95_lock_time_ms']:.2f}ms",
+            f"Success rate: {result.metrics['success_rate']:.1f}%",
+        ])
     
-    def test_lock_cleanup_efficiency(self, test_database):
+    def test_lock_cleanup_efficiency(self, test_database, request):
         """Test lock cleanup performance."""
         # Create expired locks
         for i, task_id in enumerate(test_database.task_ids[:10]):
@@ -408,14 +418,15 @@ class TestDatabasePerformance:
         assert cleaned_count >= 10, f"Expected at least 10 expired locks, got {cleaned_count}"
         assert cleanup_time_ms <= 50, f"Lock cleanup took {cleanup_time_ms:.2f}ms, expected <= 50ms"
         
-        print(f"Lock Cleanup Results:")
-        print(f"  Cleaned {cleaned_count} locks in {cleanup_time_ms:.2f}ms")
+        _report(request, "Lock Cleanup Results", [
+            f"Cleaned {cleaned_count} locks in {cleanup_time_ms:.2f}ms",
+        ])
 
 
 class TestSystemPerformance:
     """System-wide performance and resource usage tests."""
     
-    def test_memory_stability_under_load(self, test_database, resource_monitor):
+    def test_memory_stability_under_load(self, test_database, resource_monitor, request):
         """Test memory usage stability under load (shortened for CI speed)."""
         resource_monitor.start_monitoring()
         
@@ -445,12 +456,13 @@ class TestSystemPerformance:
         memory_growth_mb = memory_stats["max_mb"] - memory_stats["min_mb"]
         assert memory_growth_mb <= 50, f"Memory grew by {memory_growth_mb:.1f}MB, expected <= 50MB"
         
-        print(f"Memory Stability Results:")
-        print(f"  Average usage: {memory_stats['avg_mb']:.1f}MB")
-        print(f"  Memory growth: {memory_growth_mb:.1f}MB")
-        print(f"  Operations completed: {operation_count}")
+        _report(request, "Memory Stability Results", [
+            f"Average usage: {memory_stats['avg_mb']:.1f}MB",
+            f"Memory growth: {memory_growth_mb:.1f}MB",
+            f"Operations completed: {operation_count}",
+        ])
     
-    def test_performance_monitoring_accuracy(self, test_database):
+    def test_performance_monitoring_accuracy(self, test_database, request):
         """Test that performance monitoring captures accurate metrics."""
         # Reset monitoring
         performance_monitor.query_times.clear()
@@ -467,9 +479,19 @@ class TestSystemPerformance:
         assert avg_time > 0, "Performance monitor should capture query times"
         assert avg_time <= TARGET_QUERY_TIME_MS * 2, f"Monitored times seem unrealistic: {avg_time}ms"
         
-        print(f"Performance Monitoring Results:")
-        print(f"  Captured {len(performance_monitor.query_times)} query measurements")
-        print(f"  Average query time: {avg_time:.2f}ms")
+        _report(request, "Performance Monitoring Results", [
+            f"Captured {len(performance_monitor.query_times)} query measurements",
+            f"Average query time: {avg_time:.2f}ms",
+        ])
+
+    def test_system_metrics_snapshot_is_frozen(self, test_database):
+        """System metrics snapshots are immutable and carry no per-instance dict."""
+        metrics = performance_monitor.get_system_metrics(OptimizedConnectionManager(), test_database.db)
+
+        assert metrics.last_lock_cleanup != "error"
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metrics.total_tasks = 0
 
 
 @pytest.mark.asyncio
@@ -487,8 +509,23 @@ class TestWebSocketPerformance:
         # For now, just validate the test structure
         assert result.test_name == "websocket_broadcast_performance"
         assert "connections_established" in result.metrics
-        
-        print(f"WebSocket Performance Test Structure Validated")
+    
+    async def test_broadcast_many_sends_events_in_order(self):
+        """Test grouped broadcasts deliver each event as its own message, in order."""
+        manager = OptimizedConnectionManager()
+        healthy, broken = AsyncMock(), AsyncMock()
+        broken.send_text.side_effect = ConnectionError("closed")
+        for websocket in (healthy, broken):
+            await manager.connect(websocket)
+        
+        events = [{"type": "task.status_changed", "task_id": 1}, {"type": "task.unlocked", "task_id": 1}]
+        stats = await manager.broadcast_many(events)
+        
+        assert [json.loads(call.args[0])["type"] for call in healthy.send_text.call_args_list] == [
+            "task.status_changed", "task.unlocked"
+        ]
+        assert (stats["sent"], stats["failed"]) == (1, 1)
+        assert broken not in manager.active_connections
 
 
 # Performance benchmark runner
@@ -36,6 +36,12 @@ from task_manager.api import ConnectionManager
 from task_manager.tools_lib import CreateTaskTool
 
 
+@pytest.fixture(scope="module")
+def manager():
+    """One RAInstructionsManager shared by the read-only manager tests."""
+    return RAInstructionsManager()
+
+
 class TestRAInstructionsManager:
     """Test suite for RAInstructionsManager class functionality."""
     
@@ -52,9 +58,8 @@ class TestRAInstructionsManager:
         except ValueError:
             pytest.fail("Invalid timestamp format in last_updated")
 
-    def test_get_full_instructions(self):
+    def test_get_full_instructions(self, manager):
         """Test comprehensive RA methodology instructions generation."""
-        manager = RAInstructionsManager()
         instructions = manager.get_full_instructions()
         
         # Standard Mode: Verify all required instruction components
@@ -84,9 +89,20 @@ class TestRAInstructionsManager:
         assert manager.version in instructions
         assert manager.last_updated in instructions
 
-    def test_get_concise_instructions(self):
-        """Test concise RA methodology instructions for performance contexts."""
+    def test_full_instructions_rendered_once_per_version(self):
+        """Test full instructions are reused until the version stamp changes."""
         manager = RAInstructionsManager()
+        first = manager.get_full_instructions()
+        
+        assert manager.get_full_instructions() is first
+        
+        manager.last_updated = "2000-01-01T00:00:00Z"
+        refreshed = manager.get_full_instructions()
+        assert refreshed is not first
+        assert "Last Updated: 2000-01-01T00:00:00Z" in refreshed
+
+    def test_get_concise_instructions(self, manager):
+        """Test concise RA methodology instructions for performance contexts."""
         concise = manager.get_concise_instructions()
         
         # Should contain key elements but be shorter
@@ -97,9 +113,8 @@ class TestRAInstructionsManager:
         assert "RA TAGS" in concise
         assert manager.version in concise
 
-    def test_get_tag_taxonomy(self):
+    def test_get_tag_taxonomy(self, manager):
         """Test RA tag taxonomy structure and completeness."""
-        manager = RAInstructionsManager()
         taxonomy = manager.get_tag_taxonomy()
         
         # Verify expected categories
@@ -124,10 +139,13 @@ class TestRAInstructionsManager:
         assert "SUGGEST_ERROR_HANDLING" in suggest_tags
         assert "SUGGEST_VALIDATION" in suggest_tags
 
-    def test_validate_ra_compliance(self):
+        # Each call returns its own copy of the shared taxonomy
+        impl_tags["NEW_TAG"] = "description"
+        assert "NEW_TAG" not in RAInstructionsManager().get_tag_taxonomy()["implementation_tags"]
+        json.dumps(taxonomy)
+
+    def test_validate_ra_compliance(self, manager):
         """Test RA methodology compliance validation."""
-        manager = RAInstructionsManager()
-        
         # Test valid RA-light task
         valid_task = {
             "ra_mode": "ra-light",
@@ -162,10 +180,8 @@ class TestRAInstructionsManager:
         assert len(result["warnings"]) > 0
         assert any("should include assumption tags" in warning for warning in result["warnings"])
 
-    def test_get_mode_guidelines(self):
+    def test_get_mode_guidelines(self, manager):
         """Test mode guidelines generation for different complexity scores."""
-        manager = RAInstructionsManager()
-        
         # Test simple mode (score 1-3)
         simple_guidelines = manager.get_mode_guidelines(2)
         assert simple_guidelines["mode"] == "simple"
@@ -189,10 +205,14 @@ class TestRAInstructionsManager:
         assert ra_full_guidelines["mode"] == "ra-full"
         assert ra_full_guidelines["tagging_required"] is True
         assert "Multi-agent orchestration" in ra_full_guidelines["approach"]
+        
+        # Each call returns its own dict built from the shared per-mode table
+        ra_full_guidelines["approach"] = "changed"
+        assert manager.get_mode_guidelines(9)["approach"] != "changed"
+        assert manager.get_mode_guidelines(9)["complexity_score"] == 9
 
-    def test_capture_prompt_snapshot(self):
+    def test_capture_prompt_snapshot(self, manager):
         """Test prompt snapshot capture functionality."""
-        manager = RAInstructionsManager()
         snapshot = manager.capture_prompt_snapshot("test_context")
         
         # Parse JSON snapshot
@@ -209,9 +229,8 @@ class TestRAInstructionsManager:
         except ValueError:
             pytest.fail("Invalid timestamp in prompt snapshot")
 
-    def test_get_instructions_metadata(self):
+    def test_get_instructions_metadata(self, manager):
         """Test instructions metadata retrieval."""
-        manager = RAInstructionsManager()
         metadata = manager.get_instructions_metadata()
         
         assert metadata["version"] == manager.version
@@ -522,10 +541,8 @@ class TestRAInstructionsIntegrationScenarios:
         for tool in expected_tools:
             assert tool in instructions, f"Tool {tool} missing from instructions"
 
-    def test_ra_tag_format_validation(self):
+    def test_ra_tag_format_validation(self, manager):
         """Test RA tag format validation across different patterns."""
-        manager = RAInstructionsManager()
-        
         # Valid tags
         valid_tags = [
             "#COMPLETION_DRIVE_IMPL: OAuth library selection",
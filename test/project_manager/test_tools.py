@@ -16,15 +16,12 @@ Test Coverage:
 """
 
 import asyncio
-import json
 import pytest
-import tempfile
-import os
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta, timezone
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import orjson
 
 from task_manager.database import TaskDatabase
 from task_manager.api import ConnectionManager
@@ -35,32 +32,161 @@ from task_manager.tools_lib import (
     create_tool_instance, AVAILABLE_TOOLS
 )
 
+# Tool responses are decoded in nearly every assertion
+_loads = orjson.loads
+
+# Lock expiry far enough ahead to stay in the future for the whole run
+_FUTURE_ISO = (datetime.now(timezone.utc) + timedelta(days=365)).isoformat() + 'Z'
+
+
+class StubDatabase:
+    """Hand-written TaskDatabase stand-in exposing the methods the tools call.
+
+    Each method is a plain MagicMock, so tests keep configuring return_value
+    and side_effect without MagicMock(spec=TaskDatabase) inspecting the class.
+    """
+
+    METHODS = (
+        "acquire_task_lock_atomic", "add_task_log_entry", "append_knowledge_log",
+        "cleanup_expired_locks_with_ids", "create_task_with_ra_metadata", "delete_task",
+        "get_all_tasks", "get_available_tasks", "get_epic_with_project_info",
+        "get_knowledge", "get_knowledge_logs", "get_task_by_id",
+        "get_task_details_with_relations", "get_task_lock_status", "get_task_logs_paginated",
+        "list_epics_filtered", "list_projects_filtered", "list_tasks_filtered",
+        "release_lock", "resolve_task_dependencies", "update_task_atomic",
+        "update_task_ra_fields", "update_task_status", "upsert_epic_with_status",
+        "upsert_knowledge", "upsert_project_with_status",
+    )
+
+    def __init__(self):
+        for name in self.METHODS:
+            setattr(self, name, MagicMock(name=name))
+
+    def reset_mock(self, **kwargs):
+        for name in self.METHODS:
+            getattr(self, name).reset_mock(**kwargs)
+
+
+class FakeConnectionManager:
+    """Stand-in for ConnectionManager that records broadcast events in a list.
+
+    Set ``error`` to make the next broadcasts raise after recording the event.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.error = None
+
+    async def broadcast(self, event):
+        self.events.append(event)
+        if self.error is not None:
+            raise self.error
+
+    def reset(self):
+        self.events.clear()
+        self.error = None
+
+
+class ConcreteTestTool(BaseTool):
+    """Concrete implementation of BaseTool for testing."""
+    async def apply(self, **kwargs) -> str:
+        return "test_result"
+
+
+@pytest.fixture(scope="module")
+def mock_database():
+    """Stub TaskDatabase shared by the isolated tests in this module."""
+    return StubDatabase()
+
+
+@pytest.fixture(scope="module")
+def mock_websocket_manager():
+    """Fake ConnectionManager shared by the isolated tests in this module."""
+    return FakeConnectionManager()
+
+
+@pytest.fixture(scope="module")
+def concrete_tool(mock_database, mock_websocket_manager):
+    """ConcreteTestTool wired to the shared mocks."""
+    return ConcreteTestTool(mock_database, mock_websocket_manager)
+
+
+@pytest.fixture(scope="module")
+def tool(mock_database, mock_websocket_manager):
+    """GetAvailableTasks wired to the shared mocks."""
+    return GetAvailableTasks(mock_database, mock_websocket_manager)
+
+
+@pytest.fixture(scope="module")
+def tools(mock_database, mock_websocket_manager):
+    """Task lifecycle tools wired to the shared mocks."""
+    return {
+        "get_available_tasks": GetAvailableTasks(mock_database, mock_websocket_manager),
+        "acquire_task_lock": AcquireTaskLock(mock_database, mock_websocket_manager),
+        "update_task_status": UpdateTaskStatus(mock_database, mock_websocket_manager),
+        "release_task_lock": ReleaseTaskLock(mock_database, mock_websocket_manager)
+    }
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_database, mock_websocket_manager):
+    """Clear calls, return values and side effects left on the shared mocks.
+
+    Resetting after the test rather than before keeps classes that override
+    these fixtures with pre-configured mocks working.
+    """
+    yield
+    mock_database.reset_mock(return_value=True, side_effect=True)
+    if isinstance(mock_websocket_manager, FakeConnectionManager):
+        mock_websocket_manager.reset()
+
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """Single in-memory database shared by the integration tests in this module.
+
+    TaskDatabase runs its migrations once here; each test works inside a
+    SAVEPOINT (see ``_savepoint``) so its writes are rolled back afterwards.
+    Every pytest-xdist worker is its own process with its own in-memory
+    database, so workers never share or collide on a database file.
+    """
+    db = TaskDatabase(":memory:")
+    db.execute_prepared("PRAGMA temp_store=MEMORY")
+    db.execute_prepared("PRAGMA cache_size=-8000")
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="class")
+def _optimize_shared_db(shared_db):
+    """Refresh the shared database's query planner statistics after each class."""
+    yield
+    shared_db.execute_prepared("PRAGMA optimize")
+
+
+def _lock_task(db, task_id, agent_id, timeout=300):
+    """Lock a task as test setup straight through the database.
+
+    Tests exercising update/release only need the task locked beforehand;
+    skipping AcquireTaskLock avoids its response formatting and broadcast.
+    """
+    assert db.acquire_task_lock_atomic(int(task_id), agent_id, timeout)
+
+
+@contextmanager
+def _savepoint(db):
+    """Roll back everything written to ``db`` inside the block."""
+    db.execute_prepared("SAVEPOINT test_case")
+    try:
+        yield db
+    finally:
+        db.execute_prepared("ROLLBACK TO test_case")
+        db.execute_prepared("RELEASE test_case")
+
 
 class TestBaseTool:
     """Test BaseTool abstract class functionality."""
     
-    class ConcreteTestTool(BaseTool):
-        """Concrete implementation of BaseTool for testing."""
-        async def apply(self, **kwargs) -> str:
-            return "test_result"
-    
-    @pytest.fixture
-    def mock_database(self):
-        """Mock TaskDatabase for isolated testing."""
-        return MagicMock(spec=TaskDatabase)
-    
-    @pytest.fixture
-    def mock_websocket_manager(self):
-        """Mock ConnectionManager for isolated testing."""
-        manager = MagicMock(spec=ConnectionManager)
-        manager.broadcast = AsyncMock()
-        return manager
-    
-    @pytest.fixture
-    def concrete_tool(self, mock_database, mock_websocket_manager):
-        """Create concrete tool instance for testing."""
-        return self.ConcreteTestTool(mock_database, mock_websocket_manager)
-    
     def test_base_tool_initialization(self, concrete_tool, mock_database, mock_websocket_manager):
         """Test BaseTool initialization with dependencies."""
         assert concrete_tool.db == mock_database
@@ -69,7 +195,7 @@ class TestBaseTool:
     def test_format_success_response(self, concrete_tool):
         """Test success response formatting."""
         response = concrete_tool._format_success_response("Operation successful", task_id=123)
-        data = json.loads(response)
+        data = _loads(response)
         
         assert data["success"] is True
         assert data["message"] == "Operation successful"
@@ -78,7 +204,7 @@ class TestBaseTool:
     def test_format_error_response(self, concrete_tool):
         """Test error response formatting."""
         response = concrete_tool._format_error_response("Operation failed", error_code="INVALID_INPUT")
-        data = json.loads(response)
+        data = _loads(response)
         
         assert data["success"] is False
         assert data["message"] == "Operation failed"
@@ -89,46 +215,57 @@ class TestBaseTool:
         """Test successful event broadcasting."""
         await concrete_tool._broadcast_event("test.event", task_id=123, agent_id="test_agent")
         
-        mock_websocket_manager.broadcast.assert_called_once()
-        call_args = mock_websocket_manager.broadcast.call_args[0][0]
+        assert len(mock_websocket_manager.events) == 1
+        call_args = mock_websocket_manager.events[0]
         
         assert call_args["type"] == "test.event"
         assert call_args["task_id"] == 123
         assert call_args["agent_id"] == "test_agent"
         assert "timestamp" in call_args
     
+    @pytest.mark.asyncio
+    async def test_broadcast_events_preserves_order(self, concrete_tool, mock_websocket_manager):
+        """Test grouped events fall back to one broadcast each, in order, sharing a timestamp."""
+        await concrete_tool._broadcast_events(
+            {"type": "task.status_changed", "task_id": 1},
+            {"type": "task.unlocked", "task_id": 1},
+        )
+        
+        events = mock_websocket_manager.events
+        assert [event["type"] for event in events] == ["task.status_changed", "task.unlocked"]
+        assert events[0]["timestamp"] == events[1]["timestamp"]
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_events_continue_after_failure(self, concrete_tool, mock_websocket_manager):
+        """Test a failed event in a group does not drop the events after it."""
+        mock_websocket_manager.error = Exception("Broadcast failed")
+        
+        await concrete_tool._broadcast_events(
+            {"type": "task.status_changed", "task_id": 1},
+            {"type": "task.unlocked", "task_id": 1},
+        )
+        
+        assert [event["type"] for event in mock_websocket_manager.events] == ["task.status_changed", "task.unlocked"]
+    
     @pytest.mark.asyncio
     async def test_broadcast_event_failure_handling(self, concrete_tool, mock_websocket_manager):
         """Test that broadcast failures don't raise exceptions."""
-        mock_websocket_manager.broadcast.side_effect = Exception("Broadcast failed")
+        mock_websocket_manager.error = Exception("Broadcast failed")
         
         # Should not raise exception
         await concrete_tool._broadcast_event("test.event", task_id=123)
         
-        mock_websocket_manager.broadcast.assert_called_once()
+        assert len(mock_websocket_manager.events) == 1
 
 
 class TestDatabaseIntegration:
     """Integration tests using real database operations."""
     
     @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for integration testing."""
-        fd, path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        
-        db = TaskDatabase(path)
-        yield db
-        
-        db.close()
-        os.unlink(path)
-    
-    @pytest.fixture
-    def mock_websocket_manager(self):
-        """Mock ConnectionManager for integration testing."""
-        manager = MagicMock(spec=ConnectionManager)
-        manager.broadcast = AsyncMock()
-        return manager
+    def temp_db(self, shared_db, _optimize_shared_db):
+        """Shared database with this test's writes rolled back afterwards."""
+        with _savepoint(shared_db) as db:
+            yield db
     
     @pytest.fixture
     def sample_data(self, temp_db):
@@ -139,10 +276,12 @@ class TestDatabaseIntegration:
         # Create epic
         epic_id = temp_db.create_epic(project_id, "Test Epic", "Test epic description")
         
-        # Create tasks with different statuses
-        task1_id = temp_db.create_task(epic_id, "Task 1", "Test task 1")
-        task2_id = temp_db.create_task(epic_id, "Task 2", "Test task 2")
-        task3_id = temp_db.create_task(epic_id, "Task 3", "Test task 3")
+        # Create tasks in one bulk insert, then give them different statuses
+        task1_id, task2_id, task3_id = temp_db.create_tasks_bulk(epic_id, [
+            ("Task 1", "Test task 1"),
+            ("Task 2", "Test task 2"),
+            ("Task 3", "Test task 3"),
+        ])
         
         # Set different statuses
         temp_db.update_task_status(task2_id, "in_progress", "test_agent")
@@ -151,7 +290,9 @@ class TestDatabaseIntegration:
         return {
             "project_id": project_id,
             "epic_id": epic_id,
-            "task_ids": [task1_id, task2_id, task3_id]
+            "task_ids": [task1_id, task2_id, task3_id],
+            # Tools take task_id as a string; convert once for every test
+            "task_id_strs": [str(task1_id), str(task2_id), str(task3_id)]
         }
     
     @pytest.mark.asyncio
@@ -161,7 +302,7 @@ class TestDatabaseIntegration:
         
         # Test getting pending tasks
         result = await tool.apply(status="TODO")
-        tasks = json.loads(result)
+        tasks = _loads(result)
         
         assert isinstance(tasks, list)
         assert len(tasks) >= 1  # At least one pending task
@@ -178,11 +319,11 @@ class TestDatabaseIntegration:
     async def test_acquire_lock_integration(self, temp_db, mock_websocket_manager, sample_data):
         """Integration test for AcquireTaskLock with real database."""
         tool = AcquireTaskLock(temp_db, mock_websocket_manager)
-        task_id = str(sample_data["task_ids"][0])
+        task_id = sample_data["task_id_strs"][0]
         
         # Test successful lock acquisition
         result = await tool.apply(task_id=task_id, agent_id="test_agent", timeout=300)
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is True
         assert response["task_id"] == int(task_id)
@@ -190,20 +331,20 @@ class TestDatabaseIntegration:
         assert response["timeout"] == 300
         
         # Verify WebSocket broadcast was called
-        mock_websocket_manager.broadcast.assert_called()
+        assert mock_websocket_manager.events
     
     @pytest.mark.asyncio
     async def test_acquire_lock_already_locked(self, temp_db, mock_websocket_manager, sample_data):
         """Test lock acquisition failure when task is already locked."""
         tool = AcquireTaskLock(temp_db, mock_websocket_manager)
-        task_id = str(sample_data["task_ids"][0])
+        task_id = sample_data["task_id_strs"][0]
         
         # First agent acquires lock
         await tool.apply(task_id=task_id, agent_id="agent1", timeout=300)
         
         # Second agent attempts to acquire same lock
         result = await tool.apply(task_id=task_id, agent_id="agent2", timeout=300)
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is False
         assert "already locked" in response["message"]
@@ -212,16 +353,15 @@ class TestDatabaseIntegration:
     @pytest.mark.asyncio
     async def test_update_status_integration(self, temp_db, mock_websocket_manager, sample_data):
         """Integration test for UpdateTaskStatus with lock validation."""
-        acquire_tool = AcquireTaskLock(temp_db, mock_websocket_manager)
         update_tool = UpdateTaskStatus(temp_db, mock_websocket_manager)
-        task_id = str(sample_data["task_ids"][0])
+        task_id = sample_data["task_id_strs"][0]
         
         # First acquire lock
-        await acquire_tool.apply(task_id=task_id, agent_id="test_agent", timeout=300)
+        _lock_task(temp_db, task_id, "test_agent")
         
         # Then update status
         result = await update_tool.apply(task_id=task_id, status="DONE", agent_id="test_agent")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is True
         assert response["status"] == "completed"
@@ -231,10 +371,10 @@ class TestDatabaseIntegration:
     async def test_update_status_without_lock(self, temp_db, mock_websocket_manager, sample_data):
         """Test status update auto-acquires lock when unlocked."""
         tool = UpdateTaskStatus(temp_db, mock_websocket_manager)
-        task_id = str(sample_data["task_ids"][0])
+        task_id = sample_data["task_id_strs"][0]
         
         result = await tool.apply(task_id=task_id, status="DONE", agent_id="test_agent")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is True
         # DB vocabulary in tool response
@@ -245,16 +385,15 @@ class TestDatabaseIntegration:
     @pytest.mark.asyncio
     async def test_release_lock_integration(self, temp_db, mock_websocket_manager, sample_data):
         """Integration test for ReleaseTaskLock."""
-        acquire_tool = AcquireTaskLock(temp_db, mock_websocket_manager)
         release_tool = ReleaseTaskLock(temp_db, mock_websocket_manager)
-        task_id = str(sample_data["task_ids"][0])
+        task_id = sample_data["task_id_strs"][0]
         
         # First acquire lock
-        await acquire_tool.apply(task_id=task_id, agent_id="test_agent", timeout=300)
+        _lock_task(temp_db, task_id, "test_agent")
         
         # Then release lock
         result = await release_tool.apply(task_id=task_id, agent_id="test_agent")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is True
         assert response["task_id"] == int(task_id)
@@ -263,16 +402,15 @@ class TestDatabaseIntegration:
     @pytest.mark.asyncio
     async def test_release_lock_unauthorized(self, temp_db, mock_websocket_manager, sample_data):
         """Test lock release failure by unauthorized agent."""
-        acquire_tool = AcquireTaskLock(temp_db, mock_websocket_manager)
         release_tool = ReleaseTaskLock(temp_db, mock_websocket_manager)
-        task_id = str(sample_data["task_ids"][0])
+        task_id = sample_data["task_id_strs"][0]
         
         # Agent 1 acquires lock
-        await acquire_tool.apply(task_id=task_id, agent_id="agent1", timeout=300)
+        _lock_task(temp_db, task_id, "agent1")
         
         # Agent 2 attempts to release lock
         result = await release_tool.apply(task_id=task_id, agent_id="agent2")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is False
         assert "Lock is held by agent" in response["message"]
@@ -282,19 +420,11 @@ class TestDatabaseIntegration:
 class TestGetAvailableTasksEdgeCases:
     """Test edge cases for GetAvailableTasks tool."""
     
-    @pytest.fixture
-    def tool(self):
-        """Create GetAvailableTasks with mocked dependencies."""
-        mock_db = MagicMock(spec=TaskDatabase)
-        mock_ws = MagicMock(spec=ConnectionManager)
-        mock_ws.broadcast = AsyncMock()
-        return GetAvailableTasks(mock_db, mock_ws)
-    
     @pytest.mark.asyncio
     async def test_invalid_status(self, tool):
         """Test handling of invalid status parameter."""
         result = await tool.apply(status="INVALID_STATUS")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is False
         assert "Invalid status" in response["message"]
@@ -305,7 +435,7 @@ class TestGetAvailableTasksEdgeCases:
         tool.db.get_available_tasks.side_effect = Exception("Database connection failed")
         
         result = await tool.apply(status="TODO")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is False
         assert "Failed to retrieve available tasks" in response["message"]
@@ -316,7 +446,7 @@ class TestGetAvailableTasksEdgeCases:
         tool.db.get_available_tasks.return_value = []
         
         result = await tool.apply(status="TODO")
-        tasks = json.loads(result)
+        tasks = _loads(result)
         
         assert isinstance(tasks, list)
         assert len(tasks) == 0
@@ -324,9 +454,6 @@ class TestGetAvailableTasksEdgeCases:
     @pytest.mark.asyncio
     async def test_locked_task_filtering(self, tool):
         """Test filtering of locked tasks."""
-        current_time = datetime.now(timezone.utc)
-        future_time = (current_time + timedelta(minutes=5)).isoformat() + 'Z'
-        
         mock_tasks = [
             {
                 "id": 1,
@@ -340,14 +467,14 @@ class TestGetAvailableTasksEdgeCases:
                 "name": "Locked Task",
                 "status": "pending",
                 "lock_holder": "other_agent",
-                "lock_expires_at": future_time
+                "lock_expires_at": _FUTURE_ISO
             }
         ]
         
         tool.db.get_available_tasks.return_value = mock_tasks
         
         result = await tool.apply(status="TODO", include_locked=False)
-        tasks = json.loads(result)
+        tasks = _loads(result)
         
         # Should only return available task
         assert len(tasks) == 1
@@ -358,27 +485,13 @@ class TestGetAvailableTasksEdgeCases:
 class TestToolInputValidation:
     """Test input validation across all tools."""
     
-    @pytest.fixture
-    def tools(self):
-        """Create all tools with mocked dependencies."""
-        mock_db = MagicMock(spec=TaskDatabase)
-        mock_ws = MagicMock(spec=ConnectionManager)
-        mock_ws.broadcast = AsyncMock()
-        
-        return {
-            "get_available_tasks": GetAvailableTasks(mock_db, mock_ws),
-            "acquire_task_lock": AcquireTaskLock(mock_db, mock_ws),
-            "update_task_status": UpdateTaskStatus(mock_db, mock_ws),
-            "release_task_lock": ReleaseTaskLock(mock_db, mock_ws)
-        }
-    
     @pytest.mark.asyncio
     async def test_invalid_task_id_format(self, tools):
         """Test handling of invalid task_id format."""
         acquire_tool = tools["acquire_task_lock"]
         
         result = await acquire_tool.apply(task_id="invalid_id", agent_id="test_agent")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is False
         assert "Invalid task_id" in response["message"]
@@ -389,7 +502,7 @@ class TestToolInputValidation:
         acquire_tool = tools["acquire_task_lock"]
         
         result = await acquire_tool.apply(task_id="123", agent_id="")
-        response = json.loads(result)
+        response = _loads(result)
         
         assert response["success"] is False
         assert "agent_id cannot be empty" in response["message"]
@@ -401,13 +514,13 @@ class TestToolInputValidation:
         
         # Test negative timeout
         result = await acquire_tool.apply(task_id="123", agent_id="test_agent", timeout=-1)
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "timeout must be between" in response["message"]
         
         # Test excessive timeout
         result = await acquire_tool.apply(task_id="123", agent_id="test_agent", timeout=5000)
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "timeout must be between" in response["message"]
 
@@ -416,40 +529,37 @@ class TestConcurrencyAndRaceConditions:
     """Test concurrent operations and race condition handling."""
     
     @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for concurrency testing."""
-        fd, path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        
-        db = TaskDatabase(path)
-        # Create test hierarchy: project -> epic -> task
-        project_id = db.create_project("Test Project", "Project for concurrency testing")
-        epic_id = db.create_epic(project_id, "Test Epic", "Epic for concurrency testing")
-        task_id = db.create_task(epic_id, "Concurrent Test Task", "Test task for concurrency")
-        
-        yield db, task_id
-        
-        db.close()
-        os.unlink(path)
+    def temp_db(self, shared_db, _optimize_shared_db):
+        """Shared database with a seeded task for concurrency testing."""
+        with _savepoint(shared_db) as db:
+            # Create test hierarchy: project -> epic -> task
+            project_id = db.create_project("Test Project", "Project for concurrency testing")
+            epic_id = db.create_epic(project_id, "Test Epic", "Epic for concurrency testing")
+            task_id = db.create_task(epic_id, "Concurrent Test Task", "Test task for concurrency")
+
+            yield db, task_id
     
     @pytest.mark.asyncio
     async def test_concurrent_lock_acquisition(self, temp_db):
         """Test that only one agent can acquire lock in concurrent scenario."""
         db, task_id = temp_db
-        mock_ws = MagicMock(spec=ConnectionManager)
-        mock_ws.broadcast = AsyncMock()
+        mock_ws = FakeConnectionManager()
         
         tool1 = AcquireTaskLock(db, mock_ws)
         tool2 = AcquireTaskLock(db, mock_ws)
         
-        # Simulate concurrent lock acquisition attempts
-        results = await asyncio.gather(
-            tool1.apply(task_id=str(task_id), agent_id="agent1", timeout=300),
-            tool2.apply(task_id=str(task_id), agent_id="agent2", timeout=300),
-            return_exceptions=True
-        )
+        # Hold both attempts at a start line so they reach the database together
+        start = asyncio.Event()
         
-        responses = [json.loads(result) for result in results]
+        async def contend(tool, agent_id):
+            await start.wait()
+            return await tool.apply(task_id=str(task_id), agent_id=agent_id, timeout=300)
+        
+        attempts = asyncio.gather(contend(tool1, "agent1"), contend(tool2, "agent2"))
+        asyncio.get_running_loop().call_soon(start.set)
+        results = await asyncio.wait_for(attempts, timeout=5)
+        
+        responses = [_loads(result) for result in results]
         
         # Exactly one should succeed
         successful = [r for r in responses if r["success"]]
@@ -487,59 +597,51 @@ class TestToolRegistry:
         
         assert set(AVAILABLE_TOOLS.keys()) == expected_tools
     
-    def test_create_tool_instance(self):
+    def test_create_tool_instance(self, shared_db, mock_websocket_manager):
         """Test tool factory function."""
-        mock_db = MagicMock(spec=TaskDatabase)
-        mock_ws = MagicMock(spec=ConnectionManager)
-        
-        tool = create_tool_instance("get_available_tasks", mock_db, mock_ws)
+        tool = create_tool_instance("get_available_tasks", shared_db, mock_websocket_manager)
         
         assert isinstance(tool, GetAvailableTasks)
-        assert tool.db == mock_db
-        assert tool.websocket_manager == mock_ws
+        assert tool.db is shared_db
+        assert tool.websocket_manager is mock_websocket_manager
+    
+    def test_stub_database_matches_task_database(self):
+        """Test StubDatabase only stubs methods TaskDatabase really has."""
+        missing = [name for name in StubDatabase.METHODS if not hasattr(TaskDatabase, name)]
+        assert missing == []
     
-    def test_create_unknown_tool_instance(self):
+    def test_create_unknown_tool_instance(self, shared_db, mock_websocket_manager):
         """Test factory function with unknown tool name."""
-        mock_db = MagicMock(spec=TaskDatabase)
-        mock_ws = MagicMock(spec=ConnectionManager)
-        
         with pytest.raises(KeyError, match="Unknown tool"):
-            create_tool_instance("unknown_tool", mock_db, mock_ws)
+            create_tool_instance("unknown_tool", shared_db, mock_websocket_manager)
 
 
 class TestWebSocketIntegration:
     """Test WebSocket broadcasting integration."""
     
     @pytest.fixture
-    def temp_db(self):
-        """Create temporary database."""
-        fd, path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        
-        db = TaskDatabase(path)
-        # Create test hierarchy: project -> epic -> task
-        project_id = db.create_project("Test Project", "Project for WebSocket testing")
-        epic_id = db.create_epic(project_id, "Test Epic", "Epic for WebSocket testing")
-        task_id = db.create_task(epic_id, "WebSocket Test Task", "Test task for WebSocket")
-        
-        yield db, task_id
-        
-        db.close()
-        os.unlink(path)
+    def temp_db(self, shared_db, _optimize_shared_db):
+        """Shared database with a seeded task."""
+        with _savepoint(shared_db) as db:
+            # Create test hierarchy: project -> epic -> task
+            project_id = db.create_project("Test Project", "Project for WebSocket testing")
+            epic_id = db.create_epic(project_id, "Test Epic", "Epic for WebSocket testing")
+            task_id = db.create_task(epic_id, "WebSocket Test Task", "Test task for WebSocket")
+
+            yield db, task_id
     
     @pytest.mark.asyncio
     async def test_lock_acquisition_broadcasts_event(self, temp_db):
         """Test that lock acquisition broadcasts correct WebSocket event."""
         db, task_id = temp_db
-        mock_ws = MagicMock(spec=ConnectionManager)
-        mock_ws.broadcast = AsyncMock()
+        mock_ws = FakeConnectionManager()
         
         tool = AcquireTaskLock(db, mock_ws)
         await tool.apply(task_id=str(task_id), agent_id="test_agent", timeout=300)
         
         # Verify broadcast was called with correct event
-        mock_ws.broadcast.assert_called()
-        call_args = mock_ws.broadcast.call_args[0][0]
+        assert mock_ws.events
+        call_args = mock_ws.events[-1]
         
         assert call_args["type"] == "task.locked"
         assert call_args["task_id"] == task_id
@@ -549,27 +651,20 @@ class TestWebSocketIntegration:
     async def test_status_update_broadcasts_event(self, temp_db):
         """Test that status updates broadcast correct WebSocket events."""
         db, task_id = temp_db
-        mock_ws = MagicMock(spec=ConnectionManager)
-        mock_ws.broadcast = AsyncMock()
-        
-        # First acquire lock
-        acquire_tool = AcquireTaskLock(db, mock_ws)
-        await acquire_tool.apply(task_id=str(task_id), agent_id="test_agent", timeout=300)
+        mock_ws = FakeConnectionManager()
         
-        # Reset mock to test status update broadcast
-        mock_ws.reset_mock()
-        mock_ws.broadcast = AsyncMock()
+        # First acquire lock; setup goes through the database so no events are recorded
+        _lock_task(db, task_id, "test_agent")
         
         # Update status
         update_tool = UpdateTaskStatus(db, mock_ws)
         await update_tool.apply(task_id=str(task_id), status="DONE", agent_id="test_agent")
         
         # Should broadcast both status change and lock release events
-        assert mock_ws.broadcast.call_count >= 1
+        assert mock_ws.events
         
         # Check that status change event was broadcast
-        call_args_list = [call[0][0] for call in mock_ws.broadcast.call_args_list]
-        status_events = [event for event in call_args_list if event["type"] == "task.status_changed"]
+        status_events = [event for event in mock_ws.events if event["type"] == "task.status_changed"]
         
         assert len(status_events) >= 1
         assert status_events[0]["task_id"] == task_id
@@ -583,7 +678,7 @@ class TestCreateTaskTool:
     @pytest.fixture
     def mock_database(self):
         """Mock database with all necessary methods for CreateTaskTool."""
-        db = MagicMock(spec=TaskDatabase)
+        db = StubDatabase()
         
         # Mock upsert methods - return (id, was_created) tuple
         db.upsert_project_with_status.return_value = (1, True)
@@ -624,7 +719,7 @@ class TestCreateTaskTool:
         )
         
         # Parse JSON response
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is True
         assert "Test Task" in response["message"]
         assert response["task_id"] == 123
@@ -667,7 +762,7 @@ class TestCreateTaskTool:
             ra_mode="ra-full"
         )
         
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is True
         assert response["task_id"] == 123
         
@@ -693,7 +788,7 @@ class TestCreateTaskTool:
             ra_tags=ra_tags
         )
         
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is True
         
         # Verify auto-assessed complexity is high (should be close to max due to all factors)
@@ -709,31 +804,31 @@ class TestCreateTaskTool:
         """Test parameter validation error cases."""
         # Test empty name
         result = await create_task_tool.apply(name="")
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "Task name is required" in response["message"]
         
         # Test missing epic identification
         result = await create_task_tool.apply(name="Test")
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "Either epic_id or epic_name must be provided" in response["message"]
         
         # Test conflicting epic parameters
         result = await create_task_tool.apply(name="Test", epic_id=1, epic_name="Epic")
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "Provide either epic_id or epic_name, not both" in response["message"]
         
         # Test invalid RA score
         result = await create_task_tool.apply(name="Test", epic_id=1, ra_score=11)
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "ra_score must be between 1 and 10" in response["message"]
         
         # Test invalid RA mode
         result = await create_task_tool.apply(name="Test", epic_id=1, ra_mode="invalid")
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "ra_mode must be one of" in response["message"]
     
@@ -748,7 +843,7 @@ class TestCreateTaskTool:
             epic_id=999  # Non-existent epic
         )
         
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is False
         assert "Database constraint violation" in response["message"]
         assert "error_details" in response
@@ -762,7 +857,7 @@ class TestCreateTaskTool:
             client_session_id="client123"
         )
         
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is True
         
         # Verify WebSocket broadcast includes session data
@@ -782,7 +877,7 @@ class TestCreateTaskTool:
             ra_mode="ra-light"
         )
         
-        response = json.loads(result)
+        response = _loads(result)
         assert response["success"] is True
         
         # Verify task creation was called with auto-captured prompt
@@ -794,18 +889,6 @@ class TestCreateTaskTool:
 class TestListProjectsTool:
     """Test ListProjectsTool functionality."""
     
-    @pytest.fixture
-    def mock_database(self):
-        """Mock TaskDatabase for testing."""
-        return MagicMock(spec=TaskDatabase)
-    
-    @pytest.fixture
-    def mock_websocket_manager(self):
-        """Mock ConnectionManager for testing."""
-        manager = MagicMock(spec=ConnectionManager)
-        manager.broadcast = AsyncMock()
-        return manager
-    
     @pytest.fixture
     def list_projects_tool(self, mock_database, mock_websocket_manager):
         """Create ListProjectsTool instance for testing."""
@@ -822,7 +905,7 @@ class TestListProjectsTool:
         
         result = await list_projects_tool.apply()
         
-        projects = json.loads(result)
+        projects = _loads(result)
         assert len(projects) == 2
         assert projects[0]["name"] == "Project A"
         assert projects[1]["name"] == "Project B"
@@ -837,7 +920,7 @@ class TestListProjectsTool:
         
         result = await list_projects_tool.apply(limit=1)
         
-        projects = json.loads(result)
+        projects = _loads(result)
         assert len(projects) == 1
         mock_database.list_projects_filtered.assert_called_once_with(status=None, limit=1)
     
@@ -846,7 +929,7 @@ class TestListProjectsTool:
         """Test error handling for invalid limit."""
         result = await list_projects_tool.apply(limit=0)
         
-        response = json.loads(result)
+        response = _loads(result)
         assert "success" in response
         assert response["success"] == False
         assert "Limit must be a positive integer" in response["message"]
@@ -858,7 +941,7 @@ class TestListProjectsTool:
         
         result = await list_projects_tool.apply()
         
-        response = json.loads(result)
+        response = _loads(result)
         assert "success" in response
         assert response["success"] == False
         assert "Failed to list projects" in response["message"]
@@ -867,18 +950,6 @@ class TestListProjectsTool:
 class TestListEpicsTool:
     """Test ListEpicsTool functionality."""
     
-    @pytest.fixture
-    def mock_database(self):
-        """Mock TaskDatabase for testing."""
-        return MagicMock(spec=TaskDatabase)
-    
-    @pytest.fixture
-    def mock_websocket_manager(self):
-        """Mock ConnectionManager for testing."""
-        manager = MagicMock(spec=ConnectionManager)
-        manager.broadcast = AsyncMock()
-        return manager
-    
     @pytest.fixture
     def list_epics_tool(self, mock_database, mock_websocket_manager):
         """Create ListEpicsTool instance for testing."""
@@ -895,7 +966,7 @@ class TestListEpicsTool:
         
         result = await list_epics_tool.apply()
         
-        epics = json.loads(result)
+        epics = _loads(result)
         assert len(epics) == 2
         assert epics[0]["name"] == "Epic A"
         assert epics[1]["name"] == "Epic B"
@@ -911,7 +982,7 @@ class TestListEpicsTool:
         
         result = await list_epics_tool.apply(project_id=2)
         
-        epics = json.loads(result)
+        epics = _loads(result)
         assert len(epics) == 1
         assert epics[0]["project_id"] == 2
         mock_database.list_epics_filtered.assert_called_once_with(project_id=2, limit=None)
@@ -921,7 +992,7 @@ class TestListEpicsTool:
         """Test error handling for invalid project_id."""
         result = await list_epics_tool.apply(project_id=0)
         
-        response = json.loads(result)
+        response = _loads(result)
         assert "success" in response
         assert response["success"] == False
         assert "Project ID must be a positive integer" in response["message"]
@@ -935,7 +1006,7 @@ class TestListEpicsTool:
         
         result = await list_epics_tool.apply(limit=1)
         
-        epics = json.loads(result)
+        epics = _loads(result)
         assert len(epics) == 1
         mock_database.list_epics_filtered.assert_called_once_with(project_id=None, limit=1)
 
@@ -943,18 +1014,6 @@ class TestListEpicsTool:
 class TestListTasksTool:
     """Test ListTasksTool functionality."""
     
-    @pytest.fixture
-    def mock_database(self):
-        """Mock TaskDatabase for testing."""
-        return MagicMock(spec=TaskDatabase)
-    
-    @pytest.fixture
-    def mock_websocket_manager(self):
-        """Mock ConnectionManager for testing."""
-        manager = MagicMock(spec=ConnectionManager)
-        manager.broadcast = AsyncMock()
-        return manager
-    
     @pytest.fixture
     def list_tasks_tool(self, mock_database, mock_websocket_manager):
         """Create ListTasksTool instance for testing."""
@@ -971,7 +1030,7 @@ class TestListTasksTool:
         
         result = await list_tasks_tool.apply()
         
-        tasks = json.loads(result)
+        tasks = _loads(result)
         assert len(tasks) == 2
         assert tasks[0]["name"] == "Task A"
         assert tasks[1]["name"] == "Task B"
@@ -987,7 +1046,7 @@ class TestListTasksTool:
         
         result = await list_tasks_tool.apply(project_id=1, epic_id=2, status="pending", limit=10)
         
-        tasks = json.loads(result)
+        tasks = _loads(result)
         assert len(tasks) == 1
         mock_database.list_tasks_filtered.assert_called_once_with(project_id=1, epic_id=2, status="pending", limit=10)
     
@@ -1014,7 +1073,7 @@ class TestListTasksTool:
         """Test error handling for invalid status."""
         result = await list_tasks_tool.apply(status="INVALID_STATUS")
         
-        response = json.loads(result)
+        response = _loads(result)
         assert "success" in response
         assert response["success"] == False
         assert "Invalid status 'INVALID_STATUS'" in response["message"]
@@ -1024,21 +1083,21 @@ class TestListTasksTool:
         """Test error handling for invalid parameters."""
         # Test invalid project_id
         result = await list_tasks_tool.apply(project_id=0)
-        response = json.loads(result)
+        response = _loads(result)
         assert "success" in response
         assert response["success"] == False
         assert "Project ID must be a positive integer" in response["message"]
         
         # Test invalid epic_id
         result = await list_tasks_tool.apply(epic_id=-1)
-        response = json.loads(result)
+        response = _loads(result)
         assert "success" in response
         assert response["success"] == False
         assert "Epic ID must be a positive integer" in response["message"]
         
         # Test invalid limit
         result = await list_tasks_tool.apply(limit=0)
-        response = json.loads(result)
+        response = _loads(result)
         assert "success" in response
         assert response["success"] == False
         assert "Limit must be a positive integer" in response["message"]
@@ -1047,18 +1106,6 @@ class TestListTasksTool:
 class TestListToolsIntegration:
     """Integration tests for list tools with AVAILABLE_TOOLS registry."""
     
-    @pytest.fixture
-    def mock_database(self):
-        """Mock TaskDatabase for testing."""
-        return MagicMock(spec=TaskDatabase)
-    
-    @pytest.fixture
-    def mock_websocket_manager(self):
-        """Mock ConnectionManager for testing."""
-        manager = MagicMock(spec=ConnectionManager)
-        manager.broadcast = AsyncMock()
-        return manager
-    
     def test_list_tools_registered(self):
         """Test that new list tools are properly registered."""
         assert "list_projects" in AVAILABLE_TOOLS
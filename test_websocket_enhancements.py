@@ -5,8 +5,8 @@ Tests the enriched payload generation functions and WebSocket broadcasting
 enhancements for task.created, task.updated, and task.logs.appended events.
 """
 
+import orjson
 import pytest
-import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -19,7 +19,8 @@ from src.task_manager.api import (
     extract_session_id, 
     generate_enriched_task_payload,
     generate_logs_appended_payload,
-    ConnectionManager
+    ConnectionManager,
+    _payload_bytes
 )
 
 
@@ -118,7 +119,8 @@ class TestEnrichedTaskPayload:
             project_data=project_data,
             epic_data=epic_data,
             auto_flags=auto_flags,
-            session_id=session_id
+            session_id=session_id,
+            auto_switch=True
         )
         
         # Verify task data
@@ -158,9 +160,9 @@ class TestEnrichedTaskPayload:
             session_id=session_id
         )
         
-        # Verify session context is added
+        # Verify session context is added without an auto-switch recommendation
         assert payload['initiator'] == 'session_test123'
-        assert payload['auto_switch_recommended'] is True
+        assert 'auto_switch_recommended' not in payload
         
         # Verify optional context is not present
         assert 'project' not in payload
@@ -249,14 +251,20 @@ class TestConnectionManagerEnhancements:
     
     @pytest.fixture
     def connection_manager(self):
-        """Create ConnectionManager instance for testing."""
+        """
+        Create ConnectionManager instance for testing.
+        
+        broadcast_enriched_event hands broadcast() the payload already serialized
+        to JSON bytes, so tests decode the call argument before asserting on it.
+        """
         return ConnectionManager()
     
     @pytest.mark.asyncio
     async def test_broadcast_enriched_event(self, connection_manager):
         """Test broadcasting enriched events with proper payload structure."""
-        # Mock the broadcast method
+        # Mock the broadcast method; enriched events are skipped with no listeners
         connection_manager.broadcast = AsyncMock()
+        connection_manager.active_connections.add(MagicMock())
         
         event_type = 'task.created'
         event_data = {
@@ -275,7 +283,7 @@ class TestConnectionManagerEnhancements:
         
         # Verify broadcast was called with enriched structure
         connection_manager.broadcast.assert_called_once()
-        call_args = connection_manager.broadcast.call_args[0][0]
+        call_args = orjson.loads(connection_manager.broadcast.call_args[0][0])
         
         # Verify enriched payload structure
         assert call_args['type'] == 'task.created'
@@ -312,7 +320,7 @@ class TestIntegrationScenarios:
         
         # Generate payload
         payload = generate_enriched_task_payload(
-            task_data, project_data, epic_data, auto_flags, session_id
+            task_data, project_data, epic_data, auto_flags, session_id, auto_switch=True
         )
         
         # Verify payload matches task specification structure
@@ -405,8 +413,7 @@ class TestPerformanceAndErrorHandling:
         assert payload['task']['description'] == large_description
         
         # Check payload size is reasonable (under 10KB as per acceptance criteria)
-        payload_json = json.dumps(payload)
-        payload_size_kb = len(payload_json.encode('utf-8')) / 1024
+        payload_size_kb = len(_payload_bytes(payload)) / 1024
         
         # #SUGGEST_PERFORMANCE: Task specification requires payloads under 10KB
         assert payload_size_kb < 10, f"Payload size {payload_size_kb:.2f}KB exceeds 10KB limit"
@@ -449,6 +456,13 @@ class TestPerformanceAndErrorHandling:
                 assert result == ''
             else:
                 assert result == expected_result
+            
+            # Validation rejects empty IDs and keeps well-formed ones
+            assert extract_session_id(mcp_args, validate=True) == expected_result
+        
+        # Validation rejects characters outside letters, digits, '-' and '_'
+        assert extract_session_id({'client_session_id': 'bad session!'}, validate=True) is None
+        assert extract_session_id({'client_session_id': 'bad session!'}) == 'bad session!'
 
 
 if __name__ == '__main__':